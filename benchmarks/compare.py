@@ -0,0 +1,99 @@
+# This compares two benchmark result files from run.py and flags regressions
+#
+#   python benchmarks/compare.py BASE.json NEW.json [--threshold 10] [--systems]
+#
+# Exits with status 1 when any metric got worse by more than the threshold,
+# so it can gate a CI job.
+
+import argparse
+import json
+import sys
+
+# (label, path into a scenario result, noise floor); a change smaller than the floor never counts
+METRICS = [
+    ("update p50 ms", ('update_ms', 'p50'), 0.05),
+    ("update p95 ms", ('update_ms', 'p95'), 0.10),
+    ("draw p50 ms", ('draw_ms', 'p50'), 0.05),
+    ("draw p95 ms", ('draw_ms', 'p95'), 0.10),
+    ("alloc peak KiB", ('alloc', 'peak_kb'), 16),
+    ("alloc retained KiB", ('alloc', 'retained_kb'), 16),
+    ("peak RSS KiB", ('peak_rss_kb',), 4096),
+]
+SYSTEM_FLOOR = 0.02 # ms; per-system p50s below this are timer noise
+
+
+def lookup(result, path):
+    for key in path:
+        if not isinstance(result, dict) or result.get(key) is None:
+            return None
+        result = result[key]
+    return result
+
+
+def compare_rows(base, new, threshold, with_systems):
+    """(label, base, new, change %, regressed) for every metric both results have"""
+    rows = []
+    metrics = list(METRICS)
+    if with_systems:
+        systems = sorted(set(base.get('systems', {})) & set(new.get('systems', {})))
+        metrics += [(f"  {name} p50 ms", ('systems', name, 'p50'), SYSTEM_FLOOR) for name in systems]
+
+    for label, path, floor in metrics:
+        old_value = lookup(base, path)
+        new_value = lookup(new, path)
+        if old_value is None or new_value is None:
+            continue
+        change = (new_value - old_value) / old_value * 100 if old_value else 0.0
+        regressed = change > threshold and new_value - old_value > floor
+        rows.append((label, old_value, new_value, change, regressed))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent slower that counts as a regression")
+    parser.add_argument("--systems", action="store_true", help="also compare per-system profiler times")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    print(f"base {base['environment'].get('commit')}  vs  new {new['environment'].get('commit')}")
+    if base['settings'] != new['settings']:
+        print(f"warning: different settings {base['settings']} vs {new['settings']}")
+    for key in ('python', 'platform', 'pygame', 'numpy'):
+        if base['environment'].get(key) != new['environment'].get(key):
+            print(f"warning: {key} differs ({base['environment'].get(key)} vs {new['environment'].get(key)})")
+
+    regressions = []
+    for name, new_result in new['scenarios'].items():
+        base_result = base['scenarios'].get(name)
+        if base_result is None:
+            print(f"\n{name}: new scenario, nothing to compare")
+            continue
+
+        print(f"\n{name}")
+        if base_result.get('state_hash') != new_result.get('state_hash'):
+            print("  note: final state differs, the simulation itself changed (not only its speed)")
+        for label, old_value, new_value, change, regressed in compare_rows(
+                base_result, new_result, args.threshold, args.systems):
+            mark = "  REGRESSION" if regressed else ""
+            print(f"  {label:<32}{old_value:12.3f}{new_value:12.3f}{change:+9.1f}%{mark}")
+            if regressed:
+                regressions.append(f"{name}: {label.strip()} {change:+.1f}%")
+
+    print()
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:g}%:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"no regressions over {args.threshold:g}%")
+
+
+if __name__ == "__main__":
+    main()
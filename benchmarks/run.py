@@ -0,0 +1,296 @@
+# This runs the Subnautic Shooter benchmark scenarios and writes the results as JSON
+#
+#   python benchmarks/run.py                        every scenario, results/<time>.json
+#   python benchmarks/run.py monsters_500 --ticks 1200 --repeat 3 --out base.json
+#   python benchmarks/compare.py base.json new.json
+#
+# Each scenario runs in its own process (clean caches, its own peak RSS) on a
+# seeded world with scripted input, in three passes over the same ticks:
+#   timing   update() and draw() wall time per tick, profiler off
+#   systems  per-system times from game/profiler.py (update.sprites, draw.sprites, ...)
+#   memory   tracemalloc peak and retained allocations
+# Object pool sizes and hit rates at the end are saved with the result.
+
+import argparse
+import faulthandler
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+try:
+    import resource  # peak RSS; Unix only
+except ImportError:
+    resource = None
+
+# Get the benchmarks directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Get the repository root and the game package
+repo_dir = os.path.dirname(current_dir)
+game_dir = os.path.join(repo_dir, "subnautic_shooter")
+# Add the game package to Python path
+sys.path.insert(0, game_dir)
+sys.path.insert(0, current_dir)
+
+RESULTS_DIR = os.path.join(current_dir, "results")
+DEFAULT_TICKS = 600 # 10 s of simulation at 60 ticks/s
+DEFAULT_WARMUP = 120 # untimed ticks first: caches, pools and the flow field fill up
+DEFAULT_ALLOC_TICKS = 120 # tracemalloc slows everything down, so this pass is shorter
+DEFAULT_SEED = 1234
+
+
+# ===== MEASURING =====
+def summarize(samples):
+    """mean / p50 / p95 / p99 / max of per-tick times in ms"""
+    from game.profiler import percentiles
+    if not samples:
+        return None
+    p50, p95, p99 = percentiles(samples)
+    return {'mean': sum(samples) / len(samples), 'p50': p50, 'p95': p95, 'p99': p99, 'max': max(samples)}
+
+
+def build_state(seed, draw):
+    """Seeded GameState with scripted input; draw=False builds it headless"""
+    import pygame
+    from game.gamestate import GameState
+    from game.controls import ScriptedControls
+    from game.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    # no audio: pygame's channel-finished callback takes the GIL on SDL's audio thread,
+    # which races tracemalloc.start()/stop() in the memory pass and can segfault
+    pygame.mixer.quit()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) if draw else None
+
+    state = GameState(
+        screen=screen,
+        collision_sprites=pygame.sprite.Group(),
+        obstacle_group=pygame.sprite.Group(),
+        visible_sprites=pygame.sprite.Group(),
+        explosion_group=pygame.sprite.Group(),
+        headless=not draw,
+        seed=seed
+    )
+    state.controls = ScriptedControls()
+    return state, screen
+
+
+def run_ticks(state, screen, scenario, first_tick, ticks, on_tick=None):
+    """Step ticks scripted ticks; returns (update ms list, draw ms list)"""
+    from game.config import MAP_CLEAR_COLOR, FPS
+
+    dt = 1 / FPS
+    update_ms = []
+    draw_ms = []
+    for tick in range(first_tick, first_tick + ticks):
+        state.controls.set(scenario.input(state, tick))
+
+        start = time.perf_counter()
+        state.update(dt)
+        updated = time.perf_counter()
+        update_ms.append((updated - start) * 1000)
+
+        if screen is not None:
+            state.camera.interpolate(1.0)
+            screen.fill(MAP_CLEAR_COLOR)
+            state.draw(screen)
+            draw_ms.append((time.perf_counter() - updated) * 1000)
+
+        if on_tick:
+            on_tick()
+    return update_ms, draw_ms
+
+
+def run_scenario(name, ticks, warmup, alloc_ticks, seed, draw):
+    """Run one scenario in this process; returns its result dict"""
+    os.chdir(game_dir)  # asset paths are relative to subnautic_shooter/
+    from scenarios import SCENARIOS
+    from game.profiler import profiler
+    from entities.torpedo import Torpedo
+
+    scenario = SCENARIOS[name]
+    start = time.perf_counter()
+    state, screen = build_state(seed, draw)
+    scenario.setup(state)
+    setup_s = time.perf_counter() - start
+
+    tick = 0
+    run_ticks(state, screen, scenario, tick, warmup)
+    tick += warmup
+
+    # timing pass
+    update_ms, draw_ms = run_ticks(state, screen, scenario, tick, ticks)
+    tick += ticks
+    elapsed = (sum(update_ms) + sum(draw_ms)) / 1000
+
+    # systems pass
+    profiler.reset(window=ticks)
+    profiler.enable()
+    run_ticks(state, screen, scenario, tick, ticks, on_tick=profiler.end_frame)
+    profiler.disable()
+    tick += ticks
+    systems = profiler.stats()
+    systems.pop('frame', None)
+
+    # memory pass
+    tracemalloc.start()  # one frame per allocation: enough for the top sites, far cheaper
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    run_ticks(state, screen, scenario, tick, alloc_ticks)
+    after = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tick += alloc_ticks
+
+    growth = [stat for stat in after.compare_to(before, 'lineno') if stat.size_diff > 0]
+    retained = sum(stat.size_diff for stat in growth)
+    top_sites = [
+        f"{stat.traceback[0].filename.replace(repo_dir + os.sep, '')}:{stat.traceback[0].lineno} "
+        f"+{stat.size_diff / 1024:.1f} KiB"
+        for stat in growth[:5]
+    ]
+
+    peak_rss_kb = None
+    if resource:
+        peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss_kb //= 1024  # bytes there, KiB on Linux
+
+    return {
+        'description': scenario.description,
+        'ticks': ticks,
+        'monsters': len(state.enemy_sprites),
+        'torpedoes': sum(1 for sprite in state.visible_sprites if isinstance(sprite, Torpedo)),
+        'ticks_per_second': ticks / elapsed if elapsed else None,
+        'update_ms': summarize(update_ms),
+        'draw_ms': summarize(draw_ms),
+        'systems': systems,
+        'alloc': {
+            'ticks': alloc_ticks,
+            'peak_kb': peak / 1024,
+            'retained_kb': retained / 1024,
+            'top_sites': top_sites,
+        },
+        'pools': state.pool_stats(),
+        'peak_rss_kb': peak_rss_kb,
+        'setup_s': setup_s,
+        'state_hash': f"{state.state_hash():08x}",
+    }
+
+
+# ===== DRIVER =====
+def environment():
+    """What the numbers were measured on"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=repo_dir,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    import pygame
+    return {
+        'commit': commit,
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'pygame': pygame.version.ver,
+        'numpy': numpy_version,
+    }
+
+
+def run_child(name, args):
+    """Run one scenario in a fresh interpreter and read back its result"""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "result.json")
+        command = [
+            sys.executable, os.path.abspath(__file__), name, "--child", out,
+            "--ticks", str(args.ticks), "--warmup", str(args.warmup),
+            "--alloc-ticks", str(args.alloc_ticks), "--seed", str(args.seed),
+        ]
+        if args.no_draw:
+            command.append("--no-draw")
+
+        # the game prints (map loading, deaths); keep it out of the report unless asked for
+        output = None if args.verbose else subprocess.DEVNULL
+        completed = subprocess.run(command, stdout=output, stderr=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            print(completed.stderr)
+            raise RuntimeError(f"scenario {name} failed (exit status {completed.returncode})")
+        with open(out) as f:
+            return json.load(f)
+
+
+def main():
+    from scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description="Subnautic Shooter performance benchmarks")
+    parser.add_argument("scenarios", nargs="*", help=f"default: all ({', '.join(SCENARIOS)})")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="measured ticks per pass")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--alloc-ticks", type=int, default=DEFAULT_ALLOC_TICKS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=1, help="runs per scenario; the fastest is kept")
+    parser.add_argument("--no-draw", action="store_true", help="headless: time update() only")
+    parser.add_argument("--out", help="result file (default: benchmarks/results/<time>.json)")
+    parser.add_argument("--verbose", action="store_true", help="show the game's own output")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    if args.child:
+        faulthandler.enable()  # a crash in pygame/SDL still says where it happened
+        result = run_scenario(names[0], args.ticks, args.warmup, args.alloc_ticks, args.seed, not args.no_draw)
+        with open(args.child, 'w') as f:
+            json.dump(result, f)
+        return
+
+    results = {
+        'environment': environment(),
+        'settings': {
+            'ticks': args.ticks, 'warmup': args.warmup, 'alloc_ticks': args.alloc_ticks,
+            'seed': args.seed, 'draw': not args.no_draw, 'repeat': args.repeat,
+        },
+        'scenarios': {},
+    }
+    for name in names:
+        print(f"{name}: {SCENARIOS[name].description} ...", flush=True)
+        # the run least disturbed by other load on the machine is the one to compare
+        runs = [run_child(name, args) for _ in range(max(1, args.repeat))]
+        result = min(runs, key=lambda run: run['update_ms']['p50'] + (run['draw_ms'] or {}).get('p50', 0))
+        results['scenarios'][name] = result
+        update = result['update_ms']
+        draw = result['draw_ms']
+        line = f"  update p50 {update['p50']:.2f} ms  p95 {update['p95']:.2f} ms"
+        if draw:
+            line += f"  |  draw p50 {draw['p50']:.2f} ms  p95 {draw['p95']:.2f} ms"
+        line += f"  |  peak alloc {result['alloc']['peak_kb']:.0f} KiB"
+        if result['peak_rss_kb']:
+            line += f"  RSS {result['peak_rss_kb'] / 1024:.0f} MiB"
+        print(line)
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
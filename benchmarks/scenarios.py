@@ -0,0 +1,146 @@
+# benchmarks/scenarios.py
+# Scripted workloads for run.py. Each one prepares a seeded GameState, then
+# returns the PlayerInput for every tick, so two runs do the same work.
+import math
+
+from game.config import *
+from game.controls import PlayerInput
+
+
+def sweep_aim(tick, turns_per_second=0.5):
+    """Aim direction rotating around the player"""
+    angle = tick / FPS * turns_per_second * math.tau
+    return (math.cos(angle), math.sin(angle))
+
+
+def fill_monsters(state, count):
+    """Bring the world to exactly count monsters, spread over types like the waves are"""
+    spawner = state.monster_spawner
+    spawner.spawn_interval = float('inf')  # no waves: the population stays where we put it
+
+    for monster in list(state.enemy_sprites)[count:]:
+        monster.kill()
+
+    types = [t for t, weight in MONSTER_SPAWN_RATIO.items() for _ in range(weight)]
+    i = 0
+    while len(state.enemy_sprites) < count:
+        spawner.spawn_monster(types[i % len(types)])  # straight in, past the population caps
+        i += 1
+    state.rebuild_entity_grid()
+
+
+class Scenario:
+    """One benchmark workload"""
+    name = "idle"
+    description = "default world, player holding still"
+
+    def setup(self, state):
+        pass
+
+    def input(self, state, tick):
+        return PlayerInput()
+
+
+class MonsterHorde(Scenario):
+    """count monsters in their spawn areas while the player swims a slow circle"""
+
+    def __init__(self, count):
+        self.count = count
+        self.name = f"monsters_{count}"
+        self.description = f"{count} monsters, no waves, player circling"
+
+    def setup(self, state):
+        fill_monsters(state, self.count)
+
+    def input(self, state, tick):
+        phase = tick // (FPS * 2) % 4  # two seconds per side of a square
+        move_x, move_y = ((1, 0), (0, 1), (-1, 0), (0, -1))[phase]
+        return PlayerInput(move_x=move_x, move_y=move_y, aim=sweep_aim(tick))
+
+
+class TorpedoBarrage(Scenario):
+    """A torpedo every tick, sweeping around the player through a crowd"""
+    name = "torpedo_barrage"
+    description = "torpedo every tick (no cooldown or power cost), 300 monsters"
+
+    def setup(self, state):
+        fill_monsters(state, 300)
+
+    def input(self, state, tick):
+        player = state.player
+        player.power = PLAYER_MAX_POWER
+        player.last_torpedo_time = -TORPEDO_COOLDOWN * 1000  # cooldown always over
+        return PlayerInput(fire=True, aim=sweep_aim(tick, turns_per_second=1))
+
+
+class SonarFog(Scenario):
+    """Sonar pinging back to back while the player moves through the fog"""
+    name = "sonar_fog"
+    description = "sonar re-fired as soon as each ping ends, player moving"
+
+    def setup(self, state):
+        state.player.level = max(state.player.level, state.player.sonar_level_required)
+
+    def input(self, state, tick):
+        player = state.player
+        player.power = PLAYER_MAX_POWER
+        if not player.sonar_active:
+            player.last_sonar_time = -SONAR_COOLDOWN * 1000
+        move_x = 1 if tick // (FPS * 3) % 2 == 0 else -1
+        return PlayerInput(move_x=move_x, sonar=not player.sonar_active, aim=sweep_aim(tick))
+
+
+class PortalSpam(Scenario):
+    """The player teleports to the next portal on every tick"""
+    name = "portal_spam"
+    description = "teleport every tick around the portal ring"
+
+    def setup(self, state):
+        portal = next(iter(state.portal_group))
+        state.player.rect.center = portal.node.position
+        state.player.hitbox_rect.center = portal.node.position
+
+    def input(self, state, tick):
+        state.player.last_portal_time = state.clock.get_ticks() - PORTAL_COOLDOWN  # cooldown always over
+        return PlayerInput(portal_next=True, aim=sweep_aim(tick))
+
+
+class RespawnCycle(Scenario):
+    """The player dives at the nearest monster on one health point, so it keeps dying and respawning"""
+    name = "respawn_cycle"
+    description = "player on 1 HP chasing monsters: death, respawn and protection over and over"
+
+    def setup(self, state):
+        fill_monsters(state, 300)
+
+    def input(self, state, tick):
+        player = state.player
+        if player.is_dead or player.is_invincible:
+            return PlayerInput(aim=sweep_aim(tick))
+
+        player.health = min(player.health, 1)
+        x, y = player.rect.center
+        target = min(
+            state.enemy_sprites,
+            key=lambda monster: (monster.rect.centerx - x) ** 2 + (monster.rect.centery - y) ** 2,
+            default=None
+        )
+        if target is None:
+            return PlayerInput(aim=sweep_aim(tick))
+        dx = target.rect.centerx - x
+        dy = target.rect.centery - y
+        return PlayerInput(move_x=(dx > 0) - (dx < 0), move_y=(dy > 0) - (dy < 0), aim=sweep_aim(tick))
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        MonsterHorde(100),
+        MonsterHorde(500),
+        MonsterHorde(2000),
+        TorpedoBarrage(),
+        SonarFog(),
+        PortalSpam(),
+        RespawnCycle(),
+    )
+}
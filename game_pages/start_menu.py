@@ -19,6 +19,7 @@ from game_pages.start_profile_popup import StartProfilePopup
 from game_pages.multiplayer_create_lobby import LobbyUI
 from subnautic_shooter.game.game import Game
 from game_pages.start_profile_widget import ProfileWidget
+from ui.text_cache import text_cache  # same module the HUD uses; subnautic_shooter/ is on sys.path once Game is imported
 
 class StartMenu:
     def __init__(self):
@@ -97,21 +98,21 @@ class StartMenu:
         if color is None:
             color = self.LIGHT
             
-        shadow = font.render(text, True, self.SHADOW)
+        shadow = text_cache.render(font, text, True, self.SHADOW)
         self.screen.blit(shadow, (x + 6, y + 6))
         
+        outline = text_cache.render(font, text, True, self.DARK)
         for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-            outline = font.render(text, True, self.DARK)
             self.screen.blit(outline, (x + dx, y + dy))
         
-        main = font.render(text, True, color)
+        main = text_cache.render(font, text, True, color)
         self.screen.blit(main, (x, y))
     
     def draw_menu(self):
         self.screen.blit(self.bg_image, (0, 0))
         
         title_text = "SUBNAUTIC SHOOTER"
-        title_surface = self.title_font.render(title_text, True, self.LIGHT)
+        title_surface = text_cache.render(self.title_font, title_text, True, self.LIGHT)
         title_x = self.WIDTH // 2 - title_surface.get_width() // 2
         self.draw_text(title_text, self.title_font, title_x, 160)
         
@@ -119,7 +120,7 @@ class StartMenu:
         
         for i, option in enumerate(self.options):
             y = 270 + i * 65
-            text_surface = self.menu_font.render(option, True, self.LIGHT)
+            text_surface = text_cache.render(self.menu_font, option, True, self.LIGHT)
             rect = text_surface.get_rect(center=(self.WIDTH // 2, y))
             self.menu_rects.append(rect)
             
@@ -4,46 +4,90 @@ import pygame
 from game_pages.start_menu import StartMenu
 from utils.stack import Stack
 
+# fixed simulation step, independent of how fast frames are drawn
+FIXED_DT = 1 / 60
+MAX_STEPS_PER_FRAME = 5 # caps catch-up after a slow frame so the sim can't spiral
+MAX_RENDER_FPS = 120 # 0 for uncapped
+
 class Main:
-    def __init__(self):
+    def __init__(self, fixed_dt=FIXED_DT, max_steps_per_frame=MAX_STEPS_PER_FRAME):
         pygame.init()
         self.screen = pygame.display.set_mode((1280, 720))
         self.clock = pygame.time.Clock()
 
+        # fixed timestep
+        self.fixed_dt = fixed_dt
+        self.max_steps_per_frame = max_steps_per_frame
+        self.accumulator = 0.0
+
         # Stack ADT for scene management
         self.scenes = Stack()
         self.scenes.push(StartMenu())
 
+    def handle_result(self, result):
+        """Apply a scene transition; returns False when the app should quit"""
+        action, payload = result
+
+        if action == "PUSH":
+            self.scenes.push(payload)
+
+        elif action == "POP":
+            self.scenes.pop()
+
+        elif action == "REPLACE":
+            self.scenes.pop()
+            self.scenes.push(payload)
+
+        elif action == "QUIT":
+            return False
+
+        return not self.scenes.is_empty()
+
+    def step(self, events):
+        """Advance the top scene by one fixed step; returns (running, scene_changed)"""
+        result = self.scenes.peek().update(events, self.fixed_dt)
+        if not result:
+            return True, False
+        return self.handle_result(result), True
+
     def run(self):
         running = True
+        pending_events = []  # input that arrived since the last simulation step
+
         while running:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    running = False
+            frame_dt = self.clock.tick(MAX_RENDER_FPS) / 1000
 
-            current = self.scenes.peek()
-            dt = self.clock.tick(60) / 1000
+            events = pygame.event.get()
+            pending_events.extend(events)
 
-            result = current.update(events, dt)
-            current.draw(self.screen)
-            pygame.display.flip()
+            if any(event.type == pygame.QUIT for event in events):
+                # one last step so the scene sees QUIT too (closes recordings, saves)
+                self.step(pending_events)
+                break
 
-            if result:
-                action, payload = result
+            # drop time we could never catch up on instead of stalling on it
+            self.accumulator = min(
+                self.accumulator + frame_dt,
+                self.fixed_dt * self.max_steps_per_frame
+            )
 
-                if action == "PUSH":
-                    self.scenes.push(payload)
+            while self.accumulator >= self.fixed_dt:
+                running, scene_changed = self.step(pending_events)
+                pending_events = []
+                self.accumulator -= self.fixed_dt
 
-                elif action == "POP":
-                    self.scenes.pop()
+                if scene_changed:
+                    # the new scene starts from a clean clock
+                    self.accumulator = 0.0
+                    break
 
-                elif action == "REPLACE":
-                    self.scenes.pop()
-                    self.scenes.push(payload)
+            if not running:
+                break
 
-                elif action == "QUIT":
-                    running = False
+            current = self.scenes.peek()
+            set_interpolation = getattr(current, "set_interpolation", None)
+            if set_interpolation:
+                set_interpolation(self.accumulator / self.fixed_dt)
 
             self.screen.fill((0, 0, 0))
             current.draw(self.screen)
@@ -1,32 +1,169 @@
 # entities/camera.py
+import math
 import pygame
+from game.config import *
 
 class Camera(pygame.sprite.Group):
     """Manages viewport and sprite render with offset"""
-    def __init__(self, screen, map_width, map_height):
+    def __init__(self, screen, map_width, map_height, spatial_index=None):
         super().__init__()
         self.surface = screen
         self.offset = pygame.math.Vector2()
         self.map_width = map_width
         self.map_height = map_height
-        self.screen_width, self.screen_height = screen.get_size()
-    
+        # headless worlds have no screen but still centre on a window-sized view
+        self.screen_width, self.screen_height = screen.get_size() if screen else (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # culling: grid holding (at least) every camera sprite, rebuilt each frame
+        self.spatial_index = spatial_index
+
+        # z-layer buckets: sprite -> z, and last frame's y-sorted draw order per z
+        self.sprite_layers = {}
+        self.layer_order = {}
+
+        # render interpolation between the last two fixed steps
+        self.prev_offset = pygame.math.Vector2()
+        self.prev_positions = {}  # sprite -> rect.topleft before the last step
+        self.alpha = 1.0
+        self.draw_offset = self.offset
+
+    # ===== GROUP BOOKKEEPING =====
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self.sprite_layers[sprite] = getattr(sprite, 'z_layer', 0)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.sprite_layers.pop(sprite, None)
+
     def centered_player_cam(self, target):
         """Center camera on player"""
         target_x = target.rect.centerx - self.screen_width // 2
         target_y = target.rect.centery - self.screen_height // 2
-        
+
         # keep camera within map bounds
         self.offset.x = max(0, min(target_x, self.map_width - self.screen_width))
         self.offset.y = max(0, min(target_y, self.map_height - self.screen_height))
-    
+
+    # ===== INTERPOLATION =====
+    def store_previous(self):
+        """Remember positions before a fixed step so drawing can blend towards the new ones"""
+        self.prev_offset.update(self.offset)
+        layers = self.sprite_layers
+        if self.spatial_index is None:
+            candidates = layers
+        else:
+            # only sprites that can be on screen after the step: the camera, the sprite and
+            # the culling margin each move at most INTERPOLATION_SNAP_DISTANCE, or nothing blends
+            reach = INTERPOLATION_SNAP_DISTANCE * 3
+            view = pygame.Rect(int(self.offset.x), int(self.offset.y), self.screen_width, self.screen_height)
+            candidates = self.spatial_index.query_rect(view.inflate(reach * 2, reach * 2))
+        self.prev_positions = {sprite: sprite.rect.topleft for sprite in candidates if sprite in layers}
+
+    def interpolate(self, alpha):
+        """Set how far (0..1) between the previous and current step the next draw is"""
+        self.alpha = alpha
+        if alpha >= 1 or not self.prev_positions or \
+                self.prev_offset.distance_to(self.offset) > INTERPOLATION_SNAP_DISTANCE:
+            self.draw_offset = self.offset
+        else:
+            self.draw_offset = self.prev_offset.lerp(self.offset, alpha)
+
+    def draw_position(self, sprite):
+        """World-space topleft to draw sprite at"""
+        x, y = sprite.rect.topleft
+        if self.alpha >= 1:
+            return x, y
+
+        prev = self.prev_positions.get(sprite)
+        if prev is None:
+            return x, y
+
+        dx = x - prev[0]
+        dy = y - prev[1]
+        if abs(dx) > INTERPOLATION_SNAP_DISTANCE or abs(dy) > INTERPOLATION_SNAP_DISTANCE:
+            return x, y
+        return prev[0] + dx * self.alpha, prev[1] + dy * self.alpha
+
+    def draw_center(self, sprite):
+        x, y = self.draw_position(sprite)
+        return pygame.math.Vector2(x + sprite.rect.width // 2, y + sprite.rect.height // 2)
+
+    # ===== CULLING =====
+    def viewport(self):
+        """World-space rect currently on screen"""
+        view = pygame.Rect(
+            math.floor(self.draw_offset.x),
+            math.floor(self.draw_offset.y),
+            self.screen_width + 1,
+            self.screen_height + 1
+        )
+        if self.alpha < 1:
+            # sprites may be drawn up to one step away from their rect
+            view.inflate_ip(INTERPOLATION_SNAP_DISTANCE * 2, INTERPOLATION_SNAP_DISTANCE * 2)
+        return view
+
+    def visible_sprites(self, view):
+        """Camera sprites overlapping view, in a stable order"""
+        if self.spatial_index is None:
+            candidates = self.sprites()
+        else:
+            candidates = self.spatial_index.query_rect(view)
+
+        layers = self.sprite_layers
+        return [
+            sprite for sprite in candidates
+            if sprite in layers and view.colliderect(sprite.rect)
+        ]
+
+    def sorted_layers(self, sprites):
+        """Bucket sprites by z-layer; a bucket is only re-sorted when its y-order broke"""
+        buckets = {}
+        layers = self.sprite_layers
+        for sprite in sprites:
+            z = layers[sprite]
+            bucket = buckets.get(z)
+            if bucket is None:
+                buckets[z] = [sprite]
+            else:
+                bucket.append(sprite)
+
+        ordered = []
+        for z in sorted(buckets):
+            members = buckets[z]
+            member_set = set(members)
+
+            # start from last frame's order so unchanged buckets stay sorted
+            order = [sprite for sprite in self.layer_order.get(z, ()) if sprite in member_set]
+            if len(order) != len(members):
+                placed = set(order)
+                order.extend(sprite for sprite in members if sprite not in placed)
+
+            ys = [sprite.rect.centery for sprite in order]
+            if any(ys[i] > ys[i + 1] for i in range(len(ys) - 1)):
+                order.sort(key=lambda sprite: sprite.rect.centery)
+
+            self.layer_order[z] = order
+            ordered.append(order)
+
+        for z in list(self.layer_order):
+            if z not in buckets:
+                del self.layer_order[z]
+        return ordered
+
     def custom_draw(self, player):
-        """Draw all sprites with camera offset, sorted by z-layer"""
-        # sort sprites by z-layer and y-position
-        self_sprites = sorted(self.sprites(), 
-                               key=lambda sprite: (getattr(sprite, 'z_layer', 0), 
-                                                  sprite.rect.centery))
-        
-        for sprite in self_sprites:
-            offset_pos = pygame.math.Vector2(sprite.rect.topleft) - self.offset
-            self.surface.blit(sprite.image, (offset_pos.x, offset_pos.y))
\ No newline at end of file
+        """Draw on-screen sprites with camera offset, sorted by z-layer"""
+        offset_x, offset_y = self.draw_offset.x, self.draw_offset.y
+        blit = self.surface.blit
+        interpolating = self.alpha < 1
+
+        for order in self.sorted_layers(self.visible_sprites(self.viewport())):
+            for sprite in order:
+                image = sprite.image
+                if image.get_alpha() == 0:
+                    continue  # faded out in the fog
+                if interpolating:
+                    x, y = self.draw_position(sprite)
+                else:
+                    x, y = sprite.rect.topleft
+                blit(image, (x - offset_x, y - offset_y))
@@ -1,21 +1,54 @@
 # entities/explosion.py
 import pygame
+from game.config import *
+from game.entity_store import EntityStore, np
+
+# explosion components: name -> (row shape, dtype)
+EXPLOSION_COMPONENTS = {
+    'frame_timer': ((), 'float32'),
+    'frame_time': ((), 'float32'),  # seconds per frame
+    'frame_index': ((), 'int16'),
+    'frame_count': ((), 'int16'),
+}
 
 class AnimatedExplosion(pygame.sprite.Sprite):
     """Plays Explosion animation and deletes after"""
 
-    def __init__(self, frames, pos, groups):
+    def __init__(self, frames, pos, groups, system=None):
         super().__init__(groups)
+        self.pool = None
+        self.in_pool = False
+        self.system = None  # ExplosionSystem animating this explosion, if any
+        self.slot = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(frames, pos, groups, system)
+
+    def reset(self, frames, pos, groups, system=None):
+        """(Re)start the animation at pos; used by the explosion pool"""
+        self.add(groups)
         self.frames = frames
         self.frame_index = 0
-        self.image = self.frames[0].copy()
-        self.rect = self.image.get_rect(center=pos)
+        self.image = self.frames[0]
+        self.rect.size = self.image.get_size()
+        self.rect.center = pos
         self.z_layer = 5
         self.animation_speed = 15  # frames per second
         self.frame_timer = 0
+        if system:
+            system.add(self)
+
+    def kill(self):
+        super().kill()
+        if self.system:
+            self.system.remove(self)
+        if self.pool:
+            self.pool.release(self)
 
     def update(self, dt):
         """Animate explosion frame by frame and remove when done."""
+        if self.system:
+            return  # stepped by ExplosionSystem
+
         self.frame_timer += dt
         if self.frame_timer >= 1.0 / self.animation_speed:
             self.frame_timer = 0
@@ -24,3 +57,57 @@ class AnimatedExplosion(pygame.sprite.Sprite):
                 self.kill()
                 return
             self.image = self.frames[self.frame_index] # update to next frame
+
+
+class ExplosionSystem:
+    """Advances every live explosion's animation from EntityStore columns"""
+
+    def __init__(self, capacity=EXPLOSION_POOL_SIZE):
+        self.store = EntityStore(EXPLOSION_COMPONENTS, capacity)
+
+    @staticmethod
+    def available():
+        return EntityStore.available()
+
+    def add(self, explosion):
+        self.store.add(
+            explosion,
+            frame_time=1.0 / explosion.animation_speed,
+            frame_count=len(explosion.frames),
+        )
+        explosion.system = self
+
+    def remove(self, explosion):
+        self.store.remove(explosion)
+        explosion.system = None
+
+    def update(self, dt):
+        for _ in range(EXPLOSION_TICKS_PER_FRAME):
+            self.step(dt)
+
+    def step(self, dt):
+        store = self.store
+        if not store.count:
+            return
+
+        frame_timer = store['frame_timer']
+        frame_timer += dt
+        advance = np.flatnonzero(frame_timer >= store['frame_time'])
+        if not len(advance):
+            return
+
+        frame_timer[advance] = 0.0
+        frame_index = store['frame_index']
+        frame_index[advance] += 1
+
+        finished = []
+        for i, index in zip(advance.tolist(), frame_index[advance].tolist()):
+            explosion = store.owners[i]
+            if index >= len(explosion.frames):
+                finished.append(explosion)
+            else:
+                explosion.frame_index = index
+                explosion.image = explosion.frames[index]
+
+        for explosion in finished:
+            explosion.kill()
@@ -0,0 +1,273 @@
+# entities/monster_batch.py
+from game.config import *
+from game.entity_store import EntityStore, np
+
+FACINGS = ("right", "left")
+RIGHT, LEFT = 0, 1
+
+# monster components: name -> (row shape, dtype)
+MONSTER_COMPONENTS = {
+    'pos': ((2,), 'float64'),  # rect center
+    'hitbox': ((4,), 'int32'),  # x, y, w, h
+    'direction': ((2,), 'float64'),
+    'speed': ((), 'float32'),
+    'chasing': ((), 'bool'),
+    'dir_timer': ((), 'float32'),
+    'cooldown': ((), 'float32'),
+    'anim_timer': ((), 'float32'),
+    'anim_speed': ((), 'float32'),
+    'lod_dt': ((), 'float32'),  # time a far monster has skipped since its last coarse step
+    'frame': ((), 'int16'),
+    'frames': ((), 'int16'),
+    'facing': ((), 'int8'),
+    'alpha': ((), 'int16'),
+    # what the sprite currently shows, to find rows that need syncing
+    'shown_frame': ((), 'int16'),
+    'shown_facing': ((), 'int8'),
+    'shown_alpha': ((), 'int16'),
+}
+
+
+class MonsterBatch:
+    """Steps every monster's AI, fog fade and animation with NumPy array math.
+
+    Monster state lives in an EntityStore, one row per live monster.
+    Distance, state changes, chase headings, fog alpha and animation timers
+    are computed for the whole store at once. Map collision still slides
+    each sprite's rect (Monster.move_by), and sprite images are only touched
+    for rows whose frame, facing or alpha actually changed.
+
+    Rows are split into LOD tiers by distance to the player: near rows get
+    the full step, far rows a coarse step every LOD_FAR_INTERVAL ticks with
+    no animation, and dormant rows are frozen.
+    """
+
+    def __init__(self, navigation=None, capacity=MONSTER_BATCH_CAPACITY):
+        self.store = EntityStore(MONSTER_COMPONENTS, capacity)
+        self.navigation = navigation
+        self.ticks = 0
+        self.lod_counts = (0, 0, 0)  # near, far, dormant after the last step
+
+    @staticmethod
+    def available():
+        return EntityStore.available()
+
+    @property
+    def monsters(self):
+        return self.store.owners
+
+    @property
+    def count(self):
+        return self.store.count
+
+    # ===== MEMBERSHIP =====
+    def add(self, monster):
+        """Give a (re)spawned monster a row and hand its stepping over to the batch"""
+        facing = LEFT if monster.direction_facing == "left" else RIGHT
+        self.store.add(
+            monster,
+            pos=monster.rect.center,
+            hitbox=tuple(monster.hitbox_rect),
+            direction=tuple(monster.direction),
+            speed=monster.speed,
+            chasing=monster.state == "chase",
+            dir_timer=monster.change_dir_timer,
+            cooldown=monster.attack_cooldown,
+            anim_timer=monster.animation_timer,
+            anim_speed=monster.animation_speed,
+            lod_dt=monster.lod_dt,
+            frame=monster.current_frame,
+            frames=len(monster.animations[monster.direction_facing]),
+            facing=facing,
+            alpha=monster.alpha,
+            shown_frame=monster.current_frame,
+            shown_facing=facing,
+            shown_alpha=monster.alpha,
+        )
+        monster.batch = self
+
+    def remove(self, monster):
+        self.store.remove(monster)
+        monster.batch = None
+
+    def sync_rects(self, slots):
+        """Copy sprite rects that were moved by Python code back into the store"""
+        monsters = self.store.owners
+        self.store['pos'][slots] = [monsters[i].rect.center for i in slots]
+        self.store['hitbox'][slots] = [tuple(monsters[i].hitbox_rect) for i in slots]
+
+    # ===== UPDATE =====
+    def update(self, dt, player):
+        for _ in range(MONSTER_TICKS_PER_FRAME):
+            self.step(dt, player)
+
+    def step(self, dt, player):
+        store = self.store
+        for monster in [m for m in store.owners if not m.alive]:
+            monster.kill()
+
+        n = store.count
+        if not n:
+            return
+
+        monsters = store.owners
+        pos = store['pos']
+        direction = store['direction']
+
+        # ----- distance to the player and LOD tiers -----
+        offset = np.subtract(player.rect.center, pos)
+        distance = np.hypot(offset[:, 0], offset[:, 1])
+
+        near = distance <= LOD_NEAR_DISTANCE
+        far = ~near & (distance <= LOD_FAR_DISTANCE)
+
+        # far rows bank their time and spend it in one coarse step, staggered by slot
+        lod_dt = store['lod_dt']
+        lod_dt[near] = 0.0
+        lod_dt[far] += dt
+        due = far & ((self.ticks + np.arange(n)) % LOD_FAR_INTERVAL == 0)
+        self.ticks += 1
+
+        row_dt = np.where(near, dt, 0.0)
+        row_dt[due] = lod_dt[due]
+        lod_dt[due] = 0.0
+        active = near | due
+
+        far_count = int(far.sum())
+        near_count = int(near.sum())
+        self.lod_counts = (near_count, far_count, n - near_count - far_count)
+
+        cooldown = store['cooldown']
+        np.subtract(cooldown, row_dt, out=cooldown, where=cooldown > 0)
+
+        # ----- state changes -----
+        chasing = store['chasing']
+        chasing[distance <= DETECTION_RANGE] = True
+        chasing[distance >= LOSE_INTEREST_RANGE] = False
+
+        hunting = not (player.is_invincible or player.is_dead)
+        chase = chasing if hunting else np.zeros(n, dtype=bool)
+
+        # ----- wander: pick a new heading every 2 s -----
+        wander = ~chase & active
+        dir_timer = store['dir_timer']
+        dir_timer[wander] += row_dt[wander]
+        turning = np.flatnonzero(wander & (dir_timer >= 2.0))
+        for i in turning.tolist():
+            direction[i] = tuple(monsters[i].random_direction())
+        dir_timer[turning] = 0.0
+
+        # ----- chase: head straight for the player, or follow the flow field around walls -----
+        heading = chase & active & (distance > 0)
+        direction[heading] = offset[heading] / distance[heading, None]
+        if self.navigation and heading.any():
+            self.follow_flow_field(np.flatnonzero(heading), player)
+
+        # ----- fog fade (from the pre-move distance, like Monster.update_visibility) -----
+        fade = 1 - (distance - VISIBILITY_RADIUS) / (FOG_RADIUS - VISIBILITY_RADIUS)
+        alpha = (255 * np.clip(fade, 0, 1)).astype(np.int16)
+        alpha[distance <= VISIBILITY_RADIUS] = 255
+        if getattr(player, "sonar_active", False):
+            alpha[distance <= player.sonar_range] = 255
+        store['alpha'][:] = alpha
+
+        # ----- movement: rect collision stays per sprite -----
+        moving = np.flatnonzero(active & direction.any(axis=1))
+        if len(moving):
+            steps = direction[moving] * (store['speed'][moving] * row_dt[moving])[:, None]
+            repel = None if player.is_invincible else player
+            for i, (dx, dy) in zip(moving.tolist(), steps.tolist()):
+                monsters[i].move_by(dx, dy, repel)
+            self.sync_rects(moving)
+
+        # ----- animation (near rows only) -----
+        facing = store['facing']
+        facing[near & (direction[:, 0] < 0)] = LEFT
+        facing[near & (direction[:, 0] > 0)] = RIGHT
+
+        anim_timer = store['anim_timer']
+        anim_timer[near] += dt
+        advance = near & (anim_timer >= store['anim_speed'])
+        frame = store['frame']
+        frame[advance] = (frame[advance] + 1) % store['frames'][advance]
+        anim_timer[advance] = 0.0
+
+        self.sync_images()
+
+    def follow_flow_field(self, rows, player):
+        """Replace chase headings with the field's next step wherever it has one"""
+        field = self.navigation.field(player)
+        if field is None:
+            return
+
+        x0, y0, width, height = field.window
+        if not width or not height:
+            return
+
+        pos = self.store['pos'][rows]
+        cx = (pos[:, 0] // field.cell_size).astype(np.int64) - x0
+        cy = (pos[:, 1] // field.cell_size).astype(np.int64) - y0
+        inside = (cx >= 0) & (cx < width) & (cy >= 0) & (cy < height)
+
+        distance, steps = field.arrays()
+        cells = np.where(inside, cy * width + cx, 0)
+        use = inside & (distance[cells] > NAV_BEELINE_CELLS)
+        self.store['direction'][rows[use]] = steps[cells[use]]
+
+    def sync_images(self):
+        """Point sprites whose frame, facing or fade changed at their cached image"""
+        store = self.store
+        frame = store['frame']
+        facing = store['facing']
+        alpha = store['alpha']
+        changed = np.flatnonzero(
+            (frame != store['shown_frame'])
+            | (facing != store['shown_facing'])
+            | (alpha != store['shown_alpha'])
+        )
+        if not len(changed):
+            return
+
+        monsters = store.owners
+        for i, f, d, a in zip(
+            changed.tolist(),
+            frame[changed].tolist(),
+            facing[changed].tolist(),
+            alpha[changed].tolist()
+        ):
+            monster = monsters[i]
+            monster.current_frame = f
+            monster.direction_facing = FACINGS[d]
+            monster.alpha = a
+            monster.refresh_image()
+
+        store['shown_frame'][changed] = frame[changed]
+        store['shown_facing'][changed] = facing[changed]
+        store['shown_alpha'][changed] = alpha[changed]
+
+    # ===== COMBAT =====
+    def resolve_contacts(self, player):
+        """Let every monster whose hitbox touches the player attack it"""
+        store = self.store
+        if not store.count or player.is_dead or player.is_invincible:
+            return
+
+        hitbox = store['hitbox']
+        target = player.hitbox_rect
+        touching = np.flatnonzero(
+            (store['cooldown'] <= 0)
+            & (hitbox[:, 0] < target.right)
+            & (hitbox[:, 0] + hitbox[:, 2] > target.left)
+            & (hitbox[:, 1] < target.bottom)
+            & (hitbox[:, 1] + hitbox[:, 3] > target.top)
+        )
+        if not len(touching):
+            return
+
+        for i in touching.tolist():
+            monster = store.owners[i]
+            if not monster.alive or player.is_dead or player.is_invincible:
+                continue
+            monster.attack(player)
+            store['cooldown'][i] = 1.0
+        self.sync_rects(touching)
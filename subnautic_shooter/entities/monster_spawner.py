@@ -1,6 +1,7 @@
 # entities/monster_spawner.py
 import pygame
-from random import randint, choice
+import random
+from collections import Counter
 from game.config import *
 from entities.monsters import Monster
 
@@ -12,15 +13,20 @@ class MonsterSpawner:
         player,
         enemy_sprites,
         visible_sprites,
-        collision_sprites,
-        map_collision_sprites
+        map_system,
+        monster_pool=None,
+        monster_batch=None,
+        rng=None,
+        adaptive=True
     ):
         # references
         self.player = player
         self.enemy_sprites = enemy_sprites
         self.visible_sprites = visible_sprites
-        self.collision_sprites = collision_sprites
-        self.map_collision_sprites = map_collision_sprites
+        self.map_system = map_system
+        self.monster_pool = monster_pool
+        self.monster_batch = monster_batch
+        self.rng = rng or random
 
         # timing
         self.spawn_interval = MONSTER_SPAWN_INTERVAL
@@ -38,44 +44,115 @@ class MonsterSpawner:
         # spawn tracking
         self.wave_number = 0
 
+        # population budget (adaptive=False keeps wave sizes independent of frame time)
+        self.adaptive = adaptive
+        self.frame_time = SPAWN_FRAME_BUDGET # smoothed seconds of work (update + draw) per frame
+        self.spawned_total = 0
+        self.recycled_total = 0
+
         # spawn initial monsters immediately
         self.spawn_initial_batch()
 
     def spawn_initial_batch(self):
         """Spawn initial fixed amount of monsters"""
+        population = self.population()
         for monster_type, data in MONSTER_SPAWN_AREA.items():
-            for i in range(data["count"]):
-                self.spawn_monster(monster_type)
+            self.spawn_budgeted(monster_type, data["count"], population)
 
     def spawn_wave(self):
         """Spawn a scaled number of monsters"""
         self.wave_number += 1
 
-        for monster_type, base_count in self.base_spawn_count.items():
-            scaled_count = max(1, int(base_count * self.difficulty_scale))
+        factor = self.spawn_factor()
+        population = self.population()
+        spawned = recycled = 0
 
-            for i in range(scaled_count):
+        for monster_type, base_count in self.base_spawn_count.items():
+            scaled_count = max(1, int(base_count * self.difficulty_scale * factor))
+            new, moved = self.spawn_budgeted(monster_type, scaled_count, population)
+            spawned += new
+            recycled += moved
+
+        if WAVE_REPORTS:
+            print(
+                f"Wave {self.wave_number}: {spawned} spawned, {recycled} recycled, "
+                f"{sum(population.values())} alive (spawn rate {factor:.0%})"
+            )
+
+    # ===== POPULATION BUDGET =====
+    def population(self):
+        """Live monster count per type"""
+        return Counter(monster.enemy_type for monster in self.enemy_sprites)
+
+    def track_frame_time(self, frame_cost):
+        """Smooth the time one frame's update and draw work took (seconds, idle wait excluded)"""
+        if self.adaptive:  # seeded worlds never read it; keeps their snapshots free of wall time
+            self.frame_time += (frame_cost - self.frame_time) * SPAWN_FRAME_SMOOTHING
+
+    def spawn_factor(self):
+        """Fraction of a wave to spawn; shrinks while frames run over budget"""
+        if not self.adaptive or self.frame_time <= SPAWN_FRAME_BUDGET:
+            return 1.0
+        return max(SPAWN_MIN_FACTOR, SPAWN_FRAME_BUDGET / self.frame_time)
+
+    def recycle_candidates(self, monster_type):
+        """Idle monsters of a type far from the player, farthest first"""
+        player_pos = pygame.math.Vector2(self.player.rect.center)
+        candidates = []
+        for monster in self.enemy_sprites:
+            if monster.enemy_type != monster_type or not monster.alive or monster.is_chasing():
+                continue
+            distance = player_pos.distance_to(monster.rect.center)
+            if distance >= MONSTER_RECYCLE_DISTANCE:
+                candidates.append((distance, monster))
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return [monster for _, monster in candidates]
+
+    def spawn_budgeted(self, monster_type, count, population):
+        """Spawn up to count monsters within the caps, moving far idle ones for the rest"""
+        type_room = MONSTER_TYPE_CAPS.get(monster_type, MONSTER_POPULATION_CAP) - population[monster_type]
+        total_room = MONSTER_POPULATION_CAP - sum(population.values())
+        spawned = max(0, min(count, type_room, total_room))
+
+        for i in range(spawned):
+            self.spawn_monster(monster_type)
+        population[monster_type] += spawned
+
+        # capped: relocate distant idle monsters into the spawn area instead (via the pool)
+        recycled = 0
+        if spawned < count:
+            for monster in self.recycle_candidates(monster_type)[:count - spawned]:
+                monster.kill()
                 self.spawn_monster(monster_type)
+                recycled += 1
+
+        self.spawned_total += spawned
+        self.recycled_total += recycled
+        return spawned, recycled
 
     def spawn_monster(self, monster_type):
         """Spawn monsters in designated spawn areas"""
         spawn_data = MONSTER_SPAWN_AREA[monster_type]
 
-        area = choice(spawn_data["areas"]) # generates random position
+        area = self.rng.choice(spawn_data["areas"]) # generates random position
         x1, y1, x2, y2 = area
 
-        x = randint(min(x1, x2), max(x1, x2))
-        y = randint(min(y1, y2), max(y1, y2))
+        x = self.rng.randint(min(x1, x2), max(x1, x2))
+        y = self.rng.randint(min(y1, y2), max(y1, y2))
 
-        # create monsters
-        monster = Monster(
+        # create monsters (recycled from the pool when one is free)
+        spawn = self.monster_pool.acquire if self.monster_pool else Monster
+        monster = spawn(
             pos=(x, y),
             groups=[self.visible_sprites, self.enemy_sprites],
-            collision_sprites=self.collision_sprites,
-            map_collision_sprites=self.map_collision_sprites,
+            map_system=self.map_system,
             player=self.player,
-            enemy_type=monster_type
+            enemy_type=monster_type,
+            rng=self.rng
         )
+        if self.monster_batch:
+            self.monster_batch.add(monster)
         if hasattr(self.player, 'game_ref') and hasattr(self.player.game_ref, 'camera'):
             self.player.game_ref.camera.add(monster)
 
@@ -1,8 +1,9 @@
 # entities/monsters.py
 import pygame
 import os
-from random import randint, choice
+import random
 from game.config import *
+from game.assets import asset_manager
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
@@ -13,17 +14,29 @@ class Monster(pygame.sprite.Sprite):
             self, 
             pos, 
             groups, 
-            collision_sprites, 
-            map_collision_sprites, 
+            map_system, 
             player=None, 
-            enemy_type='fly'
+            enemy_type='fly',
+            rng=None
     ):
         super().__init__(*groups)
+        self.pool = None
+        self.in_pool = False
+        self.batch = None  # MonsterBatch stepping this monster, if any
+        self.slot = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox_rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(pos, groups, map_system, player, enemy_type, rng)
+
+    def reset(self, pos, groups, map_system, player=None, enemy_type='fly', rng=None):
+        """(Re)spawn as a fresh monster of enemy_type; used by the monster pool"""
+        self.add(*groups)
 
         # references
+        self.rng = rng or random  # the world's seeded RNG; module random outside a GameState
         self.player = player
-        self.collision_sprites = collision_sprites
-        self.map_collision_sprites = map_collision_sprites
+        self.focus = player  # the player even while it can't be targeted: LOD distances are measured from it
+        self.map_system = map_system
         self.enemy_type = enemy_type
 
         if enemy_type in MONSTER_TYPES:
@@ -35,24 +48,35 @@ class Monster(pygame.sprite.Sprite):
         self.size = data.get("size", (40, 40))
         self.health = data["hp"]
         self.max_health = self.health
-        self.speed = randint(*data["speed"])
+        self.speed = self.rng.randint(*data["speed"])
         self.damage = data.get("damage", 10)
         self.xp_reward = data.get("xp", 10)
         self.frames_count = data.get("frames", 1)
         self.alive = True
 
-        # load animations
-        self.animations = self.load_animations(enemy_type)
+        # load animations (shared by every monster of this type)
+        self.animations = asset_manager.cached(
+            ('monster_animations', enemy_type, self.size),
+            lambda: self.load_animations(enemy_type)
+        )
         self.direction_facing = "right"
         self.current_frame = 0
         self.animation_timer = 0.0
         self.animation_speed = 0.4
 
+        # faded copies shared by every monster of this type: (direction, frame, level) -> Surface
+        self.alpha_frames = asset_manager.cached(
+            ('monster_alpha_frames', enemy_type, self.size),
+            dict
+        )
+        self.image_key = None
+
         self.base_image = self.animations[self.direction_facing][0]
-        self.image = self.base_image.copy()
+        self.image = self.base_image
 
-        self.rect = self.image.get_rect(center=pos)
-        self.hitbox_rect = self.create_hitbox()
+        self.rect.size = self.image.get_size()
+        self.rect.center = pos
+        self.hitbox_rect.update(self.create_hitbox())
 
         self.alpha = 255
         self.z_layer = 3
@@ -63,6 +87,17 @@ class Monster(pygame.sprite.Sprite):
         self.change_dir_timer = 0.0
         self.attack_cooldown = 0.0
 
+        # level of detail (per-sprite path; MonsterBatch keeps its own)
+        self.lod_dt = 0.0
+        self.lod_ticks = 0
+
+    def kill(self):
+        super().kill()
+        if self.batch:
+            self.batch.remove(self)
+        if self.pool:
+            self.pool.release(self)
+
     # ===== SETUP HELPERS =====
     def load_animations(self, enemy_type):
         animations = {"left": [], "right": []}
@@ -79,8 +114,7 @@ class Monster(pygame.sprite.Sprite):
             for i in range(self.frames_count):
                 path = f"{MONSTERS_PATH}/{enemy_type}/{direction}/{i}.png"
                 try:
-                    img = pygame.image.load(path).convert_alpha()
-                    img = pygame.transform.scale(img, self.size)
+                    img = asset_manager.image(path, self.size)
 
                 except Exception:
                     # ✅ fallback ONLY if image fails
@@ -107,8 +141,8 @@ class Monster(pygame.sprite.Sprite):
 
     def random_direction(self):
         direction = pygame.math.Vector2(
-            randint(-1, 1),
-            randint(-1, 1)
+            self.rng.randint(-1, 1),
+            self.rng.randint(-1, 1)
         )
         return direction.normalize() if direction.length() else direction
 
@@ -120,10 +154,22 @@ class Monster(pygame.sprite.Sprite):
             self.change_dir_timer = 0.0
 
     def chase(self, target_pos):
+        # follow the flow field around walls, beeline once close
+        field = self.map_system.navigation.field(self.player)
+        step = field.direction_at(self.rect.center) if field else None
+        if step:
+            self.direction = pygame.math.Vector2(step)
+            return
+
         direction = target_pos - pygame.math.Vector2(self.rect.center)
         if direction.length():
             self.direction = direction.normalize()
 
+    def is_chasing(self):
+        if self.batch:
+            return bool(self.batch.store['chasing'][self.slot])
+        return self.state == "chase"
+
     def update_state(self, distance):
         if distance <= DETECTION_RANGE:
             self.state = "chase"
@@ -136,14 +182,17 @@ class Monster(pygame.sprite.Sprite):
             return
         
         movement = self.direction * self.speed * dt
+        self.move_by(movement.x, movement.y, self.player)
 
-        self.axis_move(movement.x, 0)
-        self.axis_move(0, movement.y)
+    def move_by(self, dx, dy, player=None):
+        """Slide by (dx, dy) against the map and get pushed out of the player"""
+        self.axis_move(dx, 0)
+        self.axis_move(0, dy)
 
         self.keep_within_bounds()
 
-        if self.player and self.hitbox_rect.colliderect(self.player.hitbox_rect):
-            repulsion = pygame.math.Vector2(self.hitbox_rect.center) - pygame.math.Vector2(self.player.hitbox_rect.center)
+        if player and self.hitbox_rect.colliderect(player.hitbox_rect):
+            repulsion = pygame.math.Vector2(self.hitbox_rect.center) - pygame.math.Vector2(player.hitbox_rect.center)
             if repulsion.length():
                 self.hitbox_rect.center += repulsion.normalize() * 2  # repulsion strength (adjustable)
                 self.rect.center = self.hitbox_rect.center
@@ -154,16 +203,16 @@ class Monster(pygame.sprite.Sprite):
         self.hitbox_rect.x += dx
         self.hitbox_rect.y += dy
 
-        for sprite in self.map_collision_sprites:
-            if self.hitbox_rect.colliderect(sprite.rect):
+        for rect in self.map_system.query_rect(self.hitbox_rect):
+            if self.hitbox_rect.colliderect(rect):
                 if dx > 0:
-                    self.hitbox_rect.right = sprite.rect.left
+                    self.hitbox_rect.right = rect.left
                 elif dx < 0:
-                    self.hitbox_rect.left = sprite.rect.right
+                    self.hitbox_rect.left = rect.right
                 if dy > 0:
-                    self.hitbox_rect.bottom = sprite.rect.top
+                    self.hitbox_rect.bottom = rect.top
                 elif dy < 0:
-                    self.hitbox_rect.top = sprite.rect.bottom
+                    self.hitbox_rect.top = rect.bottom
 
     def keep_within_bounds(self):
         self.hitbox_rect.left = max(WORLD_LEFT, self.hitbox_rect.left)
@@ -193,8 +242,55 @@ class Monster(pygame.sprite.Sprite):
 
     def set_alpha(self, alpha):
         self.alpha = alpha
-        self.image = self.base_image.copy()
-        self.image.set_alpha(self.alpha)
+        self.refresh_image()
+
+    def refresh_image(self):
+        """Point image at the cached frame for the current facing, frame and fade level"""
+        top = MONSTER_ALPHA_LEVELS - 1
+        level = round(self.alpha * top / 255)
+        key = (self.direction_facing, self.current_frame, level)
+        if key == self.image_key:
+            return
+
+        image = self.alpha_frames.get(key)
+        if image is None:
+            image = self.animations[self.direction_facing][self.current_frame]
+            if level < top:
+                image = image.copy()
+                image.set_alpha(round(level * 255 / top))
+            self.alpha_frames[key] = image
+
+        self.image = image
+        self.image_key = key
+
+    def try_attack(self, player):
+        """Damage and bounce off a player whose hitbox this monster touches"""
+        if (
+            not self.alive
+            or player.is_dead
+            or player.is_invincible
+            or self.attack_cooldown > 0
+            or not self.hitbox_rect.colliderect(player.hitbox_rect)
+        ):
+            return False
+
+        self.attack(player)
+        self.attack_cooldown = 1.0
+        return True
+
+    def attack(self, player):
+        """Deal contact damage and get knocked back (cooldown is up to the caller)"""
+        player.take_damage(self.damage)
+
+        # push monsters away
+        push_vector = pygame.math.Vector2(self.hitbox_rect.center) - pygame.math.Vector2(player.hitbox_rect.center)
+        if push_vector.length() == 0:
+            push_vector = pygame.math.Vector2(self.rng.randint(-1,1), self.rng.randint(-1,1))
+        if push_vector.length() == 0:
+            push_vector = pygame.math.Vector2(1, 0)
+        push_vector = push_vector.normalize() * 20 # push/knockback strength (adjustable)
+        self.hitbox_rect.center += push_vector
+        self.rect.center = self.hitbox_rect.center
 
     def take_damage(self, amount):
         self.health -= amount
@@ -217,11 +313,26 @@ class Monster(pygame.sprite.Sprite):
             self.animation_timer = 0.0
 
         self.base_image = self.animations[self.direction_facing][self.current_frame]
-        self.image = self.base_image.copy()
-        self.image.set_alpha(self.alpha)
+        self.refresh_image()
 
     # ===== UPDATE =====
+    def coarse_update(self, dt, distance):
+        """Far from the player: one bigger wander step every LOD_FAR_INTERVAL ticks, no fade or animation"""
+        self.lod_dt += dt
+        self.lod_ticks += 1
+        if self.lod_ticks % LOD_FAR_INTERVAL:
+            return
+
+        dt, self.lod_dt = self.lod_dt, 0.0
+        self.update_state(distance)
+        self.wander(dt)
+        self.move(dt)
+        self.rect.center = self.hitbox_rect.center
+
     def update(self, dt):
+        if self.batch:
+            return  # stepped by MonsterBatch
+
         if not self.alive:
             self.kill()
             return
@@ -229,10 +340,34 @@ class Monster(pygame.sprite.Sprite):
         if self.attack_cooldown > 0:
             self.attack_cooldown -= dt
 
+        if self.player is None:
+            # no target (player is respawn-protected): just drift around, in the same LOD tiers
+            if self.focus is not None:
+                distance = pygame.math.Vector2(self.focus.rect.center).distance_to(self.rect.center)
+                if distance > LOD_FAR_DISTANCE:
+                    return  # dormant
+                if distance > LOD_NEAR_DISTANCE:
+                    self.coarse_update(dt, distance)
+                    return
+            self.lod_dt = 0.0
+            self.wander(dt)
+            self.move(dt)
+            self.update_animation(dt)
+            self.rect.center = self.hitbox_rect.center
+            return
+
         player_pos = pygame.math.Vector2(self.player.rect.center)
         enemy_pos = pygame.math.Vector2(self.rect.center)
         distance = player_pos.distance_to(enemy_pos)
 
+        if distance > LOD_FAR_DISTANCE:
+            return  # dormant until the player comes back
+
+        if distance > LOD_NEAR_DISTANCE:
+            self.coarse_update(dt, distance)
+            return
+        self.lod_dt = 0.0
+
         self.update_state(distance)
 
         if self.player.is_invincible or self.player.is_dead:
@@ -246,25 +381,6 @@ class Monster(pygame.sprite.Sprite):
         self.move(dt)
         self.keep_within_bounds()
 
-        if (
-            not self.player.is_dead
-            and not self.player.is_invincible
-            and self.hitbox_rect.colliderect(self.player.hitbox_rect)
-            and self.attack_cooldown <= 0
-        ):
-            
-            if self.hitbox_rect.colliderect(self.player.hitbox_rect) and self.attack_cooldown <= 0:
-                self.player.take_damage(self.damage)
-                self.attack_cooldown = 1.0
-
-                # push monsters away
-                push_vector = pygame.math.Vector2(self.hitbox_rect.center) - pygame.math.Vector2(self.player.hitbox_rect.center)
-                if push_vector.length() == 0:
-                    push_vector = pygame.math.Vector2(randint(-1,1), randint(-1,1))
-                push_vector = push_vector.normalize() * 20 # push/knockback strength (adjustable)
-                self.hitbox_rect.center += push_vector
-                self.rect.center = self.hitbox_rect.center
-
         self.update_animation(dt)
 
         self.rect.center = self.hitbox_rect.center
@@ -2,6 +2,8 @@
 import pygame
 from os.path import join
 from game.config import *
+from game.assets import asset_manager
+from game.controls import PlayerInput
 from entities.torpedo import Torpedo
 import os
 
@@ -23,7 +25,7 @@ class Player(pygame.sprite.Sprite):
     def __init__(self, 
             pos, 
             group, 
-            collision_sprites, 
+            map_system, 
             visible_sprites, 
             map_width, 
             map_height, 
@@ -35,12 +37,15 @@ class Player(pygame.sprite.Sprite):
         # references
         self.game_ref = game_ref
         self.visible_sprites = visible_sprites
-        self.collision_sprites = collision_sprites
+        self.map_system = map_system
         self.obstacle_group = obstacle_group
 
         self.explosion_frames = game_ref.explosion_frames if game_ref else []
         self.explosion_group = game_ref.explosion_group if game_ref else None
 
+        # timers read the world's simulation clock (wall clock without a GameState)
+        self.clock = game_ref.clock if game_ref else pygame.time
+
         # movement & direction
         self.direction = pygame.math.Vector2()
         self.last_horizontal = 'right'
@@ -55,7 +60,7 @@ class Player(pygame.sprite.Sprite):
 
         self.hp_regen_rate = 0.0
         self.last_damage_time = 0
-        self.last_hit_time = 0
+        self.last_hit_time = -TAKE_DAMAGE_CD # timers start ready: the simulation clock begins at 0
         self.hit_cooldown = TAKE_DAMAGE_CD
         self.is_hit = False
         self.hit_timer = 0.0
@@ -91,7 +96,7 @@ class Player(pygame.sprite.Sprite):
         
         # torpedoes
         self.torpedo_cooldown = TORPEDO_COOLDOWN
-        self.last_torpedo_time = 0
+        self.last_torpedo_time = -TORPEDO_COOLDOWN * 1000
 
         # sonar activation
         self.sonar_level_required = SONAR_LEVEL_REQUIRED
@@ -106,7 +111,7 @@ class Player(pygame.sprite.Sprite):
         # portal interaction
         self.current_portal = None
         self.portal_interaction_radius = 100
-        self.last_portal_time = -9999
+        self.last_portal_time = -PORTAL_COOLDOWN
         self.portal_cooldown = PORTAL_COOLDOWN
 
         # world bounds
@@ -124,26 +129,26 @@ class Player(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=pos)
         self.hitbox_rect = self.rect.copy()
 
+        # input for the current step (set by GameState from its controls)
+        self.current_input = PlayerInput()
+
         # crosshair & aiming
         self.crosshair_length = 50 # pixels
         self.crosshair_pos = pygame.math.Vector2(self.rect.center)
         self.aim_direction = pygame.math.Vector2(1, 0)
 
         # load audio
-        # in Player.__init__
-        self.sounds = game_ref.sounds if game_ref else {}
-
         sound_folder = os.path.join(PROJECT_ROOT, "subnautic_shooter", "assets", "audio", "sound_effects")
 
-        self.sounds = {
-            'torpedo_launch': pygame.mixer.Sound(os.path.join(sound_folder, "projectile_launch.mp3")),
-            'damage': pygame.mixer.Sound(os.path.join(sound_folder, "damage.mp3")),
-            'low_health': pygame.mixer.Sound(os.path.join(sound_folder, "low_health.mp3")),
-            'sonar_ping': pygame.mixer.Sound(os.path.join(sound_folder, "sonar_ping.mp3")),
-            'respawn': pygame.mixer.Sound(os.path.join(sound_folder, "respawn.mp3")),
-            'teleport': pygame.mixer.Sound(os.path.join(sound_folder, "teleport.mp3")),
-            'im_back': pygame.mixer.Sound(os.path.join(sound_folder, "im_back.mp3"))
-        }
+        self.sounds = asset_manager.sound_map({
+            'torpedo_launch': os.path.join(sound_folder, "projectile_launch.mp3"),
+            'damage': os.path.join(sound_folder, "damage.mp3"),
+            'low_health': os.path.join(sound_folder, "low_health.mp3"),
+            'sonar_ping': os.path.join(sound_folder, "sonar_ping.mp3"),
+            'respawn': os.path.join(sound_folder, "respawn.mp3"),
+            'teleport': os.path.join(sound_folder, "teleport.mp3"),
+            'im_back': os.path.join(sound_folder, "im_back.mp3")
+        })
 
         self.update_hp_regen_rate()
 
@@ -153,12 +158,11 @@ class Player(pygame.sprite.Sprite):
         if self.is_dead: # no input while dead
             return
         
-        keys = pygame.key.get_pressed()
-        mouse_buttons = pygame.mouse.get_pressed()
+        controls = self.current_input
 
         # movement (WASD)
-        x_input = int(keys[pygame.K_d]) - int(keys[pygame.K_a])
-        y_input = int(keys[pygame.K_s]) - int(keys[pygame.K_w])
+        x_input = controls.move_x
+        y_input = controls.move_y
         self.direction.x = x_input
         self.direction.y = y_input
 
@@ -169,7 +173,7 @@ class Player(pygame.sprite.Sprite):
             self.direction = self.direction.normalize()
 
         # boost (Lshift)
-        if keys[pygame.K_LSHIFT] and self.power > 0:
+        if controls.boost and self.power > 0:
             self.speed = self.boost_speed
             self.power -= self.boost_cost * dt
             self.power = max(0, self.power)
@@ -178,15 +182,15 @@ class Player(pygame.sprite.Sprite):
 
         # torpedo launching (left click or space)
         can_fire = self.power >= self.torpedo_cost
-        current_time = pygame.time.get_ticks()
-        if (mouse_buttons[0] or keys[pygame.K_SPACE]) and can_fire:
+        current_time = self.clock.get_ticks()
+        if controls.fire and can_fire:
             # check cooldown
             if current_time - self.last_torpedo_time >= self.torpedo_cooldown * 1000:
                 self.launch_torpedo()
                 self.last_torpedo_time = current_time
 
         # sonar activation (F)
-        if keys[pygame.K_f]:
+        if controls.sonar:
             self.activate_sonar()
 
     def move(self, dt):
@@ -203,18 +207,18 @@ class Player(pygame.sprite.Sprite):
         self.update_animation(dt)
 
     def collision(self, direction):
-            for sprite in self.collision_sprites:
-                if self.hitbox_rect.colliderect(sprite.rect):
+            for rect in self.map_system.query_rect(self.hitbox_rect):
+                if self.hitbox_rect.colliderect(rect):
                     if direction == "horizontal":
                         if self.direction.x > 0:
-                            self.hitbox_rect.right = min(self.hitbox_rect.right, sprite.rect.left)
+                            self.hitbox_rect.right = min(self.hitbox_rect.right, rect.left)
                         elif self.direction.x < 0:
-                            self.hitbox_rect.left = max(self.hitbox_rect.left, sprite.rect.right)
+                            self.hitbox_rect.left = max(self.hitbox_rect.left, rect.right)
                     elif direction == "vertical":
                         if self.direction.y > 0:
-                            self.hitbox_rect.bottom = min(self.hitbox_rect.bottom, sprite.rect.top)
+                            self.hitbox_rect.bottom = min(self.hitbox_rect.bottom, rect.top)
                         elif self.direction.y < 0:
-                            self.hitbox_rect.top = max(self.hitbox_rect.top, sprite.rect.bottom)
+                            self.hitbox_rect.top = max(self.hitbox_rect.top, rect.bottom)
             self.rect.center = self.hitbox_rect.center
 
     def keep_within_bounds(self):
@@ -238,12 +242,14 @@ class Player(pygame.sprite.Sprite):
             direction = pygame.math.Vector2(1, 0)
         direction = direction.normalize()
 
-        torpedo = Torpedo(
+        pool = getattr(self.game_ref, 'torpedo_pool', None)
+        spawn = pool.acquire if pool else Torpedo
+        torpedo = spawn(
             pos=self.rect.center,
             direction=direction,
             player_facing=self.last_horizontal,
             group=self.visible_sprites,
-            collision_sprites=self.collision_sprites,
+            map_system=self.map_system,
             explosion_frames=self.explosion_frames,
             explosion_group=self.explosion_group,
             monster_group=self.game_ref.enemy_sprites,
@@ -271,7 +277,7 @@ class Player(pygame.sprite.Sprite):
         if self.is_dead: # Can't activate sonar while dead
             return False 
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         
         # Check requirements
         if self.level < self.sonar_level_required:
@@ -306,7 +312,17 @@ class Player(pygame.sprite.Sprite):
         closest_portal = None
         closest_distance = float('inf')
 
-        for portal in portal_group:
+        if self.game_ref and hasattr(self.game_ref, 'entity_grid'):
+            nearby = self.game_ref.entity_grid.query_around(
+                self.rect.center,
+                self.portal_interaction_radius + BROADPHASE_MARGIN
+            )
+        else:
+            nearby = portal_group.sprites()
+
+        for portal in nearby:
+            if portal not in portal_group:
+                continue
             # calculate distance to portal
             player_pos = pygame.math.Vector2(self.rect.center)
             portal_pos = pygame.math.Vector2(portal.rect.center)
@@ -327,7 +343,7 @@ class Player(pygame.sprite.Sprite):
         if self.is_invincible or self.is_dead:
             return
         
-        current = pygame.time.get_ticks()
+        current = self.clock.get_ticks()
         if current - self.last_hit_time > self.hit_cooldown:
             self.health -= amount
             self.is_hit = True
@@ -338,14 +354,14 @@ class Player(pygame.sprite.Sprite):
         if "damage" in self.sounds:
             self.sounds['damage'].play()
 
-            if self.health <= 0:
-                self.die()
+        if self.health <= 0:
+            self.die()
 
     def regenerate_hp(self, dt):
         if self.is_dead or self.health >= self.max_health:
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         time_since_damage = (current_time - self.last_damage_time) / 1000.0
 
         # wait before regen
@@ -408,8 +424,8 @@ class Player(pygame.sprite.Sprite):
             self.image.set_alpha(100) # make semi-transparent
             print('Player Died!')
 
-            if self.game_ref and hasattr(self.game_ref, 'player_respawn'):
-                self.game_ref.player_respawn.start_respawn()
+            if self.game_ref and hasattr(self.game_ref, 'respawn_system'):
+                self.game_ref.respawn_system.start_respawn()
 
     def respawn(self, pos):
         """Respawn player at specific position"""
@@ -424,8 +440,8 @@ class Player(pygame.sprite.Sprite):
     def start_invincibility(self):
         """Start invincibility after respawn"""
         self.is_invincible = True
-        self.invincibility_timer = pygame.time.get_ticks()
-        self.last_flash_time = pygame.time.get_ticks()
+        self.invincibility_timer = self.clock.get_ticks()
+        self.last_flash_time = self.clock.get_ticks()
         self.flash_visible = True
         print("Invincible")
 
@@ -435,7 +451,7 @@ class Player(pygame.sprite.Sprite):
             self.image.set_alpha(255)
             return
         
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
         elapsed = (current_time - self.invincibility_timer) / 1000.0
         
         # end invincibility after protection time
@@ -467,7 +483,7 @@ class Player(pygame.sprite.Sprite):
                 for i in range(4):
                     # frame_path = join('assets/images/player', folder, f'{i}.png')
                     frame_path = join(PLAYER_ASSETS, folder, f'{i}.png')
-                    frame = pygame.image.load(frame_path).convert_alpha()
+                    frame = asset_manager.image(frame_path)
                     frames.append(frame)
                 self.animations[folder] = frames
             except Exception as e:
@@ -513,11 +529,15 @@ class Player(pygame.sprite.Sprite):
             self.animation_frame = 0
         self.image = self.animations[self.current_animation][self.animation_frame]
 
-    def draw_trajectory(self, screen, camera_offset, dt):
-        """Draw player crosshair line from player to mouse position"""
-        self.update_mouse_aim(camera_offset) # to update mouse aim
+    def draw_trajectory(self, screen, camera_offset, dt, center=None):
+        """Draw player crosshair line from player towards the aim direction
 
-        player_screen_pos = pygame.math.Vector2(self.rect.center) - camera_offset
+        center is the world position to draw from (the interpolated one), rect.center by default.
+        """
+        center = pygame.math.Vector2(center if center is not None else self.rect.center)
+        self.crosshair_pos = center + self.aim_direction * self.crosshair_length
+
+        player_screen_pos = center - camera_offset
         cross_screen_pos = self.crosshair_pos - camera_offset
 
         # crosshair line
@@ -528,18 +548,13 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.circle(screen, (CROSSHAIR_COLOR), cross_screen_pos, 6, 1)
         pygame.draw.circle(screen, (CROSSHAIR_COLOR), cross_screen_pos, 2)
 
-    def update_mouse_aim(self, camera_offset):
-        """Update crosshair position based on mouse cursor"""
-        mouse_screen = pygame.mouse.get_pos()
-        mouse_world = pygame.math.Vector2(mouse_screen) + camera_offset
-
-        direction = mouse_world - pygame.math.Vector2(self.rect.center)
-        if direction.length() == 0:
-            direction = pygame.math.Vector2(1, 0)
-
-        self.aim_direction = direction.normalize()
-        self.crosshair_pos = (pygame.math.Vector2(self.rect.center
-                + self.aim_direction * self.crosshair_length))
+    def update_aim(self, aim):
+        """Aim along the input's direction (None or zero keeps the current aim)"""
+        if aim is None:
+            return
+        direction = pygame.math.Vector2(aim)
+        if direction.length():
+            self.aim_direction = direction.normalize()
 
     # ===== UPDATE =====
     def update(self, dt):
@@ -547,9 +562,9 @@ class Player(pygame.sprite.Sprite):
         self.power_regen(dt)
 
         if not self.is_dead:
+            self.update_aim(self.current_input.aim)
             self.input(dt)
             self.move(dt)
-            self.update_mouse_aim(pygame.math.Vector2(0, 0))
 
         if self.is_hit:
             self.hit_timer += dt
@@ -582,6 +597,6 @@ class Player(pygame.sprite.Sprite):
 
         # sonar duration
         if self.sonar_active:
-            elapsed = (pygame.time.get_ticks() - self.sonar_start_time) / 1000.0
+            elapsed = (self.clock.get_ticks() - self.sonar_start_time) / 1000.0
             if elapsed >= self.sonar_duration:
                 self.sonar_active = False
@@ -1,6 +1,5 @@
 # entities/player_respawn.py
 import pygame
-from random import shuffle
 from game.config import *
 
 class RespawnSystem:
@@ -8,10 +7,11 @@ class RespawnSystem:
     def __init__(self, game_state):
         self.game_state = game_state
         self.player = game_state.player
+        self.clock = game_state.clock
         
         # respawn points
         self.respawn_points = RESPAWN_POINTS[:]  
-        shuffle(self.respawn_points)  # shuffle for fun
+        game_state.rng.shuffle(self.respawn_points)  # shuffle for fun
         self.current_respawn_index = 0
         
         # respawn state
@@ -27,7 +27,7 @@ class RespawnSystem:
     # ===== RESPAWN LOGIC =====
     def get_safe_respawn_point(self):
         monsters = self.game_state.enemy_sprites
-        collision_sprites = self.game_state.collision_sprites
+        map_system = self.game_state.map_system
 
         for _ in range(len(self.respawn_points)):
             point = pygame.math.Vector2(self.respawn_points[self.current_respawn_index])
@@ -41,8 +41,8 @@ class RespawnSystem:
             if safe:
                 temp_rect = self.player.rect.copy()
                 temp_rect.center = point
-                for sprite in collision_sprites:
-                    if temp_rect.colliderect(sprite.rect):
+                for rect in map_system.query_rect(temp_rect):
+                    if temp_rect.colliderect(rect):
                         safe = False
                         break
 
@@ -57,7 +57,7 @@ class RespawnSystem:
         """Start the respawn process"""
         if not self.is_respawning and self.player.health <= 0:
             self.is_respawning = True
-            self.respawn_timer = pygame.time.get_ticks()
+            self.respawn_timer = self.clock.get_ticks()
             print(f"Respawning in {RESPAWN_DELAY} seconds...")
     
     def execute_respawn(self, current_time):
@@ -98,7 +98,7 @@ class RespawnSystem:
     # ===== UPDATE & DEBUG =====
 
     def update(self, dt):
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock.get_ticks()
 
             if self.is_respawning:
                 elapsed = (current_time - self.respawn_timer) / 1000
@@ -120,7 +120,7 @@ class RespawnSystem:
         if not self.waiting_for_respawn:
             return
 
-        elapsed = (pygame.time.get_ticks() - self.respawn_timer) / 1000
+        elapsed = (self.clock.get_ticks() - self.respawn_timer) / 1000
         remaining = max(0, RESPAWN_DELAY - elapsed)
 
         text = f"Respawning in: {remaining:.1f}s"
@@ -2,9 +2,7 @@
 import pygame
 from os.path import join
 from game.config import *
-
-portal_network_created = False
-existing_portal_group = None
+from game.assets import asset_manager
 
 
 class PortalNode:
@@ -32,8 +30,7 @@ class Portal(pygame.sprite.Sprite):
         self.frames = []
         for i in range(6):
             try:
-                frame = pygame.image.load(join(PORTAL_PATH, f'{i}.png')).convert_alpha()
-                frame = pygame.transform.scale(frame, (width, height))
+                frame = asset_manager.image(join(PORTAL_PATH, f'{i}.png'), (width, height))
             except:
                 frame = pygame.Surface((width, height), pygame.SRCALPHA)
                 color = [(150, 50, 250), (50, 150, 250), (250, 50, 150), (50, 250, 150)][node.portal_index % 4]
@@ -92,12 +89,7 @@ class Portal(pygame.sprite.Sprite):
 
 # ===== PORTAL NETWORK =====
 def create_portal_network(visible_sprites, camera, game_ref):
-    """Create circular doubly-linked portal network with sprites."""
-    global portal_network_created, existing_portal_group
-
-    if portal_network_created and existing_portal_group:
-        return existing_portal_group
-
+    """Create circular doubly-linked portal network with sprites (one per GameState)."""
     portal_group = pygame.sprite.Group()
     nodes = []
 
@@ -116,8 +108,6 @@ def create_portal_network(visible_sprites, camera, game_ref):
     for node in nodes:
         Portal(node, visible_sprites, portal_group, camera, game_ref)
 
-    portal_network_created = True
-    existing_portal_group = portal_group
     return portal_group
 
 
@@ -128,8 +118,8 @@ def check_portal_collisions(portal_group, player, current_time):
     if not player.current_portal:
         return
 
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_e]:
+    controls = player.current_input
+    if controls.portal_next:
         player.current_portal.try_teleport(player, "next", current_time)
-    elif keys[pygame.K_q]:
+    elif controls.portal_prev:
         player.current_portal.try_teleport(player, "prev", current_time)
@@ -4,6 +4,7 @@ import pygame
 from os.path import join
 import math
 from game.config import *
+from game.assets import asset_manager
 from entities.explosion import AnimatedExplosion
 
 PROJECT_ROOT = os.path.dirname(
@@ -20,6 +21,49 @@ PLAYER_ASSETS = join(
     "player"
 )
 
+SOUND_FOLDER = join(PROJECT_ROOT, "subnautic_shooter", "assets", "audio", "sound_effects")
+
+
+def load_torpedo_frames(torpedo_folder):
+    """Load the 5 torpedo frames for one facing (shared by all torpedoes)"""
+    frames = []
+    for i in range(5):
+        try:
+            frame = asset_manager.image(join(torpedo_folder, f'{i}.png'))
+            frames.append(frame)
+        except Exception as e:
+            print(f"Error loading torpedo frame {i}: {e}")
+            frame = pygame.Surface((20, 8), pygame.SRCALPHA)
+            pygame.draw.rect(frame, (50, 150, 200), (0, 0, 20, 8))
+            pygame.draw.rect(frame, (100, 200, 255), (2, 2, 16, 4))
+            frames.append(frame)
+    return frames
+
+
+def build_rotation_atlas(frames, steps):
+    """Pre-rotate every frame at `steps` evenly spaced angles -> [frame][step] = (image, rect)"""
+    atlas = []
+    for frame in frames:
+        rotations = []
+        for step in range(steps):
+            image = pygame.transform.rotate(frame, -step * 360 / steps)
+            rotations.append((image, image.get_rect()))
+        atlas.append(rotations)
+    return atlas
+
+
+def torpedo_rotation_atlas(torpedo_folder, steps=TORPEDO_ROTATION_STEPS):
+    """Shared rotation atlas for one torpedo facing"""
+    frames = asset_manager.cached(
+        ('torpedo_frames', torpedo_folder),
+        lambda: load_torpedo_frames(torpedo_folder)
+    )
+    return asset_manager.cached(
+        ('torpedo_rotations', torpedo_folder, steps),
+        lambda: build_rotation_atlas(frames, steps)
+    )
+
+
 class Torpedo(pygame.sprite.Sprite):
     """Handles torpedo movement states, animation, trigger explosion animation, collision detection"""
 
@@ -29,7 +73,7 @@ class Torpedo(pygame.sprite.Sprite):
         direction,
         player_facing,
         group,
-        collision_sprites,
+        map_system,
         explosion_frames,
         explosion_group,
         monster_group,
@@ -40,6 +84,55 @@ class Torpedo(pygame.sprite.Sprite):
         owner
     ):
         super().__init__(group)
+        self.pool = None
+        self.in_pool = False
+
+        self.sounds = asset_manager.sound_map({
+            'torpedo_hit': join(SOUND_FOLDER, "projectile_hit.mp3")
+        })
+
+        # movement tuning
+        self.drop_duration = TORPEDO_DROP_DURATION
+        self.float_duration = TORPEDO_FLOAT_DURATION
+        self.accel_duration = TORPEDO_ACCEL_DURATION
+        self.drop_speed = TORPEDO_DROP_SPEED
+        self.float_speed = TORPEDO_FLOAT_SPEED
+        self.max_speed = TORPEDO_SPEED
+        self.acceleration = TORPEDO_ACCELERATION
+        self.torpedo_damage_radius = TORPEDO_DAMAGE_RADIUS
+
+        # movement & physics (reused across resets)
+        self.pos = pygame.math.Vector2()
+        self.velocity = pygame.math.Vector2()
+        self.gravity = pygame.math.Vector2(0, 0.15)
+        self.drag = 0.995
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.z_layer = 2
+
+        self.reset(
+            pos, direction, player_facing, group, map_system, explosion_frames,
+            explosion_group, monster_group, obstacle_group, visible_sprites,
+            game_ref, damage, owner
+        )
+
+    def reset(
+        self,
+        pos,
+        direction,
+        player_facing,
+        group,
+        map_system,
+        explosion_frames,
+        explosion_group,
+        monster_group,
+        obstacle_group,
+        visible_sprites,
+        game_ref,
+        damage,
+        owner
+    ):
+        """(Re)launch the torpedo; used by the torpedo pool"""
+        self.add(group)
         self.monster_group = monster_group
         self.owner = owner
 
@@ -56,12 +149,6 @@ class Torpedo(pygame.sprite.Sprite):
         self.current_direction = self.drop_direction.copy()
         self.direction = self.drop_direction.copy()
 
-        sound_folder = os.path.join(PROJECT_ROOT, "subnautic_shooter", "assets", "audio", "sound_effects")
-
-        self.sounds = {
-            'torpedo_hit': pygame.mixer.Sound(os.path.join(sound_folder, "projectile_hit.mp3"))
-        }
-
         # load frames based on direction
         if player_facing == 'left':
             torpedo_folder = RIGHT_TORPEDO_PATH
@@ -70,43 +157,16 @@ class Torpedo(pygame.sprite.Sprite):
             torpedo_folder = LEFT_TORPEDO_PATH
             self.image_facing_left = False
         
-        # load frames
-        self.frames = []
-        for i in range(5):
-            try:
-                frame = pygame.image.load(
-                    join(torpedo_folder, f'{i}.png')
-                ).convert_alpha()
-                self.frames.append(frame)
-            except Exception as e:
-                print(f"Error loading torpedo frame {i}: {e}")
-                frame = pygame.Surface((20, 8), pygame.SRCALPHA)
-                pygame.draw.rect(frame, (50, 150, 200), (0, 0, 20, 8))
-                pygame.draw.rect(frame, (100, 200, 255), (2, 2, 16, 4))
-                self.frames.append(frame)
-                
-        # preserve original frames for rotation
-        self.original_frames = []
-        for frame in self.frames:
-            self.original_frames.append(frame.copy())
-
-        # movement states
-        self.state = 'dropping'
-        self.state_timer = 0
-        self.drop_duration = TORPEDO_DROP_DURATION
-        self.float_duration = TORPEDO_FLOAT_DURATION
-        self.accel_duration = TORPEDO_ACCEL_DURATION
-        self.drop_speed = TORPEDO_DROP_SPEED
-        self.float_speed = TORPEDO_FLOAT_SPEED
-        self.max_speed = TORPEDO_SPEED
-        self.acceleration = TORPEDO_ACCELERATION
+        # pre-rotated frames shared by every torpedo with this facing
+        self.rotations = torpedo_rotation_atlas(torpedo_folder)
+        self.rotation_steps = len(self.rotations[0])
+        self.frames = [rotations[0][0] for rotations in self.rotations]
 
         # damage
         self.damage = damage
-        self.torpedo_damage_radius = TORPEDO_DAMAGE_RADIUS
         
         # collision & effects
-        self.collision_sprites = collision_sprites
+        self.map_system = map_system
         self.obstacle_group = obstacle_group
         self.explosion_frames = explosion_frames
         self.explosion_group = explosion_group
@@ -114,10 +174,8 @@ class Torpedo(pygame.sprite.Sprite):
         self.game_ref = game_ref
 
         # movement & physics
-        self.pos = pygame.math.Vector2(pos)  # must be first
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.gravity = pygame.math.Vector2(0, 0.15)
-        self.drag = 0.995
+        self.pos.update(pos)
+        self.velocity.update(0, 0)
 
         # Animation control
         self.frame_index = 0
@@ -125,20 +183,24 @@ class Torpedo(pygame.sprite.Sprite):
         self.animation_timer = 0
 
         # initial frame setup
-        self.image = self.get_current_frame()  # uses self.pos internally
-        self.rect = self.image.get_rect(center=self.pos)
+        self.image, rect = self.current_rotation()
+        self.rect.size = rect.size
+        self.rect.center = self.pos
 
         # state & collision flags
         self.state = 'dropping'
         self.state_timer = 0
         self.alive = True
         self.has_hit_something = False
-        self.z_layer = 2
+
+    def kill(self):
+        super().kill()
+        if self.pool:
+            self.pool.release(self)
 
     # ===== ANIMATIONS =====
-    def get_current_frame(self):
-        frame = self.original_frames[int(self.frame_index)]
-        
+    def current_rotation(self):
+        """(image, rect) for the current frame at the nearest pre-rotated angle"""
         if self.current_direction.length() > 0:
             # calculate the angle in radians first
             angle_rad = math.atan2(self.current_direction.y, self.current_direction.x)
@@ -153,15 +215,21 @@ class Torpedo(pygame.sprite.Sprite):
         else:
             angle_deg = 0
         
-        rotated_frame = pygame.transform.rotate(frame, -angle_deg)
-        return rotated_frame
+        step = round(angle_deg * self.rotation_steps / 360) % self.rotation_steps
+        return self.rotations[int(self.frame_index)][step]
+
+    def get_current_frame(self):
+        return self.current_rotation()[0]
 
     def create_explosion(self):
         """Spawn explosion animation at impact point."""
-        AnimatedExplosion(
+        pool = getattr(self.game_ref, 'explosion_pool', None)
+        spawn = pool.acquire if pool else AnimatedExplosion
+        spawn(
             self.explosion_frames,
             self.rect.center,
-            [self.explosion_group, self.visible_sprites]
+            [self.explosion_group, self.visible_sprites],
+            getattr(self.game_ref, 'explosion_system', None)
         )
 
     # ===== TORPEDO MOVEMENT =====
@@ -263,7 +331,17 @@ class Torpedo(pygame.sprite.Sprite):
 
         # monster splash damage
         if hasattr(self, 'monster_group') and self.monster_group:
-            for monster in self.monster_group:
+            if self.game_ref and hasattr(self.game_ref, 'entity_grid'):
+                nearby = self.game_ref.entity_grid.query_around(
+                    self.rect.center,
+                    self.torpedo_damage_radius + BROADPHASE_MARGIN
+                )
+            else:
+                nearby = self.monster_group.sprites()
+
+            for monster in nearby:
+                if monster not in self.monster_group:
+                    continue
                 monster_center = pygame.math.Vector2(monster.rect.center)
                 distance = torpedo_center.distance_to(monster_center)
 
@@ -275,11 +353,11 @@ class Torpedo(pygame.sprite.Sprite):
                     hit_any = True
         
         # check wall collision
-        if hasattr(self, 'collision_sprites'):
+        if self.map_system:
             hitbox = self.rect.inflate(-15, -15) 
             
-            for sprite in self.collision_sprites:
-                if hasattr(sprite, 'rect') and hitbox.colliderect(sprite.rect):
+            for rect in self.map_system.query_rect(hitbox):
+                if hitbox.colliderect(rect):
                     self.create_explosion()
                     self.has_hit_something = True
                     self.velocity.update(0, 0)
@@ -323,8 +401,9 @@ class Torpedo(pygame.sprite.Sprite):
         self.pos += self.velocity * dt
         
         # update image based on current frame and rotation
-        self.image = self.get_current_frame()
-        self.rect = self.image.get_rect(center=self.pos)
+        self.image, rect = self.current_rotation()
+        self.rect.size = rect.size
+        self.rect.center = self.pos
 
         if self.check_collision():
             self.alive = False
@@ -0,0 +1,185 @@
+# game/assets.py
+import io
+import os
+import threading
+
+import pygame
+
+
+class AssetManager:
+    """Loads every image and sound once and shares it between all users.
+
+    Images are keyed by (path, size, transform) where transform picks the
+    scaling filter ("smooth" for smoothscale). Failed loads are remembered
+    too, so a missing file is only touched once and callers can keep their
+    own fallback drawing in an except block.
+
+    In headless mode images are decoded but never converted (no display
+    needed) and sounds are never opened, so sound lookups just come back
+    empty (no audio device needed). Switching mode drops every cached
+    asset, since surfaces and what was built from them differ per mode.
+
+    Preloading only reads files on a worker thread; decoding, converting
+    and opening sounds (all SDL calls) stay on the main thread.
+    """
+
+    def __init__(self):
+        self.images = {}  # (path, size, transform) -> Surface
+        self.sounds = {}  # path -> Sound
+        self.derived = {}  # any other shared asset, see cached()
+        self.failed = {}  # key -> exception from the first failed load
+        self.headless = False
+
+        # background preloading (lock guards raw_files, the only state the worker touches)
+        self.raw_files = {}  # path -> file bytes read ahead, not yet decoded
+        self.lock = threading.Lock()
+        self.preload_thread = None
+
+    # ===== IMAGES =====
+    def image(self, path, size=None, transform=None):
+        """Converted (and optionally scaled) image, loaded on first use"""
+        path = os.path.abspath(path)
+        key = (path, tuple(size) if size else None, transform)
+
+        surface = self.images.get(key)
+        if surface is not None:
+            return surface
+        if key in self.failed:
+            raise self.failed[key]
+
+        try:
+            surface = self.load_image(path)
+            if size:
+                if transform == "smooth":
+                    surface = pygame.transform.smoothscale(surface, size)
+                else:
+                    surface = pygame.transform.scale(surface, size)
+        except (OSError, pygame.error) as e:
+            self.failed[key] = e
+            raise
+
+        self.images[key] = surface
+        return surface
+
+    def load_image(self, path):
+        """Full-size converted image, reusing a preloaded decode if there is one"""
+        key = (path, None, None)
+        surface = self.images.get(key)
+        if surface is not None:
+            return surface
+
+        data = self.take_preloaded(path)
+        if data is None:
+            raw = pygame.image.load(path)
+        else:
+            raw = pygame.image.load(io.BytesIO(data), path)  # path hints the format
+
+        surface = raw if self.headless else raw.convert_alpha()
+        self.images[key] = surface
+        return surface
+
+    # ===== SOUNDS =====
+    def sound(self, path):
+        """Shared Sound for path, or None if audio is unavailable"""
+        if self.headless or not pygame.mixer.get_init():
+            return None
+
+        path = os.path.abspath(path)
+        sound = self.sounds.get(path)
+        if sound is not None or path in self.failed:
+            return sound
+
+        data = self.take_preloaded(path)
+        try:
+            if data is None:
+                sound = pygame.mixer.Sound(path)
+            else:
+                sound = pygame.mixer.Sound(file=io.BytesIO(data))
+        except (OSError, pygame.error) as e:
+            print(f"Failed to load audio: {e}")
+            self.failed[path] = e
+            return None
+
+        self.sounds[path] = sound
+        return sound
+
+    def sound_map(self, paths):
+        """{name: Sound} for every path in {name: path} that loaded"""
+        sounds = {}
+        for name, path in paths.items():
+            sound = self.sound(path)
+            if sound is not None:
+                sounds[name] = sound
+        return sounds
+
+    def set_headless(self, headless=True):
+        """Switch to (or back from) display- and audio-free loading (server, bots, benchmarks)"""
+        if headless != self.headless:
+            self.clear()  # unconverted surfaces must not leak into a windowed game, or back
+        self.headless = headless
+
+    # ===== DERIVED ASSETS =====
+    def cached(self, key, factory):
+        """Build an asset (frame lists, lookup tables...) once and share it"""
+        value = self.derived.get(key)
+        if value is None:
+            value = factory()
+            self.derived[key] = value
+        return value
+
+    # ===== PRELOADING =====
+    def preload(self, image_paths=(), sound_paths=(), background=True):
+        """Read image and sound files ahead of time, on a worker thread by default"""
+        paths = [os.path.abspath(p) for p in (*image_paths, *sound_paths)]
+        if self.headless:
+            paths = [os.path.abspath(p) for p in image_paths]  # sounds are never opened
+
+        if not background:
+            self.preload_worker(paths)
+            return
+
+        self.preload_thread = threading.Thread(
+            target=self.preload_worker,
+            args=(paths,),
+            daemon=True
+        )
+        self.preload_thread.start()
+
+    def preload_worker(self, paths):
+        """Plain file reads only: no pygame/SDL calls happen off the main thread"""
+        for path in paths:
+            with self.lock:
+                done = path in self.raw_files
+            if done:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                continue  # the main thread will hit (and report) the same error
+            with self.lock:
+                self.raw_files[path] = data
+
+    def take_preloaded(self, path):
+        """File bytes read ahead for path (handed over once), or None"""
+        with self.lock:
+            return self.raw_files.pop(path, None)
+
+    def wait(self):
+        """Block until a background preload has finished"""
+        if self.preload_thread:
+            self.preload_thread.join()
+            self.preload_thread = None
+
+    def clear(self):
+        self.wait()
+        self.images.clear()
+        self.sounds.clear()
+        self.derived.clear()
+        self.failed.clear()
+        with self.lock:
+            self.raw_files.clear()
+
+
+# shared registry used by every scene
+asset_manager = AssetManager()
@@ -1,5 +1,8 @@
 # game/collision.py
 import pygame
+from array import array
+
+COLLISION_FORMAT = 2 # bump whenever compile_collision_rects splits the union differently (keys the map cache)
 
 class Tile(pygame.sprite.Sprite):
     """Simple tile sprite"""
@@ -10,9 +13,150 @@ class Tile(pygame.sprite.Sprite):
         self.z_layer = 0
 
 
-class CollisionSprite(pygame.sprite.Sprite):
-    """Invisible collision sprite"""
-    def __init__(self, pos, size, groups):
-        super().__init__(*groups)
-        self.rect = pygame.Rect(pos[0], pos[1], size[0], size[1])
-        self.image = pygame.Surface((size[0], size[1]), pygame.SRCALPHA)
+# ===== COLLISION COMPILATION =====
+def compile_collision_rects(rects, cell_size=128):
+    """Merge overlapping and adjacent rects into as few boxes as possible.
+
+    Coordinates are truncated to ints the same way pygame.Rect does. Every
+    box is grown into a maximal rectangle of the union (see grow_box), then
+    boxes that ended up inside another are dropped. The union of the boxes
+    is never changed, only how it is split up. Returns a flat array('i') of
+    x, y, w, h quads.
+    """
+    boxes = {(int(x), int(y), int(w), int(h)) for x, y, w, h in rects}
+    boxes = [box for box in boxes if box[2] > 0 and box[3] > 0]
+    if not boxes:
+        return array('i')
+
+    # the union on a grid cut along every box edge: filled[row][col], and by columns
+    xs = sorted({x for x, y, w, h in boxes} | {x + w for x, y, w, h in boxes})
+    ys = sorted({y for x, y, w, h in boxes} | {y + h for x, y, w, h in boxes})
+    column = {x: i for i, x in enumerate(xs)}
+    row = {y: i for i, y in enumerate(ys)}
+    filled = [bytearray(len(xs) - 1) for _ in range(len(ys) - 1)]
+    filled_t = [bytearray(len(ys) - 1) for _ in range(len(xs) - 1)]
+    cells = []
+    for x, y, w, h in boxes:
+        c0, c1, r0, r1 = column[x], column[x + w], row[y], row[y + h]
+        for r in range(r0, r1):
+            filled[r][c0:c1] = b'\x01' * (c1 - c0)
+        for c in range(c0, c1):
+            filled_t[c][r0:r1] = b'\x01' * (r1 - r0)
+        cells.append((c0, c1, r0, r1))
+
+    grown = {grow_box(filled, filled_t, *box) for box in cells}
+    boxes = [(xs[c0], ys[r0], xs[c1] - xs[c0], ys[r1] - ys[r0]) for c0, c1, r0, r1 in grown]
+    boxes = drop_contained(boxes, cell_size)
+
+    data = array('i')
+    for box in sorted(boxes, key=lambda b: (b[1], b[0])):
+        data.extend(box)
+    return data
+
+
+def grow_box(filled, filled_t, c0, c1, r0, r1):
+    """Push each side of a cell box outwards while the whole new row/column is filled.
+
+    Sides are tried right, left, down, up, over and over until none can
+    move, so the result is a maximal rectangle of the union containing the
+    box. Returns the grown (c0, c1, r0, r1).
+    """
+    rows, columns = len(filled), len(filled_t)
+    moved = True
+    while moved:
+        moved = False
+        column_span = b'\x01' * (r1 - r0)
+        while c1 < columns and filled_t[c1][r0:r1] == column_span:
+            c1 += 1
+            moved = True
+        while c0 > 0 and filled_t[c0 - 1][r0:r1] == column_span:
+            c0 -= 1
+            moved = True
+
+        row_span = b'\x01' * (c1 - c0)
+        while r1 < rows and filled[r1][c0:c1] == row_span:
+            r1 += 1
+            moved = True
+        while r0 > 0 and filled[r0 - 1][c0:c1] == row_span:
+            r0 -= 1
+            moved = True
+    return c0, c1, r0, r1
+
+
+def drop_contained(boxes, cell_size):
+    """Remove boxes that lie completely inside another box"""
+    grid = CollisionGrid(cell_size=cell_size)
+    grid.build(array('i', [v for box in boxes for v in box]))
+
+    kept = []
+    for box in boxes:
+        rect = pygame.Rect(box)
+        if not any(other != rect and other.contains(rect) for other in grid.query_rect(rect)):
+            kept.append(box)
+    return kept
+
+
+# ===== COLLISION QUERIES =====
+class CollisionGrid:
+    """Uniform grid over a compiled x, y, w, h array.
+
+    Cells hold box indices into the array and overlap tests read its ints
+    directly; a pygame.Rect is only built for each box a query returns.
+    """
+
+    def __init__(self, data=None, cell_size=128):
+        self.cell_size = cell_size
+        self.data = array('i')
+        self.cells = {}  # (cell_x, cell_y) -> list of box indices
+        if data is not None:
+            self.build(data)
+
+    def build(self, data):
+        """Bucket every box of data by the cells it overlaps"""
+        self.data = data
+        self.cells = {}
+        size = self.cell_size
+        cells = self.cells
+        for index in range(len(data) // 4):
+            x, y, w, h = data[index * 4:index * 4 + 4]
+            for cy in range(y // size, (y + h - 1) // size + 1):
+                for cx in range(x // size, (x + w - 1) // size + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [index]
+                    else:
+                        bucket.append(index)
+
+    def __len__(self):
+        return len(self.data) // 4
+
+    def query_rect(self, rect):
+        """Boxes overlapping rect, as pygame.Rects in array order"""
+        x, y, w, h = rect
+        size = self.cell_size
+        x1, y1 = int(x // size), int(y // size)
+        x2 = int((x + max(w, 1) - 1) // size)
+        y2 = int((y + max(h, 1) - 1) // size)
+        cells = self.cells
+
+        if x1 == x2 and y1 == y2:
+            candidates = cells.get((x1, y1), ())
+        else:
+            found = set()
+            for cy in range(y1, y2 + 1):
+                for cx in range(x1, x2 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        found.update(bucket)
+            candidates = sorted(found)
+
+        data = self.data
+        right, bottom = x + w, y + h
+        hits = []
+        for index in candidates:
+            i = index * 4
+            bx, by, bw, bh = data[i], data[i + 1], data[i + 2], data[i + 3]
+            if bx < right and x < bx + bw and by < bottom and y < by + bh:
+                hits.append(pygame.Rect(bx, by, bw, bh))
+        return hits
+
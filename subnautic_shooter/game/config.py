@@ -7,6 +7,11 @@ SCREEN_HEIGHT = 720
 TILE_SIZE = 16 # DO NOT CHANGE!!!
 BG_COLOR = '#4F42B5'
 
+# collision grid
+COLLISION_CELL_SIZE = TILE_SIZE * 8 # spatial hash cell for map collision queries
+ENTITY_CELL_SIZE = TILE_SIZE * 8 # per-frame grid for moving entities
+BROADPHASE_MARGIN = 16 # slack for entities that moved since the grid was built
+
 # world boundaries
 WORLD_LEFT = -6400
 WORLD_RIGHT = 6400
@@ -38,6 +43,20 @@ HP_REGEN_MAX = 5
 # monsters stats
 DETECTION_RANGE = 400
 LOSE_INTEREST_RANGE = 500
+MONSTER_ALPHA_LEVELS = 16 # fog fade steps cached per monster frame
+
+# chase navigation (flow field toward the player)
+NAV_CELL_SIZE = TILE_SIZE * 2 # walkability grid cell; blocked when any collision touches it
+NAV_FIELD_RADIUS = LOSE_INTEREST_RANGE // NAV_CELL_SIZE + 4 # cells searched around the player
+NAV_BEELINE_CELLS = 1 # this close to the player (in BFS steps) monsters head straight at it
+NAV_FIELD_CACHE = 16 # flow fields kept, by target cell; a player pacing between cells reuses them
+MONSTER_TICKS_PER_FRAME = 2 # monsters sit in two updated groups and always moved twice per frame; the batch keeps that pace
+MONSTER_BATCH_CAPACITY = 256 # initial rows in the NumPy monster batch, doubled when full
+
+# simulation level of detail, by distance to the player
+LOD_NEAR_DISTANCE = 1200 # full AI, fade and animation; covers the screen and SONAR_RANGE
+LOD_FAR_DISTANCE = 3200 # past this monsters are dormant (frozen until the player comes back)
+LOD_FAR_INTERVAL = 4 # far monsters take one coarse step every N ticks, without animation
 
 MONSTER_TYPES = {
     "angler_fish": {
@@ -109,6 +128,20 @@ MONSTER_SPAWN_RATIO = {
 MONSTER_SPAWN_INTERVAL = 30.0 # seconds
 MONSTER_COUNT_DIFFICULTY_SCALE = 0.25
 
+# population budget
+MONSTER_POPULATION_CAP = 120 # all types together
+MONSTER_TYPE_CAPS = {
+    "lamprey": 60,
+    "squid": 12,
+    "angler_fish": 45,
+    "sword_fish": 24
+}
+MONSTER_RECYCLE_DISTANCE = 2000 # idle monsters farther than this get moved to new spawns once capped
+SPAWN_FRAME_BUDGET = 1 / 60 # seconds; waves shrink while a frame's update + draw work takes longer than this
+SPAWN_FRAME_SMOOTHING = 0.05 # weight of the newest frame in the frame-cost average
+WAVE_REPORTS = False # print each wave's spawned / recycled / alive counts and spawn rate
+SPAWN_MIN_FACTOR = 0.25 # smallest fraction of a wave that still spawns under load
+
 # ===== TORPEDO =====
 # torpedo stats
 TORPEDO_SPEED = 1500
@@ -120,6 +153,7 @@ TORPEDO_DROP_SPEED = 30
 TORPEDO_FLOAT_SPEED = 10
 TORPEDO_ACCELERATION = 1000
 TORPEDO_DAMAGE_RADIUS = 80
+TORPEDO_ROTATION_STEPS = 64 # pre-rotated angles per frame
 
 # ===== SONAR =====
 # sonar stats
@@ -138,6 +172,7 @@ PLAYER_MAX_DAMAGE = 100
 # ===== CAMERA =====
 # camera
 SMOOTHING = 1
+INTERPOLATION_SNAP_DISTANCE = TILE_SIZE * 4 # moves longer than this in one step (teleports) are not blended
 
 # ===== FOG =====
 # fog effect
@@ -174,6 +209,30 @@ PORTAL_LINKED_LIST = [0, 1, 2, 3]  # Indices in navigation order
 PORTAL_COOLDOWN = 10000 # milliseconds
 PORTAL_RADIUS = 60  # collision radius
 
+# ===== OBJECT POOLS =====
+# max dead instances kept for reuse
+TORPEDO_POOL_SIZE = 32
+EXPLOSION_POOL_SIZE = 32
+MONSTER_POOL_SIZE = 128
+EXPLOSION_TICKS_PER_FRAME = 2 # explosions sit in two updated groups and always animated twice per frame
+
+# ===== REPLAY =====
+REPLAY_RECORDING = False # record single player matches; seeds the world, which turns adaptive spawning off
+REPLAY_DIR = 'replays' # relative to subnautic_shooter/, like the asset paths
+REPLAY_KEEP = 20 # newest recordings kept in REPLAY_DIR; older ones are deleted when a match starts
+REPLAY_KEYFRAME_INTERVAL = 600 # ticks between full snapshots (10 s at 60 ticks/s); seeking jumps between them
+REPLAY_CORPUS_DIR = 'assets/data/replays' # checked-in recordings (deaths, respawns...) that --verify must replay without desyncs
+
+# ===== PROFILER =====
+PROFILER_ENABLED = False # per-system timings (F3 in game turns them on with the overlay)
+PROFILER_WINDOW = 240 # frames kept for the rolling percentiles and the overlay graph
+PROFILER_GRAPH_MS = 1000 / FPS # overlay graph height; bars above it are clipped
+PROFILER_TRACE_MAX_EVENTS = 500_000 # trace stops growing past this (~50 MB of JSON)
+PROFILER_DIR = 'profiles' # F4 saves Chrome trace JSON here, relative to subnautic_shooter/
+
+# ===== TEXT CACHE =====
+TEXT_CACHE_SIZE = 256 # rendered text surfaces kept, least recently used are dropped
+
 # ===== COLORS =====
 # colors
 CROSSHAIR_COLOR = (199, 14, 32)
@@ -199,6 +258,10 @@ PORTAL_PATH = 'assets/images/portal'
 
 # ===== MAP PATH =====
 MAP_PATH = 'assets/data/map/subnautic_shooter_map.tmx'
+MAP_CACHE_DIR = 'assets/data/cache' # precompiled chunks + collision, rebuilt when the TMX changes
+MAP_CHUNK_SIZE = 512 # pixels, multiple of TILE_SIZE
+MAP_CHUNK_CACHE_LIMIT = 48 # chunks kept converted in memory, least recently drawn are evicted
+MAP_CLEAR_COLOR = (0, 0, 0) # colour the screen is cleared to under the map
 
 # ===== ICONS PATH =====
 SONAR_ICON_PATH = 'assets/images/icons/sonar_icon.png'
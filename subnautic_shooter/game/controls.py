@@ -0,0 +1,67 @@
+# game/controls.py
+import pygame
+
+
+class PlayerInput:
+    """What the player asked for during one simulation step"""
+
+    __slots__ = ('move_x', 'move_y', 'boost', 'fire', 'sonar', 'portal_next', 'portal_prev', 'aim')
+
+    def __init__(
+            self,
+            move_x=0,
+            move_y=0,
+            boost=False,
+            fire=False,
+            sonar=False,
+            portal_next=False,
+            portal_prev=False,
+            aim=None
+    ):
+        self.move_x = move_x  # -1, 0 or 1
+        self.move_y = move_y
+        self.boost = boost
+        self.fire = fire
+        self.sonar = sonar
+        self.portal_next = portal_next
+        self.portal_prev = portal_prev
+        self.aim = aim  # world-space (x, y) direction, None keeps the last aim
+
+
+class KeyboardControls:
+    """Local keyboard and mouse: WASD, Shift boost, Space/LMB fire, F sonar, E/Q portals"""
+
+    def __init__(self, camera):
+        self.camera = camera
+
+    def read(self, player):
+        keys = pygame.key.get_pressed()
+        mouse_buttons = pygame.mouse.get_pressed()
+
+        # aim from the player towards the cursor, in world space
+        aim = pygame.math.Vector2(pygame.mouse.get_pos()) + self.camera.offset
+        aim -= pygame.math.Vector2(player.rect.center)
+
+        return PlayerInput(
+            move_x=int(keys[pygame.K_d]) - int(keys[pygame.K_a]),
+            move_y=int(keys[pygame.K_s]) - int(keys[pygame.K_w]),
+            boost=bool(keys[pygame.K_LSHIFT]),
+            fire=bool(mouse_buttons[0] or keys[pygame.K_SPACE]),
+            sonar=bool(keys[pygame.K_f]),
+            portal_next=bool(keys[pygame.K_e]),
+            portal_prev=bool(keys[pygame.K_q]),
+            aim=(aim.x, aim.y) if aim.length() else None,
+        )
+
+
+class ScriptedControls:
+    """Input set from code (server, bots, benchmarks); read() returns the last one set"""
+
+    def __init__(self):
+        self.current = PlayerInput()
+
+    def set(self, player_input):
+        self.current = player_input
+
+    def read(self, player):
+        return self.current
@@ -0,0 +1,87 @@
+# game/entity_store.py
+try:
+    import numpy as np
+except ImportError:  # callers check EntityStore.available() and keep per-sprite updates
+    np = None
+
+
+class EntityStore:
+    """Struct-of-arrays component storage for one kind of entity.
+
+    Components are declared up front as {name: (row shape, dtype name)} and
+    each live entity owns one row in every column. Removing an entity moves
+    the last row into the hole, so live rows always sit in [0, count) and
+    systems can work on plain column slices (store['pos'] etc.). The object
+    owning a row (usually its sprite) has its row index kept in owner.slot.
+    """
+
+    def __init__(self, components, capacity=64):
+        self.components = components
+        self.columns = {}
+        self.owners = []  # slot -> owner
+        self.count = 0
+        self.capacity = 0
+        self.grow(capacity)
+
+    @staticmethod
+    def available():
+        return np is not None
+
+    # ===== STORAGE =====
+    def grow(self, capacity):
+        """Reallocate every column with room for capacity rows"""
+        for name, (shape, dtype) in self.components.items():
+            column = np.zeros((capacity,) + tuple(shape), dtype=dtype)
+            old = self.columns.get(name)
+            if old is not None:
+                column[:self.count] = old[:self.count]
+            self.columns[name] = column
+        self.capacity = capacity
+
+    def add(self, owner, **values):
+        """Append a row for owner; components not given start at zero"""
+        if self.count == self.capacity:
+            self.grow(self.capacity * 2)
+
+        slot = self.count
+        self.count += 1
+        self.owners.append(owner)
+        owner.slot = slot
+
+        for name, column in self.columns.items():
+            column[slot] = values.get(name, 0)
+        return slot
+
+    def remove(self, owner):
+        """Free owner's row by moving the last row into it"""
+        slot = owner.slot
+        last = self.count - 1
+
+        if slot != last:
+            for column in self.columns.values():
+                column[slot] = column[last]
+            moved = self.owners[last]
+            moved.slot = slot
+            self.owners[slot] = moved
+
+        self.owners.pop()
+        self.count -= 1
+        owner.slot = None
+
+    def clear(self):
+        for owner in self.owners:
+            owner.slot = None
+        self.owners.clear()
+        self.count = 0
+
+    # ===== ACCESS =====
+    def __getitem__(self, name):
+        """Live rows of one component (a view: writes go to the store)"""
+        return self.columns[name][:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def nbytes(self):
+        """Memory held by all columns (allocated capacity, not just live rows)"""
+        return sum(column.nbytes for column in self.columns.values())
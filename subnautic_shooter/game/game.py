@@ -2,6 +2,7 @@
 
 import pygame
 import os
+import random
 import sys
 
 # Get the current directory 
@@ -13,9 +14,12 @@ sys.path.insert(0, parent_dir)
 
 from game.config import *
 from game.gamestate import GameState
+from game.replay import ReplayRecorder, RecordingControls, replay_path
+from game.profiler import profiler
+from ui.profiler_overlay import ProfilerOverlay
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None, record=REPLAY_RECORDING):
         # ===== PYGAME SETUP =====
         pygame.init()
         pygame.mixer.init()
@@ -35,14 +39,31 @@ class Game:
         self.map_height = SCREEN_HEIGHT * 3
 
         # ===== GAME STATE =====
+        # recorded matches need a seeded (deterministic) world to replay
+        if record and seed is None:
+            seed = random.randrange(2 ** 31)
         self.gamestate = GameState(
             screen = self.screen,
             collision_sprites=self.collision_sprites,
             obstacle_group=self.obstacle_group,
             visible_sprites=self.visible_sprites,
-            explosion_group=self.explosion_group
+            explosion_group=self.explosion_group,
+            seed=seed
         )
 
+        # ===== REPLAY =====
+        self.recorder = None
+        if record:
+            self.recorder = ReplayRecorder(replay_path(seed), seed, 1 / FPS)
+            self.gamestate.controls = RecordingControls(
+                self.gamestate.controls, self.recorder, self.gamestate
+            )
+
+        # ===== PROFILER =====
+        # F3 shows per-system timings (and turns the profiler on), F4 starts / saves a trace
+        self.profiler_overlay = ProfilerOverlay(profiler, self.screen, self.gamestate.pool_stats)
+        self.show_profiler = False
+
     # def run(self):
     #     while self.running:
     #         dt = self.clock.tick(FPS) / 1000  # Delta time in seconds
@@ -64,13 +85,40 @@ class Game:
     def update(self, events, dt):
         for event in events:
             if event.type == pygame.QUIT:
+                if self.recorder:
+                    self.recorder.close()
                 return ("QUIT", None)
+            if event.type == pygame.KEYDOWN:
+                self.handle_debug_key(event.key)
         self.gamestate.update(dt)
         return None
 
+    def handle_debug_key(self, key):
+        if key == pygame.K_F3:
+            self.show_profiler = not self.show_profiler
+            if self.show_profiler:
+                profiler.enable()
+            else:
+                profiler.disable()
+        elif key == pygame.K_F4:
+            if profiler.tracing:
+                profiler.stop_trace()
+                if not self.show_profiler:
+                    profiler.disable()
+            else:
+                profiler.enable()
+                profiler.start_trace()
+
+    def set_interpolation(self, alpha):
+        """Render hook: blend world sprites between the last two fixed steps"""
+        self.gamestate.camera.interpolate(alpha)
+
     def draw(self, screen):
-        screen.fill((0, 0, 0))
+        screen.fill(MAP_CLEAR_COLOR)
         self.gamestate.draw(screen)
+        profiler.end_frame()
+        if self.show_profiler:
+            self.profiler_overlay.draw()
 
 def main():
     game = Game()
@@ -1,11 +1,26 @@
 # game/gamestate.py
 import pygame
+import random
+import struct
+import time
+import zlib
 from os.path import join
 
 from game.config import *
+from game.assets import asset_manager
 from game.map import MapSystem
+from game.spatial_hash import SpatialHash
+from game.pool import ObjectPool
+from game.controls import KeyboardControls, ScriptedControls
+from game.simulation import SimulationClock
+from game.snapshot import capture_state, restore_state
+from game.profiler import profiler
 
 from entities.player import Player
+from entities.torpedo import Torpedo, torpedo_rotation_atlas
+from entities.explosion import AnimatedExplosion, ExplosionSystem
+from entities.monsters import Monster
+from entities.monster_batch import MonsterBatch
 from entities.monster_spawner import MonsterSpawner
 from entities.camera import Camera
 from entities.player_respawn import RespawnSystem
@@ -14,7 +29,19 @@ from ui.hud import HUD
 from ui.world_ui import WorldUI
 
 class GameState:
-    """Main gameplay state."""
+    """Main gameplay state.
+
+    With headless=True the world runs without a display or audio device:
+    images are left unconverted, sounds are skipped, the map only loads
+    collision, no HUD or world UI is built and input comes from
+    ScriptedControls instead of the keyboard. draw() does nothing.
+
+    Randomness comes from one seeded RNG per world and timers from a
+    SimulationClock, so with a seed the world is deterministic: the same
+    seed and the same per-step inputs give the same state (see
+    state_hash()). Seeded worlds also keep monster waves at full size
+    rather than adapting them to frame time.
+    """
 
     def __init__(
             self, 
@@ -22,9 +49,19 @@ class GameState:
             collision_sprites, 
             obstacle_group, 
             visible_sprites, 
-            explosion_group
+            explosion_group,
+            headless=False,
+            seed=None
     ):
         self.screen = screen
+        self.headless = headless
+        asset_manager.set_headless(headless)  # also resets after an earlier headless world
+
+        # deterministic simulation: seeded RNG + simulated time
+        self.seed = seed
+        self.deterministic = seed is not None
+        self.rng = random.Random(seed)
+        self.clock = SimulationClock()
 
         # sprite groups
         self.visible_sprites = visible_sprites
@@ -35,27 +72,47 @@ class GameState:
         self.portal_group = pygame.sprite.Group()
         self.check_portal_collisions_func = None
 
+        # broad-phase for moving entities, rebuilt every frame
+        self.entity_grid = SpatialHash(ENTITY_CELL_SIZE)
+
+        # recycled entities
+        self.torpedo_pool = ObjectPool(Torpedo, TORPEDO_POOL_SIZE, "torpedo")
+        self.explosion_pool = ObjectPool(AnimatedExplosion, EXPLOSION_POOL_SIZE, "explosion")
+        self.monster_pool = ObjectPool(Monster, MONSTER_POOL_SIZE, "monster")
+        self.frame_cost = 0.0  # seconds of update + draw work since the last drawn frame
+
+        # decode sprites and sounds in the background while the map loads
+        asset_manager.preload(*self.preload_manifest())
+
         # map
-        self.map_system = MapSystem()
-        self.map_surface = self.map_system.get_map_surface()
-        self.collision_sprites = self.map_system.collision_sprites
+        self.map_system = MapSystem(headless=headless)
+
+        # array-backed systems (None without NumPy: sprites update themselves)
+        if MonsterBatch.available():
+            self.monster_batch = MonsterBatch(navigation=self.map_system.navigation)
+        else:
+            self.monster_batch = None
+        self.explosion_system = ExplosionSystem() if ExplosionSystem.available() else None
 
         # assets
         self.explosion_frames = self.load_explosion_frames()
         self.sounds = self.load_audio()
+        for folder in (LEFT_TORPEDO_PATH, RIGHT_TORPEDO_PATH):
+            torpedo_rotation_atlas(folder)
 
         # camera
         self.camera = Camera(
             screen=self.screen,
             map_width=self.map_system.map_width,
-            map_height=self.map_system.map_height
+            map_height=self.map_system.map_height,
+            spatial_index=self.entity_grid
         )
 
         # player
         self.player = Player(
             pos=(self.map_system.map_width // 2, self.map_system.map_height // 2),
             group=self.visible_sprites,
-            collision_sprites=self.collision_sprites,
+            map_system=self.map_system,
             visible_sprites=self.visible_sprites,
             map_width=self.map_system.map_width,
             map_height=self.map_system.map_height,
@@ -67,9 +124,12 @@ class GameState:
         self.monster_spawner = MonsterSpawner(
             player=self.player,
             enemy_sprites=self.enemy_sprites,
-            collision_sprites=self.collision_sprites,
-            map_collision_sprites=self.map_system.collision_sprites,
-            visible_sprites=self.visible_sprites
+            map_system=self.map_system,
+            visible_sprites=self.visible_sprites,
+            monster_pool=self.monster_pool,
+            monster_batch=self.monster_batch,
+            rng=self.rng,
+            adaptive=not self.deterministic
         )
 
         # respawn system
@@ -82,27 +142,56 @@ class GameState:
         # portal
         self.create_portals()
 
-        # HUD
-        self.hud = HUD(
-            player=self.player,
-            screen=self.screen,
-            camera=self.camera,
-        )
-        # world UI
-        self.world_ui = WorldUI(
-            player=self.player,
-            camera=self.camera,
-            screen=self.screen
-        )
-        
+        # player input
+        if headless:
+            self.controls = ScriptedControls()
+        else:
+            self.controls = KeyboardControls(self.camera)
+
+        # HUD and world UI (nothing is drawn headless)
+        self.hud = None
+        self.world_ui = None
+        if not headless:
+            self.hud = HUD(
+                player=self.player,
+                screen=self.screen,
+                camera=self.camera,
+            )
+            self.world_ui = WorldUI(
+                player=self.player,
+                camera=self.camera,
+                screen=self.screen
+            )
+
+        self.rebuild_entity_grid()
+
 
     # ====== ASSET LOADING =====
+    def preload_manifest(self):
+        """Image and sound paths used mid-game (torpedoes, monster waves, portals)"""
+        images = [join(EXPLOSION_PATH, f"{i}.png") for i in range(6)]
+        for folder in (LEFT_TORPEDO_PATH, RIGHT_TORPEDO_PATH):
+            images += [join(folder, f"{i}.png") for i in range(5)]
+        for monster_type in MONSTER_SPAWN_AREA:
+            for direction in ("left", "right"):
+                images += [
+                    join(MONSTERS_PATH, monster_type, direction, f"{i}.png")
+                    for i in range(MONSTER_TYPES[monster_type]["frames"])
+                ]
+        images += [join(PORTAL_PATH, f"{i}.png") for i in range(6)]
+
+        sounds = [
+            TORPEDO_LAUNCH_SOUND, TORPEDO_HIT_SOUND, SONAR_PING, LOW_HEALTH_ALERT,
+            IM_BACK, DAMAGE_SOUND, TELEPORT_SOUND, RESPAWN_SOUND,
+        ]
+        return images, sounds
+
     def load_explosion_frames(self):
         """Load explosion frames"""
         frames = []
         for i in range(6):
             try:
-                img = pygame.image.load(join(EXPLOSION_PATH, f"{i}.png")).convert_alpha()
+                img = asset_manager.image(join(EXPLOSION_PATH, f"{i}.png"))
                 frames.append(img)
             except Exception: # fallback: generate circles as explosion
                 surf = pygame.Surface((32, 32), pygame.SRCALPHA)
@@ -112,19 +201,16 @@ class GameState:
         
     def load_audio(self):
         """Load sound effects to play for specific actions"""
-        sounds = {}
-        try:
-            sounds["torpedo_launch"] = pygame.mixer.Sound(TORPEDO_LAUNCH_SOUND)
-            sounds["torpedo_hit"] = pygame.mixer.Sound(TORPEDO_HIT_SOUND)
-            sounds["sonar_ping"] = pygame.mixer.Sound(SONAR_PING)
-            sounds["low_health"] = pygame.mixer.Sound(LOW_HEALTH_ALERT)
-            sounds["respawn"] = pygame.mixer.Sound(IM_BACK)
-            sounds["projectile_hit"] = sounds["torpedo_hit"]
-            sounds['damage'] = pygame.mixer.Sound(DAMAGE_SOUND)
-            sounds['teleport'] = pygame.mixer.Sound(TELEPORT_SOUND)
-        except Exception as e:
-            print(f"Failed to load audio: {e}")
-        return sounds
+        return asset_manager.sound_map({
+            "torpedo_launch": TORPEDO_LAUNCH_SOUND,
+            "torpedo_hit": TORPEDO_HIT_SOUND,
+            "sonar_ping": SONAR_PING,
+            "low_health": LOW_HEALTH_ALERT,
+            "respawn": IM_BACK,
+            "projectile_hit": TORPEDO_HIT_SOUND,
+            "damage": DAMAGE_SOUND,
+            "teleport": TELEPORT_SOUND,
+        })
 
     # ===== SETUP HELPERS =====
     def register_camera_sprites(self):
@@ -159,42 +245,137 @@ class GameState:
         target = None if self.player.is_invincible else self.player
         for monster in self.enemy_sprites:
             monster.player = target
+            monster.focus = self.player
+
+    def pool_stats(self):
+        """Size and hit rate of every object pool (F3 overlay, benchmark results)"""
+        return [pool.stats() for pool in (self.torpedo_pool, self.explosion_pool, self.monster_pool)]
+
+    def rebuild_entity_grid(self):
+        """Re-bucket every moving sprite (player, monsters, torpedoes, portals)"""
+        self.entity_grid.clear()
+        for sprite in self.visible_sprites:
+            self.entity_grid.insert(sprite, sprite.rect)
+
+    def resolve_monster_contacts(self):
+        """Let monsters touching the player attack it"""
+        if self.monster_batch:
+            self.monster_batch.resolve_contacts(self.player)
+            return
+
+        if self.player.is_dead or self.player.is_invincible:
+            return
+
+        area = self.player.hitbox_rect.inflate(BROADPHASE_MARGIN * 2, BROADPHASE_MARGIN * 2)
+        for monster in self.entity_grid.query_rect(area):
+            if monster in self.enemy_sprites:
+                monster.try_attack(self.player)
+
+    def snapshot(self):
+        """Plain-data copy of the simulated state (see game/snapshot.py)"""
+        return capture_state(self)
+
+    def restore(self, snapshot):
+        """Rewind to a snapshot() of a world built with the same seed"""
+        restore_state(self, snapshot)
+
+    def state_hash(self):
+        """CRC32 of the simulated state; equal across machines while lockstep peers agree"""
+        player = self.player
+        values = [
+            self.clock.step_count, *player.hitbox_rect, player.health, round(player.power, 3),
+            player.level, player.xp, self.monster_spawner.wave_number,
+        ]
+        for monster in self.enemy_sprites:
+            values.extend(monster.hitbox_rect)
+            values.append(monster.health)
+        for sprite in self.visible_sprites:
+            if isinstance(sprite, Torpedo):
+                values.extend(sprite.rect)
+        return zlib.crc32(struct.pack(f"<{len(values)}d", *values))
 
     # ===== UPDATE & DRAW =====
     def update(self, dt):
-        self.visible_sprites.update(dt)
-        self.enemy_sprites.update(dt)
-        self.explosion_group.update(dt)
-        self.monster_spawner.update(dt)
-        self.respawn_system.update(dt)
-        self.portal_group.update(dt)
-
-        if self.portal_group:
-            from entities.portal import check_portal_collisions
-            check_portal_collisions(
-                self.portal_group,
-                self.player,
-                pygame.time.get_ticks()
-            )
+        start = time.perf_counter()
+        section = profiler.section  # no-op sections unless the profiler is on
+        # input is read before anything moves, so recorders can snapshot the step's start
+        with section("update.input"):
+            self.player.current_input = self.controls.read(self.player)
+        self.clock.advance(dt)
+        if not self.headless:
+            self.camera.store_previous()
+        with section("update.sprites"):
+            self.visible_sprites.update(dt)
+            self.enemy_sprites.update(dt)
+        with section("update.monsters"):
+            if self.monster_batch:
+                self.monster_batch.update(dt, self.player)
+        with section("update.explosions"):
+            self.explosion_group.update(dt)
+            if self.explosion_system:
+                self.explosion_system.update(dt)
+        with section("update.spawner"):
+            self.monster_spawner.update(dt)
+        with section("update.respawn"):
+            self.respawn_system.update(dt)
+        with section("update.portals"):
+            self.portal_group.update(dt)
+        with section("update.contacts"):
+            self.resolve_monster_contacts()
+
+        with section("update.portal_travel"):
+            if self.portal_group:
+                from entities.portal import check_portal_collisions
+                check_portal_collisions(
+                    self.portal_group,
+                    self.player,
+                    self.clock.get_ticks()
+                )
+
+        with section("update.camera"):
+            self.camera.centered_player_cam(self.player)
+        with section("update.targets"):
+            self.update_monster_player_target()
+        with section("update.grid"):
+            self.rebuild_entity_grid()
+
+        self.frame_cost += time.perf_counter() - start
+        if self.headless:
+            self.end_frame()  # nothing is drawn: every step is a frame
 
-        self.camera.centered_player_cam(self.player)
-        self.update_monster_player_target()
+    def end_frame(self):
+        """Report the work of the frame just finished to the adaptive spawner"""
+        self.monster_spawner.track_frame_time(self.frame_cost)
+        self.frame_cost = 0.0
 
     def draw(self, screen, dt=1/60):
+        if self.headless:
+            return
+        start = time.perf_counter()
+        section = profiler.section
         # map
-        screen.blit(self.map_surface, -self.camera.offset)
+        with section("draw.map"):
+            self.map_system.draw(screen, self.camera.draw_offset)
         # camera world sprites
-        self.camera.custom_draw(self.player)
+        with section("draw.sprites"):
+            self.camera.custom_draw(self.player)
         # explosions
-        for explosion in self.explosion_group:
-            pos = pygame.math.Vector2(explosion.rect.topleft) - self.camera.offset
-            screen.blit(explosion.image, pos)
+        with section("draw.explosions"):
+            for explosion in self.explosion_group:
+                pos = pygame.math.Vector2(explosion.rect.topleft) - self.camera.draw_offset
+                screen.blit(explosion.image, pos)
         # world UI
-        self.world_ui.draw(self.enemy_sprites)
+        with section("draw.world_ui"):
+            self.world_ui.draw(self.enemy_sprites)
         # torpedo trajectory
-        if not self.player.is_dead:
-            self.player.draw_trajectory(screen, self.camera.offset, dt)
+        with section("draw.trajectory"):
+            if not self.player.is_dead:
+                center = self.camera.draw_center(self.player)
+                self.player.draw_trajectory(screen, self.camera.draw_offset, dt, center)
         # HUD
-        self.hud.draw(self.enemy_sprites, self.camera.offset)
+        with section("draw.hud"):
+            self.hud.draw(self.enemy_sprites, self.camera.draw_offset)
 
-                
\ No newline at end of file
+        # a frame's cost is every fixed step since the last draw plus this draw
+        self.frame_cost += time.perf_counter() - start
+        self.end_frame()
@@ -0,0 +1,85 @@
+# This runs the Subnautic Shooter world without a window or audio (server, bots, benchmarks)
+
+import pygame
+import os
+import sys
+import time
+
+# Get the current directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Get the parent directory (project root)
+parent_dir = os.path.dirname(current_dir)
+# Add parent directory to Python path
+sys.path.insert(0, parent_dir)
+
+from game.config import *
+from game.gamestate import GameState
+from game.profiler import profiler
+
+class HeadlessGame:
+    """Same world as Game, stepped by code: no display, no mixer, no drawing"""
+
+    def __init__(self, seed=None):
+        # ===== PYGAME SETUP =====
+        # dummy drivers: nothing here needs a display or audio device
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+
+        # ===== SPRITE GROUPS =====
+        self.collision_sprites = pygame.sprite.Group()
+        self.obstacle_group = pygame.sprite.Group()
+        self.visible_sprites = pygame.sprite.Group()
+        self.explosion_group = pygame.sprite.Group()
+
+        # ===== GAME STATE =====
+        self.gamestate = GameState(
+            screen=None,
+            collision_sprites=self.collision_sprites,
+            obstacle_group=self.obstacle_group,
+            visible_sprites=self.visible_sprites,
+            explosion_group=self.explosion_group,
+            headless=True,
+            seed=seed
+        )
+        self.ticks = 0
+
+    def step(self, player_input=None, dt=1/FPS):
+        """Advance one tick; player_input (a PlayerInput) stays held until replaced"""
+        if player_input is not None:
+            self.gamestate.controls.set(player_input)
+        self.gamestate.update(dt)
+        profiler.end_frame()
+        self.ticks += 1
+
+    def run(self, ticks, dt=1/FPS):
+        """Step ticks times as fast as possible; returns ticks per second"""
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step(dt=dt)
+        elapsed = time.perf_counter() - start
+        return ticks / elapsed if elapsed else float('inf')
+
+def main():
+    # headless.py [TICKS] [SEED] [--profile]: --profile prints per-system times and saves a trace
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    ticks = int(args[0]) if args else 3600
+    seed = int(args[1]) if len(args) > 1 else None
+    profile = "--profile" in sys.argv
+
+    game = HeadlessGame(seed)
+    if profile:
+        profiler.enable()
+        profiler.start_trace()
+    rate = game.run(ticks)
+    print(
+        f"{ticks} ticks at {rate:.0f} ticks/s, {len(game.gamestate.enemy_sprites)} monsters, "
+        f"state {game.gamestate.state_hash():08x}"
+    )
+    if profile:
+        print(profiler.report())
+        profiler.stop_trace()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,87 @@
 import pygame
 import os
+import math
+from array import array
+from collections import OrderedDict
 
+from pytmx import TiledMap
 from pytmx.util_pygame import load_pygame
 
 from game.config import *
+from game.collision import compile_collision_rects, CollisionGrid
+from game.navigation import NavigationGrid
+from game.map_cache import MapCache
 
 class MapSystem:
     """Handles all map-related functionality such as loading, rendering, and collisions"""
     
-    def __init__(self):
+    def __init__(self, headless=False):
+        # headless: collision and navigation only, no tile images or chunks
+        self.headless = headless
+
         # tiled map data
         self.tmx_data = None  # TMX map data
         self.map_width = SCREEN_WIDTH * 3  # fallback: default width if map fails
         self.map_height = SCREEN_HEIGHT * 3  # fallback: default height if map fails
 
         # collision
-        self.collision_sprites = pygame.sprite.Group()  # all collision objects
-
-        # load & setup
-        self.load_map()
-        self.setup_collision()
-
-        # map rendering (render once)
-        self.map_surface = self.render_map_surface()
+        self.collision_data = array('i')  # compiled x, y, w, h quads
+        self.collision_grid = CollisionGrid(cell_size=COLLISION_CELL_SIZE)
+
+        # map chunks: every key that has tiles, plus an LRU of display-ready surfaces
+        self.chunk_size = MAP_CHUNK_SIZE
+        self.chunk_keys = set()
+        self.chunk_sources = {}  # rendered chunks that are not on disk
+        self.resident_chunks = OrderedDict()
+        self.cache = MapCache(MAP_PATH, MAP_CACHE_DIR, self.chunk_size)
+
+        # load & setup (cache first, TMX on a miss)
+        if not self.load_from_cache():
+            self.load_map()
+            if not self.collision_data:
+                self.setup_collision()
+            chunks = None  # headless: collision is all there is to cache
+            if not self.headless:
+                self.chunk_sources = self.render_chunks()
+                self.chunk_keys = set(self.chunk_sources)
+                chunks = self.chunk_sources
+            if self.tmx_data and self.cache.save(
+                self.map_width, self.map_height, chunks, self.collision_data
+            ):
+                self.chunk_sources = {}  # reload from disk on demand
+        self.build_collision_grid()
+
+        # walkability grid + flow fields for chasing monsters
+        self.navigation = NavigationGrid(self.collision_data, self.map_width, self.map_height)
 
     # ===== MAP LOADING =====
+    def load_from_cache(self):
+        """Load map size, chunk list and collision from the precompiled cache.
+
+        A collision-only cache (written headless) still fills collision_data
+        but counts as a miss for a windowed map, which has chunks to render.
+        """
+        manifest = self.cache.load_manifest()
+        if not manifest:
+            return False
+
+        self.collision_data = manifest['collision']
+        if manifest['chunks'] is None and not self.headless:
+            return False
+
+        self.map_width = manifest['map_width']
+        self.map_height = manifest['map_height']
+        self.chunk_keys = set(manifest['chunks'] or ())
+        print(f"Map loaded from cache: {self.map_width}x{self.map_height}")
+        return True
+
     def load_map(self):
         """Load TMX map file and set map dimensions"""
         try:
-            self.tmx_data = load_pygame(MAP_PATH)
+            if self.headless:
+                self.tmx_data = TiledMap(MAP_PATH)  # object layers only, tiles stay unloaded
+            else:
+                self.tmx_data = load_pygame(MAP_PATH)
             # Set map dimensions in pixels
             self.map_width = self.tmx_data.width * self.tmx_data.tilewidth
             self.map_height = self.tmx_data.height * self.tmx_data.tileheight
@@ -38,85 +91,142 @@ class MapSystem:
             self.tmx_data = None
 
     # ===== MAP RENDERING =====
-    def render_map_surface(self):
-        """Render the entire map once"""
-        if not self.tmx_data:
-            return self.create_simple_background()
-        
-        map_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
-
-        for layer in self.tmx_data.visible_layers:
-            if hasattr(layer, 'data'):
-                for x, y, gid in layer:
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        map_surface.blit(tile, (x * self.tmx_data.tilewidth, y * self.tmx_data.tileheight))
-        return map_surface
-    
-    def get_map_surface(self):
-        """Render entire map to a single surface for fast blitting"""
+    def render_chunks(self):
+        """Render visible tile layers into chunk_size x chunk_size surfaces"""
         if not self.tmx_data:
-            return self.create_simple_background()  # fallback surface
+            return self.split_into_chunks(self.create_simple_background())
 
-        map_surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
+        chunks = {}
+        size = self.chunk_size
+        tile_w = self.tmx_data.tilewidth
+        tile_h = self.tmx_data.tileheight
 
         # render visible tile layers only
         for layer in self.tmx_data.visible_layers:
             if hasattr(layer, 'data'):
-                tile_count = 0
-
                 for x, y, gid in layer:
                     tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        map_surface.blit(tile, (x * TILE_SIZE, y * TILE_SIZE))
-                        tile_count += 1
+                    if not tile:
+                        continue
+
+                    px, py = x * tile_w, y * tile_h
+                    key = (px // size, py // size)
+                    chunk = chunks.get(key)
+                    if chunk is None:
+                        chunk = pygame.Surface(self.chunk_rect(key).size, pygame.SRCALPHA)
+                        chunks[key] = chunk
+                    chunk.blit(tile, (px - key[0] * size, py - key[1] * size))
 
         print("Map rendering complete!")
-        return map_surface
+        return chunks
+
+    def split_into_chunks(self, surface):
+        """Cut a full-map surface into chunks"""
+        chunks = {}
+        size = self.chunk_size
+        for cy in range((self.map_height + size - 1) // size):
+            for cx in range((self.map_width + size - 1) // size):
+                rect = self.chunk_rect((cx, cy))
+                chunks[(cx, cy)] = surface.subsurface(rect).copy()
+        return chunks
+
+    def chunk_rect(self, key):
+        """World-space rect of a chunk, clipped to the map"""
+        size = self.chunk_size
+        rect = pygame.Rect(key[0] * size, key[1] * size, size, size)
+        return rect.clip(pygame.Rect(0, 0, self.map_width, self.map_height))
+
+    def get_chunk(self, key):
+        """Display-ready chunk surface, loading it and evicting the oldest if needed"""
+        chunk = self.resident_chunks.get(key)
+        if chunk is not None:
+            self.resident_chunks.move_to_end(key)
+            return chunk
+
+        source = self.chunk_sources.get(key)
+        if source is None:
+            try:
+                source = self.cache.load_chunk(key)
+            except (OSError, pygame.error):
+                self.chunk_keys.discard(key)
+                return None
+
+        # flatten onto the cleared screen colour so the chunk blits without alpha
+        chunk = pygame.Surface(source.get_size())
+        chunk.fill(MAP_CLEAR_COLOR)
+        chunk.blit(source, (0, 0))
+        chunk = chunk.convert()
+
+        self.resident_chunks[key] = chunk
+        while len(self.resident_chunks) > MAP_CHUNK_CACHE_LIMIT:
+            self.resident_chunks.popitem(last=False)
+        return chunk
+
+    def draw(self, screen, camera_offset):
+        """Blit only the chunks that intersect the camera viewport"""
+        size = self.chunk_size
+        offset_x = math.floor(camera_offset.x)
+        offset_y = math.floor(camera_offset.y)
+        screen_w, screen_h = screen.get_size()
+
+        first_x, first_y = max(0, offset_x // size), max(0, offset_y // size)
+        last_x = (offset_x + screen_w - 1) // size
+        last_y = (offset_y + screen_h - 1) // size
+
+        for cy in range(first_y, last_y + 1):
+            for cx in range(first_x, last_x + 1):
+                if (cx, cy) not in self.chunk_keys:
+                    continue
+                chunk = self.get_chunk((cx, cy))
+                if chunk is not None:
+                    screen.blit(chunk, (cx * size - offset_x, cy * size - offset_y))
     
     # ===== COLLISION SETUP =====
     def setup_collision(self):
-        """Create collision sprites from Object Layer 1"""
+        """Compile Object Layer 1 and the border walls into merged collision boxes"""
+        rects = self.read_collision_objects()
+
+        # always create border walls
+        rects.extend(self.create_border_walls())
 
-        from game.collision import CollisionSprite
+        self.collision_data = compile_collision_rects(rects, COLLISION_CELL_SIZE)
+        print(f"Collision compiled: {len(rects)} objects -> {len(self.collision_data) // 4} boxes")
 
+    def read_collision_objects(self):
+        """Return (x, y, w, h) for every rectangular object in Object Layer 1"""
         if not self.tmx_data:
-            self.create_border_walls()
-            return
+            return []
 
         try:
             collision_layer = self.tmx_data.get_layer_by_name("Object Layer 1")
         except Exception:
-            self.create_border_walls()
-            return
+            return []
 
-        collision_count = 0
+        rects = []
         for obj in collision_layer:
             # only process rectangular objects
             if hasattr(obj, "x") and hasattr(obj, "y") and hasattr(obj, "width") and hasattr(obj, "height"):
-                CollisionSprite(
-                    pos=(obj.x, obj.y),
-                    size=(obj.width, obj.height),
-                    groups=[self.collision_sprites]
-                )
-                collision_count += 1
-
-        # always create border walls
-        self.create_border_walls()
+                rects.append((obj.x, obj.y, obj.width, obj.height))
+        return rects
     
+    def build_collision_grid(self):
+        """Bucket the compiled collision boxes into the uniform grid"""
+        self.collision_grid.build(self.collision_data)
+
+    def query_rect(self, rect):
+        """Return the static collision rects overlapping rect"""
+        return self.collision_grid.query_rect(rect)
+
     def create_border_walls(self):
-        """Create invisible walls around map edges to prevent leaving map"""
+        """Invisible walls around map edges to prevent leaving map"""
         border = 50  # thickness of walls
-        from game.collision import CollisionSprite
-
-        # top
-        CollisionSprite((0, -border), (self.map_width, border), [self.collision_sprites])
-        # bottom
-        CollisionSprite((0, self.map_height), (self.map_width, border), [self.collision_sprites])
-        # left
-        CollisionSprite((-border, 0), (border, self.map_height), [self.collision_sprites])
-        # right
-        CollisionSprite((self.map_width, 0), (border, self.map_height), [self.collision_sprites])
+
+        return [
+            (0, -border, self.map_width, border),  # top
+            (0, self.map_height, self.map_width, border),  # bottom
+            (-border, 0, border, self.map_height),  # left
+            (self.map_width, 0, border, self.map_height),  # right
+        ]
     
     # ===== FALLBACK BACKGROUND =====
     def create_simple_background(self):
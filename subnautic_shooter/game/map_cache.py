@@ -0,0 +1,137 @@
+# game/map_cache.py
+import hashlib
+import json
+import os
+import re
+import shutil
+from array import array
+
+import pygame
+
+from game.collision import COLLISION_FORMAT
+
+MAP_CACHE_VERSION = 2
+CACHE_FOLDER_NAME = re.compile(r'[0-9a-f]{16}(\.tmp)?')  # what compute_key() produces, see prune()
+
+
+def map_source_files(map_path):
+    """TMX file plus every tileset/image it references (one level of .tsx)"""
+    files = [map_path]
+    pending = [map_path]
+
+    while pending:
+        path = pending.pop()
+        if not path.endswith(('.tmx', '.tsx')):
+            continue
+        try:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            continue
+
+        folder = os.path.dirname(path)
+        for source in re.findall(r'source="([^"]+)"', text):
+            source_path = os.path.normpath(os.path.join(folder, source))
+            if source_path not in files:
+                files.append(source_path)
+                pending.append(source_path)
+    return files
+
+
+class MapCache:
+    """On-disk cache of rendered map chunks and compiled collision, keyed by the TMX hash.
+
+    Headless runs have no tile images, so they write collision only
+    (chunks is None in the manifest); the next windowed run renders the
+    chunks and rewrites the entry.
+    """
+
+    def __init__(self, map_path, cache_dir, chunk_size):
+        self.map_path = map_path
+        self.cache_dir = cache_dir
+        self.chunk_size = chunk_size
+        self.key = self.compute_key()
+        self.folder = os.path.join(cache_dir, self.key) if self.key else None
+
+    # ===== KEYING =====
+    def compute_key(self):
+        """Hash the TMX file, its tilesets and the formats so any change invalidates the cache"""
+        digest = hashlib.sha1(f"v{MAP_CACHE_VERSION}:c{COLLISION_FORMAT}:{self.chunk_size}".encode())
+        try:
+            for path in map_source_files(self.map_path):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        except OSError:
+            return None
+        return digest.hexdigest()[:16]
+
+    def chunk_path(self, chunk_key):
+        cx, cy = chunk_key
+        return os.path.join(self.folder, f"chunk_{cx}_{cy}.png")
+
+    # ===== LOADING =====
+    def load_manifest(self):
+        """Return cached map info, or None when there is no usable cache"""
+        if not self.folder:
+            return None
+        try:
+            with open(os.path.join(self.folder, 'manifest.json'), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get('version') != MAP_CACHE_VERSION or manifest.get('collision_format') != COLLISION_FORMAT:
+            return None
+
+        if manifest['chunks'] is not None:
+            manifest['chunks'] = [tuple(key) for key in manifest['chunks']]
+        manifest['collision'] = array('i', manifest['collision'])
+        return manifest
+
+    def load_chunk(self, chunk_key):
+        """Load one pre-rendered chunk image"""
+        return pygame.image.load(self.chunk_path(chunk_key))
+
+    # ===== SAVING =====
+    def save(self, map_width, map_height, chunks, collision_data):
+        """Write chunks (None: collision only) and collision data; failures just leave no cache behind"""
+        if not self.folder:
+            return False
+
+        temp_folder = self.folder + '.tmp'
+        try:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+            os.makedirs(temp_folder)
+
+            for (cx, cy), surface in (chunks or {}).items():
+                pygame.image.save(surface, os.path.join(temp_folder, f"chunk_{cx}_{cy}.png"))
+
+            manifest = {
+                'version': MAP_CACHE_VERSION,
+                'collision_format': COLLISION_FORMAT,
+                'map_width': map_width,
+                'map_height': map_height,
+                'chunk_size': self.chunk_size,
+                'chunks': sorted(chunks) if chunks is not None else None,
+                'collision': list(collision_data),
+            }
+            with open(os.path.join(temp_folder, 'manifest.json'), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+
+            shutil.rmtree(self.folder, ignore_errors=True)
+            os.replace(temp_folder, self.folder)
+            self.prune()
+        except (OSError, pygame.error) as e:
+            print(f"Failed to write map cache: {e}")
+            shutil.rmtree(temp_folder, ignore_errors=True)
+            return False
+
+        print(f"Map cache written: {self.folder}")
+        return True
+
+    def prune(self):
+        """Delete caches left behind by older versions of the map (only folders this class names)"""
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name != self.key and CACHE_FOLDER_NAME.fullmatch(name) and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,244 @@
+# game/navigation.py
+from collections import OrderedDict, deque
+
+from game.config import *
+from game.entity_store import np
+
+# 8-neighbour steps (dx, dy, unit direction)
+DIAGONAL = 0.7071067811865476
+NEIGHBOURS = (
+    (1, 0, (1.0, 0.0)),
+    (-1, 0, (-1.0, 0.0)),
+    (0, 1, (0.0, 1.0)),
+    (0, -1, (0.0, -1.0)),
+    (1, 1, (DIAGONAL, DIAGONAL)),
+    (1, -1, (DIAGONAL, -DIAGONAL)),
+    (-1, 1, (-DIAGONAL, DIAGONAL)),
+    (-1, -1, (-DIAGONAL, -DIAGONAL)),
+)
+
+
+class FlowField:
+    """BFS distances and next-step directions toward one target cell, in a window around it"""
+
+    def __init__(self, target_cell, window, distance, directions, cell_size):
+        self.target_cell = target_cell
+        self.window = window  # (x0, y0, width, height) in cells
+        self.distance = distance  # flat, -1 = unreachable / blocked (list, or int32 array)
+        self.directions = directions  # flat unit (dx, dy) or None (list), or an (n, 2) array
+        self.cell_size = cell_size
+        self.array_cache = None
+        if np is not None and isinstance(distance, np.ndarray):
+            self.array_cache = (distance, directions)
+
+    def arrays(self):
+        """(distance, directions) as NumPy arrays for batched sampling"""
+        if self.array_cache is None:
+            self.array_cache = (
+                np.array(self.distance, dtype=np.int32),
+                np.array([step or (0.0, 0.0) for step in self.directions], dtype=np.float64).reshape(-1, 2),
+            )
+        return self.array_cache
+
+    def index(self, x, y):
+        """Flat window index of the cell under a world point, or None outside the window"""
+        x0, y0, width, height = self.window
+        cx = int(x // self.cell_size) - x0
+        cy = int(y // self.cell_size) - y0
+        if 0 <= cx < width and 0 <= cy < height:
+            return cy * width + cx
+        return None
+
+    def direction_at(self, pos):
+        """Unit step toward the target from pos, or None (off the field, or close enough to beeline)"""
+        i = self.index(pos[0], pos[1])
+        if i is None or self.distance[i] <= NAV_BEELINE_CELLS:
+            return None
+        step = self.directions[i]
+        return (float(step[0]), float(step[1]))
+
+
+class NavigationGrid:
+    """Walkable cells derived from the compiled collision boxes, plus per-target flow fields.
+
+    A cell is blocked when any collision box overlaps it (most walls are
+    single 16 px tiles, which a chasing monster can't squeeze past). Flow
+    fields are bounded BFS searches (NAV_FIELD_RADIUS cells around the
+    target), built only when a chasing monster asks for one and kept for
+    the last NAV_FIELD_CACHE target cells, so a player idling or pacing
+    between a few cells costs nothing. With NumPy the search expands a
+    whole BFS wave per step.
+    """
+
+    def __init__(self, collision_data, map_width, map_height, cell_size=NAV_CELL_SIZE):
+        self.cell_size = cell_size
+        self.width = (map_width + cell_size - 1) // cell_size
+        self.height = (map_height + cell_size - 1) // cell_size
+        self.blocked = self.build_blocked(collision_data)
+        self.fields = OrderedDict()  # target cell -> FlowField, least recently used first
+
+        # stats
+        self.rebuilds = 0
+
+    # ===== WALKABILITY =====
+    def build_blocked(self, collision_data):
+        size = self.cell_size
+        blocked = bytearray(self.width * self.height)
+
+        for i in range(0, len(collision_data), 4):
+            x, y, w, h = collision_data[i:i + 4]
+            x1 = max(0, x // size)
+            y1 = max(0, y // size)
+            x2 = min(self.width - 1, (x + w - 1) // size)
+            y2 = min(self.height - 1, (y + h - 1) // size)
+            for cy in range(y1, y2 + 1):
+                row = cy * self.width
+                for cx in range(x1, x2 + 1):
+                    blocked[row + cx] = 1
+        return blocked
+
+    def cell_of(self, pos):
+        return int(pos[0] // self.cell_size), int(pos[1] // self.cell_size)
+
+    def is_blocked(self, cx, cy):
+        if not (0 <= cx < self.width and 0 <= cy < self.height):
+            return True
+        return bool(self.blocked[cy * self.width + cx])
+
+    # ===== FLOW FIELDS =====
+    def field(self, target):
+        """Flow field toward target's current cell, built on first request"""
+        cell = self.cell_of(target.rect.center)
+        field = self.fields.get(cell)
+        if field is not None:
+            self.fields.move_to_end(cell)
+            return field
+
+        field = self.build_field(cell)
+        self.rebuilds += 1
+        self.fields[cell] = field
+        while len(self.fields) > NAV_FIELD_CACHE:
+            self.fields.popitem(last=False)
+        return field
+
+    def field_window(self, target_cell):
+        """(x0, y0, x1, y1) cells searched around target_cell, clipped to the map"""
+        radius = NAV_FIELD_RADIUS
+        tx, ty = target_cell
+        return (
+            max(0, tx - radius),
+            max(0, ty - radius),
+            min(self.width, tx + radius + 1),
+            min(self.height, ty + radius + 1),
+        )
+
+    def build_field(self, target_cell):
+        """Bounded 8-way BFS outward from target_cell; diagonals may not cut wall corners"""
+        if np is not None:
+            return self.build_field_arrays(target_cell)
+
+        tx, ty = target_cell
+        x0, y0, x1, y1 = self.field_window(target_cell)
+        width = max(0, x1 - x0)
+        height = max(0, y1 - y0)
+
+        distance = [-1] * (width * height)
+        directions = [None] * (width * height)
+        field = FlowField(target_cell, (x0, y0, width, height), distance, directions, self.cell_size)
+
+        if not (x0 <= tx < x1 and y0 <= ty < y1):
+            return field  # target is off the map
+
+        blocked = self.blocked
+        grid_width = self.width
+
+        def walkable(cx, cy):
+            return x0 <= cx < x1 and y0 <= cy < y1 and not blocked[cy * grid_width + cx]
+
+        # start from the target even if it stands in a blocked cell (hugging a wall)
+        distance[(ty - y0) * width + (tx - x0)] = 0
+        queue = deque([(tx, ty)])
+
+        while queue:
+            cx, cy = queue.popleft()
+            next_distance = distance[(cy - y0) * width + (cx - x0)] + 1
+
+            for dx, dy, step in NEIGHBOURS:
+                nx, ny = cx + dx, cy + dy
+                if not walkable(nx, ny):
+                    continue
+                if dx and dy and not (walkable(cx + dx, cy) and walkable(cx, cy + dy)):
+                    continue
+
+                i = (ny - y0) * width + (nx - x0)
+                if distance[i] != -1:
+                    continue
+                distance[i] = next_distance
+                # monsters in (nx, ny) walk back along the step that reached them
+                directions[i] = (-step[0], -step[1])
+                queue.append((nx, ny))
+
+        return field
+
+    def build_field_arrays(self, target_cell):
+        """build_field with NumPy: the whole frontier expands in one step per BFS wave.
+
+        Works on the window padded by one blocked cell, so neighbour lookups
+        never leave the array. Where several frontier cells reach the same
+        cell, the earliest entry of NEIGHBOURS wins (straight before diagonal).
+        """
+        tx, ty = target_cell
+        x0, y0, x1, y1 = self.field_window(target_cell)
+        width = max(0, x1 - x0)
+        height = max(0, y1 - y0)
+        window = (x0, y0, width, height)
+
+        if not (x0 <= tx < x1 and y0 <= ty < y1):
+            distance = np.full(width * height, -1, dtype=np.int32)
+            return FlowField(target_cell, window, distance, np.zeros((width * height, 2)), self.cell_size)
+
+        grid = np.frombuffer(self.blocked, dtype=np.uint8).reshape(self.height, self.width)
+        padded_width = width + 2
+        free = np.zeros((height + 2, padded_width), dtype=bool)
+        free[1:-1, 1:-1] = grid[y0:y1, x0:x1] == 0
+        free = free.ravel()
+
+        offsets = np.array([dy * padded_width + dx for dx, dy, _ in NEIGHBOURS])
+        # the two straight cells beside each diagonal step
+        side_x = np.array([dx for dx, dy, _ in NEIGHBOURS[4:]])
+        side_y = np.array([dy * padded_width for dx, dy, _ in NEIGHBOURS[4:]])
+
+        distance = np.full(free.size, -1, dtype=np.int32)
+        came_from = np.zeros(free.size, dtype=np.int8)  # NEIGHBOURS index that reached the cell
+        unvisited = free.copy()
+
+        # start from the target even if it stands in a blocked cell (hugging a wall)
+        start = (ty - y0 + 1) * padded_width + (tx - x0 + 1)
+        distance[start] = 0
+        unvisited[start] = False
+        frontier = np.array([start])
+
+        wave = 0
+        while len(frontier):
+            wave += 1
+            candidates = frontier[:, None] + offsets
+            ok = unvisited[candidates]
+            # diagonals may not cut a wall corner
+            ok[:, 4:] &= free[frontier[:, None] + side_x] & free[frontier[:, None] + side_y]
+
+            # neighbour-major order, so np.unique's first hit is the preferred step
+            neighbour, row = np.nonzero(ok.T)
+            reached, first = np.unique(candidates[row, neighbour], return_index=True)
+            distance[reached] = wave
+            came_from[reached] = neighbour[first]
+            unvisited[reached] = False
+            frontier = reached
+
+        # monsters walk back along the step that reached their cell
+        steps = -np.array([step for _, _, step in NEIGHBOURS])[came_from]
+        steps[distance <= 0] = 0.0
+
+        inner = np.arange(free.size).reshape(height + 2, padded_width)[1:-1, 1:-1].ravel()
+        return FlowField(
+            target_cell, window, distance[inner], np.ascontiguousarray(steps[inner]), self.cell_size
+        )
@@ -0,0 +1,62 @@
+# game/pool.py
+
+
+class ObjectPool:
+    """Recycles killed sprites instead of allocating new ones.
+
+    Pooled classes take the same arguments in __init__ and reset(), and
+    call pool.release(self) from kill(). acquire() resets a free instance
+    when there is one and only constructs a new object on a miss.
+    """
+
+    def __init__(self, factory, max_size, name=None):
+        self.factory = factory
+        self.max_size = max_size
+        self.name = name or getattr(factory, '__name__', 'pool')
+        self.free = []
+
+        # stats
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.in_pool = False
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created += 1
+
+        obj.pool = self
+        obj.in_pool = False
+        return obj
+
+    def release(self, obj):
+        """Return a dead object; extras beyond max_size are left to the GC"""
+        if obj.in_pool:
+            return
+        obj.in_pool = True
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    # ===== STATS =====
+    def hit_rate(self):
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def stats(self):
+        return {
+            'name': self.name,
+            'free': len(self.free),
+            'created': self.created,
+            'reused': self.reused,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def __repr__(self):
+        return (
+            f"{self.name} pool: {len(self.free)} free, {self.created} created, "
+            f"{self.reused} reused ({self.hit_rate():.0%} hit rate)"
+        )
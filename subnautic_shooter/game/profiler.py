@@ -0,0 +1,199 @@
+# game/profiler.py
+import json
+import os
+import time
+from collections import deque
+
+from game.config import *
+
+
+class NullSection:
+    """Stand-in returned while profiling is off: entering and leaving it does nothing"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SECTION = NullSection()
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Nearest-rank percentiles of values (0.0 each when empty)"""
+    values = sorted(values)
+    if not values:
+        return tuple(0.0 for _ in points)
+    last = len(values) - 1
+    return tuple(values[round(last * p / 100)] for p in points)
+
+
+class Section:
+    """Timer for one named system; reused, so a name must not nest inside itself"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.profiler.record(self.name, self.start, end)
+        return False
+
+
+class FrameProfiler:
+    """Per-system frame timings with rolling percentiles and a Chrome trace export.
+
+    Wrap a system in `with profiler.section("update.spawner"):` and call
+    end_frame() once per drawn frame (or per headless step). Times of a
+    name are summed over the frame, then kept for the last `window` frames
+    in which that system ran: drawn frames outnumber fixed steps at high
+    frame rates, and a frame without a step says nothing about update cost.
+    While disabled, section() hands back one shared no-op object and
+    end_frame() returns at once, so instrumented code costs a method call.
+    """
+
+    def __init__(self, enabled=PROFILER_ENABLED, window=PROFILER_WINDOW):
+        self.window = window
+        self.samples = {}  # name -> deque of ms per frame
+        self.frame_times = deque(maxlen=window)  # ms between end_frame() calls
+        self.current = {}  # name -> ns accumulated this frame
+        self.last_frame = {}  # name -> ms of the systems that ran in the last closed frame
+        self.sections = {}  # name -> reusable Section
+        self.frame_start = time.perf_counter_ns()
+        self.frame_count = 0
+
+        # chrome://tracing / Perfetto events, only while tracing
+        self.tracing = False
+        self.trace_events = []
+        self.trace_origin = self.frame_start
+
+        self.enabled = False
+        self.section = self.null_section
+        if enabled:
+            self.enable()
+
+    # ===== SWITCHING =====
+    def enable(self):
+        self.enabled = True
+        self.section = self.timed_section
+        self.frame_start = time.perf_counter_ns()
+
+    def disable(self):
+        self.enabled = False
+        self.section = self.null_section
+        self.current.clear()
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def start_trace(self):
+        self.trace_events = []
+        self.trace_origin = time.perf_counter_ns()
+        self.tracing = True
+
+    def stop_trace(self):
+        """Stop tracing and save what was captured; returns the file path"""
+        self.tracing = False
+        return self.export_trace()
+
+    def null_section(self, name):
+        return NULL_SECTION
+
+    def timed_section(self, name):
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = Section(self, name)
+        return section
+
+    # ===== RECORDING =====
+    def record(self, name, start, end):
+        self.current[name] = self.current.get(name, 0) + end - start
+        if self.tracing and len(self.trace_events) < PROFILER_TRACE_MAX_EVENTS:
+            self.trace_events.append({
+                'name': name, 'cat': name.split('.')[0], 'ph': 'X', 'pid': 0, 'tid': 0,
+                'ts': (start - self.trace_origin) / 1000, 'dur': (end - start) / 1000,
+            })
+
+    def end_frame(self):
+        """Close the current frame: fold its section times into the rolling windows"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self.frame_times.append((now - self.frame_start) / 1e6)
+        if self.tracing and len(self.trace_events) < PROFILER_TRACE_MAX_EVENTS:
+            self.trace_events.append({
+                'name': 'frame', 'ph': 'i', 's': 'g', 'pid': 0, 'tid': 0,
+                'ts': (now - self.trace_origin) / 1000,
+            })
+        self.frame_start = now
+        self.frame_count += 1
+
+        # only systems that ran get a sample; zeros would drag their percentiles down
+        self.last_frame = {name: ns / 1e6 for name, ns in self.current.items()}
+        for name, ms in self.last_frame.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+        self.current.clear()
+
+    # ===== STATS =====
+    def percentiles(self, name, points=(50, 95, 99)):
+        """Rolling percentiles (ms) of a system's per-frame time"""
+        return percentiles(self.samples.get(name, ()), points)
+
+    def stats(self):
+        """name -> {'p50', 'p95', 'p99', 'mean'} in ms, plus 'frame' for whole frames"""
+        series = dict(self.samples)
+        if self.frame_times:
+            series['frame'] = self.frame_times
+        result = {}
+        for name in sorted(series):
+            p50, p95, p99 = percentiles(series[name])
+            result[name] = {'p50': p50, 'p95': p95, 'p99': p99, 'mean': sum(series[name]) / len(series[name])}
+        return result
+
+    def report(self):
+        """Table of the rolling stats, slowest systems first"""
+        stats = self.stats()
+        lines = [f"{'system':<24}{'p50':>8}{'p95':>8}{'p99':>8}  (ms, last {len(self.frame_times)} frames)"]
+        for name, s in sorted(stats.items(), key=lambda item: -item[1]['p95']):
+            lines.append(f"{name:<24}{s['p50']:8.3f}{s['p95']:8.3f}{s['p99']:8.3f}")
+        return "\n".join(lines)
+
+    def export_trace(self, path=None):
+        """Write the trace events as Chrome trace JSON (chrome://tracing, Perfetto); returns the path"""
+        if path is None:
+            path = os.path.join(PROFILER_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.trace.json")
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.trace_events, 'displayTimeUnit': 'ms'}, f)
+        print(f"Profiler trace saved: {path} ({len(self.trace_events)} events)")
+        return path
+
+    def reset(self, window=None):
+        """Forget every sample (and optionally change how many frames are kept)"""
+        if window is not None:
+            self.window = window
+        self.samples.clear()
+        self.frame_times = deque(maxlen=self.window)
+        self.current.clear()
+        self.last_frame = {}
+        self.trace_events = []
+        self.frame_count = 0
+
+
+# shared profiler used by the game loop, GameState and the overlay
+profiler = FrameProfiler()
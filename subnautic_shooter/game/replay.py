@@ -0,0 +1,311 @@
+# game/replay.py
+import pygame
+import atexit
+import json
+import os
+import struct
+import time
+import zlib
+
+from game.config import *
+from game.controls import PlayerInput, ScriptedControls
+from game.headless import HeadlessGame
+
+# ===== FILE FORMAT =====
+# header: magic, version, world seed, step length (s)
+# then records, each led by a tag byte:
+#   I  input:    u16 flags [i16 aim x, i16 aim y] [u16 ticks]  (aim / ticks only when flagged)
+#   K  keyframe: u32 tick, u32 state hash, u32 size, zlib'd JSON snapshot (state before that tick)
+#   E  end:      u32 total ticks
+REPLAY_MAGIC = b'SSRP'
+REPLAY_VERSION = 1
+HEADER = struct.Struct('<4sHqd')
+FLAGS = struct.Struct('<H')
+AIM = struct.Struct('<hh')
+COUNT = struct.Struct('<H')
+KEYFRAME = struct.Struct('<III')
+END = struct.Struct('<I')
+
+BOOST, FIRE, SONAR, PORTAL_NEXT, PORTAL_PREV, HAS_AIM, HAS_COUNT = (1 << bit for bit in range(4, 11))
+AIM_SCALE = 32767  # aim is stored as a unit vector in 16-bit fixed point
+MAX_RUN = 0xFFFF
+
+
+def quantize_aim(aim):
+    """Unit aim in fixed point; the live game plays with this exact value too"""
+    direction = pygame.math.Vector2(aim)
+    if not direction.length():
+        return None
+    direction = direction.normalize()
+    return round(direction.x * AIM_SCALE), round(direction.y * AIM_SCALE)
+
+
+def pack_input(player_input, last_aim):
+    """(flags, aim) for one tick; aim is None when it didn't change since last_aim"""
+    flags = (player_input.move_x + 1) | (player_input.move_y + 1) << 2
+    for flag, pressed in (
+        (BOOST, player_input.boost),
+        (FIRE, player_input.fire),
+        (SONAR, player_input.sonar),
+        (PORTAL_NEXT, player_input.portal_next),
+        (PORTAL_PREV, player_input.portal_prev),
+    ):
+        if pressed:
+            flags |= flag
+
+    aim = quantize_aim(player_input.aim) if player_input.aim is not None else None
+    if aim is None or aim == last_aim:
+        return flags, None
+    return flags | HAS_AIM, aim
+
+
+def unpack_input(flags, aim):
+    return PlayerInput(
+        move_x=(flags & 3) - 1,
+        move_y=(flags >> 2 & 3) - 1,
+        boost=bool(flags & BOOST),
+        fire=bool(flags & FIRE),
+        sonar=bool(flags & SONAR),
+        portal_next=bool(flags & PORTAL_NEXT),
+        portal_prev=bool(flags & PORTAL_PREV),
+        aim=aim,
+    )
+
+
+def replay_path(seed):
+    """New file name under REPLAY_DIR for a match starting now"""
+    return os.path.join(REPLAY_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{seed}.replay")
+
+
+def prune_replays(folder, keep=REPLAY_KEEP):
+    """Delete all but the newest keep recordings in folder (only *.replay files)"""
+    try:
+        names = [name for name in os.listdir(folder) if name.endswith('.replay')]
+    except OSError:
+        return
+    paths = sorted((os.path.join(folder, name) for name in names), key=os.path.getmtime)
+    for path in paths[:max(0, len(paths) - keep)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# ===== RECORDING =====
+class ReplayRecorder:
+    """Streams a seeded world's inputs to disk, with a keyframe every keyframe_interval ticks.
+
+    Identical consecutive ticks are merged into one record, and the aim is
+    only written when it changes, so an idle or steady stretch costs a few
+    bytes however long it lasts.
+    """
+
+    def __init__(self, path, seed, dt, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        folder = os.path.dirname(path) or '.'
+        os.makedirs(folder, exist_ok=True)
+        prune_replays(folder, REPLAY_KEEP - 1)  # room for this one
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, dt))
+        self.keyframe_interval = keyframe_interval
+
+        self.tick = 0
+        self.last_aim = None
+        self.pending = None  # (flags, aim) of the run being counted
+        self.pending_count = 0
+
+        atexit.register(self.close)  # the app loop can exit without telling the scene
+
+    def record(self, state, player_input):
+        """Log the input for the step about to run and return it as it will replay"""
+        if self.tick % self.keyframe_interval == 0:
+            self.write_keyframe(state)
+
+        flags, aim = pack_input(player_input, self.last_aim)
+        if aim is not None:
+            self.last_aim = aim
+
+        if (flags, aim) == self.pending and self.pending_count < MAX_RUN:
+            self.pending_count += 1
+        else:
+            self.write_pending()
+            self.pending = (flags, aim)
+            self.pending_count = 1
+
+        self.tick += 1
+        return unpack_input(flags, aim)
+
+    def write_pending(self):
+        if self.pending is None:
+            return
+        flags, aim = self.pending
+        if self.pending_count > 1:
+            flags |= HAS_COUNT
+
+        record = b'I' + FLAGS.pack(flags)
+        if aim is not None:
+            record += AIM.pack(*aim)
+        if self.pending_count > 1:
+            record += COUNT.pack(self.pending_count)
+        self.file.write(record)
+        self.pending = None
+        self.pending_count = 0
+
+    def write_keyframe(self, state):
+        self.write_pending()
+        payload = zlib.compress(json.dumps(state.snapshot(), separators=(',', ':')).encode())
+        self.file.write(b'K' + KEYFRAME.pack(self.tick, state.state_hash(), len(payload)) + payload)
+        self.file.flush()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.write_pending()
+        self.file.write(b'E' + END.pack(self.tick))
+        self.file.close()
+        print(f"Replay saved: {self.path} ({self.tick} ticks)")
+
+
+class RecordingControls:
+    """Controls wrapper: reads the real controls and passes every input through a recorder"""
+
+    def __init__(self, controls, recorder, state):
+        self.controls = controls
+        self.recorder = recorder
+        self.state = state
+
+    def read(self, player):
+        return self.recorder.record(self.state, self.controls.read(player))
+
+
+# ===== LOADING =====
+def complete_record(data, offset, tag):
+    """Whether the record whose body starts at offset was fully written"""
+    if tag == b'I':
+        if offset + FLAGS.size > len(data):
+            return False
+        (flags,) = FLAGS.unpack_from(data, offset)
+        size = FLAGS.size
+        size += AIM.size if flags & HAS_AIM else 0
+        size += COUNT.size if flags & HAS_COUNT else 0
+    elif tag == b'K':
+        if offset + KEYFRAME.size > len(data):
+            return False
+        size = KEYFRAME.size + KEYFRAME.unpack_from(data, offset)[2]
+    elif tag == b'E':
+        size = END.size
+    else:
+        return True  # reported as corrupt by the caller
+    return offset + size <= len(data)
+
+
+class Replay:
+    """A loaded replay: world seed, step length, one input per tick and the keyframes"""
+
+    def __init__(self, seed, dt, inputs, keyframes):
+        self.seed = seed
+        self.dt = dt
+        self.inputs = inputs
+        self.keyframes = keyframes  # tick -> (state hash, compressed snapshot)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, seed, dt = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay")
+
+        inputs = []
+        keyframes = {}
+        offset = HEADER.size
+        while offset < len(data):
+            tag = data[offset:offset + 1]
+            offset += 1
+
+            if not complete_record(data, offset, tag):
+                break  # the match ended without close() (crash, kill): keep what was written
+
+            if tag == b'I':
+                (flags,) = FLAGS.unpack_from(data, offset)
+                offset += FLAGS.size
+                aim = None
+                if flags & HAS_AIM:
+                    aim = AIM.unpack_from(data, offset)
+                    offset += AIM.size
+                count = 1
+                if flags & HAS_COUNT:
+                    (count,) = COUNT.unpack_from(data, offset)
+                    offset += COUNT.size
+                # only the first tick of a run carries the aim; later ones keep it
+                inputs.append(unpack_input(flags, aim))
+                inputs.extend([unpack_input(flags, None)] * (count - 1))
+
+            elif tag == b'K':
+                tick, state_hash, size = KEYFRAME.unpack_from(data, offset)
+                offset += KEYFRAME.size
+                keyframes[tick] = (state_hash, data[offset:offset + size])
+                offset += size
+
+            elif tag == b'E':
+                break
+
+            else:
+                raise ValueError(f"{path}: corrupt record at byte {offset - 1}")
+
+        return cls(seed, dt, inputs, keyframes)
+
+    def snapshot(self, tick):
+        return json.loads(zlib.decompress(self.keyframes[tick][1]))
+
+    def __len__(self):
+        return len(self.inputs)
+
+
+# ===== PLAYBACK =====
+class ReplayPlayer:
+    """Steps a world through a replay; checks every keyframe it passes for desyncs"""
+
+    def __init__(self, replay, gamestate=None):
+        self.replay = replay
+        self.state = gamestate or HeadlessGame(replay.seed).gamestate
+        self.state.controls = ScriptedControls()
+        self.tick = 0
+        self.desyncs = []  # ticks whose keyframe hash did not match
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.replay)
+
+    def step(self):
+        keyframe = self.replay.keyframes.get(self.tick)
+        if keyframe and self.state.state_hash() != keyframe[0]:
+            print(f"Replay desync at tick {self.tick}")
+            self.desyncs.append(self.tick)
+
+        self.state.controls.set(self.replay.inputs[self.tick])
+        self.state.update(self.replay.dt)
+        self.tick += 1
+
+    def run(self, ticks=None):
+        """Fast-forward ticks steps (to the end by default); returns ticks per second"""
+        end = len(self.replay) if ticks is None else min(len(self.replay), self.tick + ticks)
+        start_tick = self.tick
+        start = time.perf_counter()
+        while self.tick < end:
+            self.step()
+        elapsed = time.perf_counter() - start
+        return (self.tick - start_tick) / elapsed if elapsed else float('inf')
+
+    def seek(self, tick):
+        """Jump to tick: restore the nearest keyframe at or before it, then step forward"""
+        tick = max(0, min(tick, len(self.replay)))
+        keyframe = max((k for k in self.replay.keyframes if k <= tick), default=None)
+        if keyframe is not None and not (keyframe <= self.tick <= tick):
+            self.state.restore(self.replay.snapshot(keyframe))
+            self.tick = keyframe
+        elif tick < self.tick:
+            raise ValueError("replay has no keyframe to rewind to")
+        while self.tick < tick:
+            self.step()
@@ -0,0 +1,106 @@
+# This plays back a recorded match on screen (or fast-forwards it headless with --verify)
+
+import pygame
+import os
+import sys
+
+# Get the current directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# Get the parent directory (project root)
+parent_dir = os.path.dirname(current_dir)
+# Add parent directory to Python path
+sys.path.insert(0, parent_dir)
+
+from game.config import *
+from game.game import Game
+from game.replay import Replay, ReplayPlayer
+from ui.text_cache import text_cache
+
+class ReplayViewer(Game):
+    """Scene that renders a replay: SPACE pause, LEFT/RIGHT seek, UP/DOWN speed, ESC leave"""
+
+    def __init__(self, replay):
+        super().__init__(seed=replay.seed, record=False)
+        self.player = ReplayPlayer(replay, self.gamestate)
+        self.speed = 1  # steps per update
+        self.paused = False
+        self.font = pygame.font.Font(None, 28)
+
+    def update(self, events, dt):
+        for event in events:
+            if event.type == pygame.QUIT:
+                return ("QUIT", None)
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_ESCAPE:
+                return ("POP", None)
+            elif event.key == pygame.K_SPACE:
+                self.paused = not self.paused
+            elif event.key == pygame.K_RIGHT:
+                self.player.seek(self.player.tick + REPLAY_KEYFRAME_INTERVAL)
+            elif event.key == pygame.K_LEFT:
+                self.player.seek(self.player.tick - REPLAY_KEYFRAME_INTERVAL)
+            elif event.key == pygame.K_UP:
+                self.speed = min(16, self.speed * 2)
+            elif event.key == pygame.K_DOWN:
+                self.speed = max(1, self.speed // 2)
+
+        if not self.paused:
+            for _ in range(self.speed):
+                if self.player.finished:
+                    break
+                self.player.step()
+        return None
+
+    def draw(self, screen):
+        super().draw(screen)
+        seconds = self.player.tick * self.player.replay.dt
+        total = len(self.player.replay) * self.player.replay.dt
+        status = "paused" if self.paused else f"x{self.speed}"
+        text = f"REPLAY {seconds:6.1f}s / {total:.1f}s  {status}"
+        screen.blit(text_cache.render(self.font, text, True, (255, 255, 255)), (20, SCREEN_HEIGHT - 40))
+
+
+def verify(paths):
+    """Fast-forward every replay headless; exits with status 1 if any desynced"""
+    failed = []
+    for path in paths:
+        replay = Replay.load(path)
+        player = ReplayPlayer(replay)
+        rate = player.run()
+        print(f"{path}: {len(replay)} ticks, seed {replay.seed}, "
+              f"played at {rate:.0f} ticks/s, {len(player.desyncs)} desyncs")
+        if player.desyncs:
+            failed.append(path)
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    paths = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not paths:
+        print("usage: replay_viewer.py FILE [--verify]")
+        print(f"       replay_viewer.py {REPLAY_CORPUS_DIR}/*.replay --verify")
+        return
+
+    if "--verify" in sys.argv:
+        verify(paths)
+        return
+
+    replay = Replay.load(paths[0])
+    print(f"{len(replay)} ticks, {len(replay.keyframes)} keyframes, seed {replay.seed}")
+
+    viewer = ReplayViewer(replay)
+    clock = pygame.time.Clock()
+    while True:
+        clock.tick(FPS)
+        if viewer.update(pygame.event.get(), 1 / FPS):
+            break
+        viewer.set_interpolation(1.0)
+        viewer.draw(viewer.screen)
+        pygame.display.flip()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# game/simulation.py
+
+
+class SimulationClock:
+    """Simulated time, advanced once per GameState.update.
+
+    get_ticks() returns milliseconds like pygame.time.get_ticks(), so timers
+    written against pygame keep working, but it only moves when the world is
+    stepped. Two worlds fed the same steps read the same times, no matter how
+    fast or slow they run.
+    """
+
+    def __init__(self):
+        self.step_count = 0
+        self.elapsed = 0.0  # seconds
+
+    def advance(self, dt):
+        self.step_count += 1
+        self.elapsed += dt
+
+    def get_ticks(self):
+        return int(round(self.elapsed * 1000))
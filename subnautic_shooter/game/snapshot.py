@@ -0,0 +1,253 @@
+# game/snapshot.py
+import pygame
+
+from entities.monster_batch import FACINGS
+from entities.torpedo import Torpedo
+from entities.explosion import AnimatedExplosion
+from entities.monsters import Monster
+
+# simulated attributes per entity; rects and vectors are stored as tuples
+PLAYER_FIELDS = (
+    'rect', 'hitbox_rect', 'direction', 'last_horizontal', 'speed',
+    'health', 'hp_regen_rate', 'last_damage_time', 'last_hit_time', 'is_hit', 'hit_timer', 'damage',
+    'is_dead', 'is_invincible', 'invincibility_timer', 'last_flash_time', 'flash_visible', 'respawn_timer',
+    'power', 'boost_cost', 'torpedo_cost', 'level', 'xp', 'last_torpedo_time',
+    'sonar_active', 'sonar_start_time', 'last_sonar_time', 'last_portal_time',
+    'current_animation', 'animation_frame', 'animation_timer', 'aim_direction', 'low_health_alerted',
+)
+MONSTER_FIELDS = (
+    'rect', 'hitbox_rect', 'speed', 'health', 'alive', 'direction', 'state', 'change_dir_timer',
+    'attack_cooldown', 'direction_facing', 'current_frame', 'animation_timer', 'alpha', 'lod_dt', 'lod_ticks',
+)
+TORPEDO_FIELDS = (
+    'pos', 'velocity', 'rect', 'target_direction', 'drop_direction', 'current_direction', 'direction',
+    'damage', 'frame_index', 'animation_timer', 'state', 'state_timer', 'alive', 'has_hit_something',
+)
+EXPLOSION_FIELDS = ('rect', 'frame_index', 'frame_timer')
+PORTAL_FIELDS = ('frame_index', 'animation_timer')
+SPAWNER_FIELDS = (
+    'timer', 'game_time', 'difficulty_scale', 'last_difficulty_tick', 'wave_number',
+    'spawned_total', 'recycled_total', 'frame_time',
+)
+RESPAWN_FIELDS = (
+    'respawn_points', 'current_respawn_index', 'is_respawning', 'respawn_timer',
+    'is_invincible', 'invincibility_timer', 'flash_timer', 'visible',
+)
+
+
+# ===== FIELD COPYING =====
+def plain(value):
+    """JSON-friendly copy of an attribute value"""
+    if isinstance(value, (pygame.Rect, pygame.math.Vector2)):
+        return tuple(value)
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+
+def capture(obj, fields):
+    return {name: plain(getattr(obj, name, None)) for name in fields}
+
+
+def apply(obj, data):
+    """Write captured fields back, rebuilding rects in place and vectors as new objects"""
+    for name, value in data.items():
+        current = getattr(obj, name, None)
+        if isinstance(current, pygame.Rect):
+            current.update(value)
+        elif isinstance(current, pygame.math.Vector2):
+            setattr(obj, name, pygame.math.Vector2(value))  # several vectors may alias one object
+        elif isinstance(current, list):
+            setattr(obj, name, [tuple(item) if isinstance(item, list) else item for item in value])
+        else:
+            setattr(obj, name, value)
+
+
+# ===== CAPTURE =====
+def capture_monster(monster):
+    data = capture(monster, MONSTER_FIELDS)
+    data['enemy_type'] = monster.enemy_type
+    data['slot'] = monster.slot
+
+    batch = monster.batch
+    if batch:
+        # the batch row is the live copy of the AI and animation state
+        store, i = batch.store, monster.slot
+        data.update(
+            direction=tuple(store['direction'][i].tolist()),
+            state="chase" if store['chasing'][i] else "wander",
+            change_dir_timer=float(store['dir_timer'][i]),
+            attack_cooldown=float(store['cooldown'][i]),
+            animation_timer=float(store['anim_timer'][i]),
+            lod_dt=float(store['lod_dt'][i]),
+            current_frame=int(store['frame'][i]),
+            direction_facing=FACINGS[int(store['facing'][i])],
+            alpha=int(store['alpha'][i]),
+        )
+    return data
+
+
+def capture_explosion(explosion):
+    data = capture(explosion, EXPLOSION_FIELDS)
+    data['slot'] = explosion.slot
+
+    system = explosion.system
+    if system:
+        store, i = system.store, explosion.slot
+        data['frame_timer'] = float(store['frame_timer'][i])
+        data['frame_index'] = int(store['frame_index'][i])
+    return data
+
+
+def capture_state(state):
+    """Plain-data copy of everything GameState.update reads (JSON-serialisable)"""
+    monsters = list(state.enemy_sprites)
+    torpedoes = [s for s in state.visible_sprites if isinstance(s, Torpedo)]
+    explosions = [s for s in state.visible_sprites if isinstance(s, AnimatedExplosion)]
+    portals = list(state.portal_group)
+
+    # visible_sprites order decides update, grid and hit order, so keep it exactly
+    index = {}
+    for kind, sprites in (('monster', monsters), ('torpedo', torpedoes),
+                          ('explosion', explosions), ('portal', portals)):
+        for i, sprite in enumerate(sprites):
+            index[sprite] = (kind, i)
+    index[state.player] = ('player', 0)
+    order = [index[s] for s in state.visible_sprites if s in index]
+
+    version, internal, gauss = state.rng.getstate()
+    return {
+        'step_count': state.clock.step_count,
+        'elapsed': state.clock.elapsed,
+        'rng': [version, list(internal), gauss],
+        'camera_offset': tuple(state.camera.offset),
+        'batch_ticks': state.monster_batch.ticks if state.monster_batch else 0,
+        'player': capture(state.player, PLAYER_FIELDS),
+        'spawner': capture(state.monster_spawner, SPAWNER_FIELDS),
+        'respawn': capture(state.respawn_system, RESPAWN_FIELDS),
+        'monsters': [capture_monster(m) for m in monsters],
+        'torpedoes': [capture(t, TORPEDO_FIELDS) | {'facing': t.player_facing} for t in torpedoes],
+        'explosions': [capture_explosion(e) for e in explosions],
+        'portals': [capture(p, PORTAL_FIELDS) for p in portals],
+        'order': order,
+    }
+
+
+# ===== RESTORE =====
+def restore_monster(state, data):
+    spawn = state.monster_pool.acquire if state.monster_pool else Monster
+    monster = spawn(
+        pos=data['rect'][:2],
+        groups=[state.visible_sprites, state.enemy_sprites],
+        map_system=state.map_system,
+        player=state.player,
+        enemy_type=data['enemy_type'],
+        rng=state.rng
+    )
+    apply(monster, {k: v for k, v in data.items() if k in MONSTER_FIELDS})
+    monster.image_key = None
+    monster.refresh_image()
+    state.camera.add(monster)
+    return monster
+
+
+def restore_torpedo(state, data):
+    player = state.player
+    spawn = state.torpedo_pool.acquire if state.torpedo_pool else Torpedo
+    torpedo = spawn(
+        pos=data['pos'],
+        direction=pygame.math.Vector2(data['target_direction']),
+        player_facing=data['facing'],
+        group=state.visible_sprites,
+        map_system=state.map_system,
+        explosion_frames=state.explosion_frames,
+        explosion_group=state.explosion_group,
+        monster_group=state.enemy_sprites,
+        obstacle_group=state.obstacle_group,
+        visible_sprites=state.visible_sprites,
+        game_ref=state,
+        damage=data['damage'],
+        owner=player
+    )
+    apply(torpedo, {k: v for k, v in data.items() if k in TORPEDO_FIELDS})
+    torpedo.image = torpedo.current_rotation()[0]
+    state.camera.add(torpedo)
+    return torpedo
+
+
+def restore_explosion(state, data):
+    spawn = state.explosion_pool.acquire if state.explosion_pool else AnimatedExplosion
+    explosion = spawn(
+        state.explosion_frames,
+        data['rect'][:2],
+        [state.explosion_group, state.visible_sprites],
+        state.explosion_system
+    )
+    apply(explosion, {k: v for k, v in data.items() if k in EXPLOSION_FIELDS})
+    explosion.image = explosion.frames[min(explosion.frame_index, len(explosion.frames) - 1)]
+    if explosion.system:
+        store, i = explosion.system.store, explosion.slot
+        store['frame_timer'][i] = data['frame_timer']
+        store['frame_index'][i] = data['frame_index']
+    return explosion
+
+
+def in_slot_order(items):
+    """Captured entities sorted by their old batch slot, so restored rows line up again"""
+    return sorted(range(len(items)), key=lambda i: (items[i]['slot'] is None, items[i]['slot'] or 0))
+
+
+def restore_state(state, snapshot):
+    """Rewind state to a capture_state() snapshot taken from a world with the same seed"""
+    # drop dynamic entities (back into their pools)
+    for sprite in list(state.visible_sprites):
+        if isinstance(sprite, (Monster, Torpedo, AnimatedExplosion)):
+            sprite.kill()
+
+    state.clock.step_count = snapshot['step_count']
+    state.clock.elapsed = snapshot['elapsed']
+    state.camera.offset.update(snapshot['camera_offset'])
+    if state.monster_batch:
+        state.monster_batch.ticks = snapshot['batch_ticks']
+
+    player = state.player
+    apply(player, snapshot['player'])
+    player.image = player.animations[player.current_animation][player.animation_frame]
+    apply(state.monster_spawner, snapshot['spawner'])
+    apply(state.respawn_system, snapshot['respawn'])
+
+    # rebuild entities, filling batch rows in their old slot order
+    monsters = [None] * len(snapshot['monsters'])
+    for i in in_slot_order(snapshot['monsters']):
+        monsters[i] = restore_monster(state, snapshot['monsters'][i])
+        if state.monster_batch:
+            state.monster_batch.add(monsters[i])
+
+    explosions = [None] * len(snapshot['explosions'])
+    for i in in_slot_order(snapshot['explosions']):
+        explosions[i] = restore_explosion(state, snapshot['explosions'][i])
+
+    torpedoes = [restore_torpedo(state, data) for data in snapshot['torpedoes']]
+
+    portals = list(state.portal_group)
+    for portal, data in zip(portals, snapshot['portals']):
+        apply(portal, data)
+        portal.image = portal.frames[portal.frame_index]
+
+    # put group membership back in the captured order
+    sprites = {
+        'player': [player], 'monster': monsters, 'torpedo': torpedoes,
+        'explosion': explosions, 'portal': portals,
+    }
+    ordered = [sprites[kind][i] for kind, i in snapshot['order']]
+    state.visible_sprites.empty()
+    state.visible_sprites.add(*ordered)
+    state.enemy_sprites.empty()
+    state.enemy_sprites.add(*monsters)
+
+    # last: respawning monsters above drew from the RNG
+    version, internal, gauss = snapshot['rng']
+    state.rng.setstate((version, tuple(internal), gauss))
+
+    state.update_monster_player_target()
+    state.rebuild_entity_grid()
@@ -0,0 +1,78 @@
+# game/spatial_hash.py
+import pygame
+
+
+class SpatialHash:
+    """Uniform grid that buckets items by the cells their rect overlaps"""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of item indices
+        self.items = []
+        self.rects = []
+
+    # ===== BUILDING =====
+    def cell_range(self, rect):
+        """Return the inclusive cell span (x1, y1, x2, y2) covered by rect"""
+        size = self.cell_size
+        return (
+            int(rect[0] // size),
+            int(rect[1] // size),
+            int((rect[0] + max(rect[2], 1) - 1) // size),
+            int((rect[1] + max(rect[3], 1) - 1) // size),
+        )
+
+    def insert(self, item, rect):
+        """Add an item covering rect to every cell it overlaps"""
+        index = len(self.items)
+        self.items.append(item)
+        self.rects.append(pygame.Rect(rect))
+
+        x1, y1, x2, y2 = self.cell_range(rect)
+        cells = self.cells
+        for cy in range(y1, y2 + 1):
+            for cx in range(x1, x2 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    bucket.append(index)
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.rects.clear()
+
+    # ===== QUERIES =====
+    def candidates(self, rect):
+        """Indices of items sharing a cell with rect, in insertion order"""
+        x1, y1, x2, y2 = self.cell_range(rect)
+        cells = self.cells
+
+        if x1 == x2 and y1 == y2:
+            return cells.get((x1, y1), ())
+
+        found = set()
+        for cy in range(y1, y2 + 1):
+            for cx in range(x1, x2 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
+
+    def query_rect(self, rect):
+        """Items whose rect overlaps the given rect"""
+        rects = self.rects
+        items = self.items
+        return [
+            items[i] for i in self.candidates(rect)
+            if rects[i].colliderect(rect)
+        ]
+
+    def query_around(self, center, radius):
+        """Items whose rect overlaps the square bounding a circle (broad-phase only)"""
+        x, y = center
+        return self.query_rect((x - radius, y - radius, radius * 2, radius * 2))
+
+    def __len__(self):
+        return len(self.items)
@@ -1,6 +1,8 @@
 # entities/ui/hud.py
 import pygame
 from game.config import *
+from game.assets import asset_manager
+from ui.text_cache import text_cache
 
 
 class HUD:
@@ -43,6 +45,13 @@ class HUD:
         self.xp_bg = (80, 80, 80)
         self.xp_fg = (50, 180, 255)
 
+        # stat bars live in a retained panel; each row is redrawn only when its numbers change
+        self.stats_panel = pygame.Surface(
+            (SCREEN_WIDTH // 2, self.line_height * 3),
+            pygame.SRCALPHA
+        )
+        self.stats_keys = [None, None, None]  # health, xp, power
+
         # fog
         self.fog_surface = pygame.Surface(
             (SCREEN_WIDTH, SCREEN_HEIGHT),
@@ -61,6 +70,26 @@ class HUD:
         self.sonar_icon = self.load_icon(SONAR_ICON_PATH)
         self.portal_icon = self.load_icon(PORTAL_ICON_PATH)
 
+        # overlays built once and reused (cooldown is blitted partially via area)
+        self.disabled_overlay = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
+        self.disabled_overlay.fill((0, 0, 0, 160))
+        self.cooldown_overlay = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
+        self.cooldown_overlay.fill((0, 0, 0, 180))
+        self.respawn_overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        self.respawn_overlay.fill((0, 0, 0, 180))
+
+        # retained icon bar: room for the sonar highlight around and the labels below
+        self.icon_margin = 4
+        self.icon_bar_pos = (self.icon_start_x - self.icon_margin, self.icon_y - self.icon_margin)
+        self.icon_bar = pygame.Surface(
+            (
+                self.icon_size * 3 + self.icon_padding * 2 + self.icon_margin * 2,
+                self.icon_size + self.icon_font.get_linesize() + self.icon_margin * 2 + 2
+            ),
+            pygame.SRCALPHA
+        )
+        self.icon_keys = [None, None, None]  # torpedo, sonar, portal
+
     # ===== HELPERS =====
     def next_y(self):
         """Advance vertical cursor for stacked HUD elements."""
@@ -68,66 +97,100 @@ class HUD:
         self.cursor_y += self.line_height
         return y
 
-    def draw_bar(self, text, ratio, y, fg_color, bg_color):
+    def draw_bar(self, surface, text, ratio, y, fg_color, bg_color):
         """Generic labeled progress bar."""
-        text_surf = self.font.render(text, True, self.text_color)
+        text_surf = text_cache.render(self.font, text, True, self.text_color)
         text_rect = text_surf.get_rect(topleft=(self.ui_x, y))
-        self.screen.blit(text_surf, text_rect)
+        surface.blit(text_surf, text_rect)
 
         bar_x = text_rect.right + 15
         bar_y = y + (text_rect.height - self.bar_height) // 2
         bar_rect = pygame.Rect(bar_x, bar_y, self.bar_width, self.bar_height)
 
-        pygame.draw.rect(self.screen, bg_color, bar_rect)
+        pygame.draw.rect(surface, bg_color, bar_rect)
 
         if ratio > 0:
             fill_rect = bar_rect.copy()
             fill_rect.width = int(self.bar_width * ratio)
-            pygame.draw.rect(self.screen, fg_color, fill_rect)
+            pygame.draw.rect(surface, fg_color, fill_rect)
 
-        pygame.draw.rect(self.screen, self.border_color, bar_rect, self.bar_border)
+        pygame.draw.rect(surface, self.border_color, bar_rect, self.bar_border)
 
     def load_icon(self, path):
         try:
-            icon = pygame.image.load(path).convert_alpha()
-            return pygame.transform.smoothscale(icon, (self.icon_size, self.icon_size))
+            return asset_manager.image(path, (self.icon_size, self.icon_size), "smooth")
         except Exception:
             surf = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
             pygame.draw.rect(surf, (120, 120, 120), surf.get_rect(), 2)
             return surf
         
-    def draw_icon_with_cooldown(self, icon, x, y, cooldown_ratio, disabled=False, label=None):
+    def draw_icon_with_cooldown(self, surface, icon, x, y, cooldown_h, disabled=False, label=None):
         """Draw icon with cooldown overlay and optional disabled state."""
-        self.screen.blit(icon, (x, y))
+        surface.blit(icon, (x, y))
 
         if disabled:
-            overlay = pygame.Surface((self.icon_size, self.icon_size), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 160))
-            self.screen.blit(overlay, (x, y))
+            surface.blit(self.disabled_overlay, (x, y))
 
-        if cooldown_ratio > 0:
-            h = int(self.icon_size * cooldown_ratio)
-            cd_rect = pygame.Rect(x, y + (self.icon_size - h), self.icon_size, h)
-            overlay = pygame.Surface(cd_rect.size, pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, cd_rect.topleft)
+        if cooldown_h > 0:
+            surface.blit(
+                self.cooldown_overlay,
+                (x, y + (self.icon_size - cooldown_h)),
+                (0, 0, self.icon_size, cooldown_h)
+            )
 
         pygame.draw.rect(
-            self.screen,
+            surface,
             (200, 200, 200),
             (x, y, self.icon_size, self.icon_size),
             2
         )
 
         if label:
-            text = self.icon_font.render(label, True, (255, 255, 255))
-            self.screen.blit(text, (x + 4, y + self.icon_size + 2))
+            text = text_cache.render(self.icon_font, label, True, (255, 255, 255))
+            surface.blit(text, (x + 4, y + self.icon_size + 2))
+
+    def cooldown_pixels(self, last_time, cd):
+        """Height of the cooldown shade; the icon only needs redrawing when this changes"""
+        elapsed = (self.player.clock.get_ticks() - last_time) / 1000
+        cooldown_ratio = max(0, 1 - (elapsed / cd)) if elapsed < cd else 0
+        return int(self.icon_size * cooldown_ratio)
 
     # ===== PLAYER BARS =====
-    def draw_health(self):
+    def stats_state(self):
+        """Everything the stat panel shows; the panel is rebuilt when this changes"""
+        player = self.player
+        xp_needed = None if player.level >= player.max_level else player.xp_to_next[player.level]
+        power_ratio = player.power / player.max_power
+        return (
+            player.health, player.max_health,
+            player.level, player.xp, xp_needed,
+            int(player.power), player.max_power,
+            int(self.bar_width * power_ratio), self.power_color(power_ratio),
+        )
+
+    def draw_stats(self):
+        """Blit the retained health / XP / power panel, re-rendering only changed rows"""
+        state = self.stats_state()
+        rows = (
+            (state[0:2], self.draw_health),
+            (state[2:5], self.draw_xp),
+            (state[5:], self.draw_power),
+        )
+
+        for i, (key, draw_row) in enumerate(rows):
+            if key != self.stats_keys[i]:
+                y = self.line_height * i
+                self.stats_panel.fill((0, 0, 0, 0), (0, y, self.stats_panel.get_width(), self.line_height))
+                draw_row(self.stats_panel, y)
+                self.stats_keys[i] = key
+
+        self.screen.blit(self.stats_panel, (0, self.next_y()))
+        self.cursor_y += self.line_height * 2
+
+    def draw_health(self, surface, y):
         ratio = self.player.health / self.player.max_health
-        y = self.next_y()
         self.draw_bar(
+            surface,
             f"Health: {self.player.health}/{self.player.max_health}",
             ratio,
             y,
@@ -135,9 +198,7 @@ class HUD:
             self.health_bg
         )
 
-    def draw_xp(self):
-        y = self.next_y()
-
+    def draw_xp(self, surface, y):
         if self.player.level >= self.player.max_level:
             text = f"Level {self.player.level}: MAX LEVEL"
             ratio = 1.0
@@ -146,20 +207,14 @@ class HUD:
             ratio = min(1.0, self.player.xp / xp_needed)
             text = f"Level {self.player.level}: {self.player.xp}/{xp_needed} XP"
 
-        self.draw_bar(text, ratio, y, self.xp_fg, self.xp_bg)
+        self.draw_bar(surface, text, ratio, y, self.xp_fg, self.xp_bg)
 
-    def draw_power(self):
-        y = self.next_y()
+    def draw_power(self, surface, y):
         ratio = self.player.power / self.player.max_power
-
-        if ratio > 0.7:
-            color = (50, 200, 50)
-        elif ratio > 0.3:
-            color = (200, 200, 50)
-        else:
-            color = (220, 100, 50)
+        color = self.power_color(ratio)
 
         self.draw_bar(
+            surface,
             f"Power: {int(self.player.power)}/{self.player.max_power}",
             ratio,
             y,
@@ -167,6 +222,13 @@ class HUD:
             self.xp_bg
         )
 
+    def power_color(self, ratio):
+        if ratio > 0.7:
+            return (50, 200, 50)
+        elif ratio > 0.3:
+            return (200, 200, 50)
+        return (220, 100, 50)
+
     # ===== PORTAL INFO =====
     def draw_portal_info(self):
         """Draw active portal info when player is near a portal."""
@@ -180,10 +242,11 @@ class HUD:
         next_i = portal.node.next.portal_index + 1
         prev_i = portal.node.prev.portal_index + 1
 
-        title = self.portal_title_font.render(
-            f"Portal {index}", True, (0, 255, 0)
+        title = text_cache.render(
+            self.portal_title_font, f"Portal {index}", True, (0, 255, 0)
         )
-        hint = self.portal_hint_font.render(
+        hint = text_cache.render(
+            self.portal_hint_font,
             f"E → Portal {next_i}    Q ← Portal {prev_i}",
             True, (180, 255, 180)
         )
@@ -194,88 +257,68 @@ class HUD:
         self.cursor_y += 10  # extra spacing
 
     # ===== ABILITY ICONS =====    
-    def draw_torpedo_icon(self, x, y):
-        current = pygame.time.get_ticks()
-        elapsed = (current - self.player.last_torpedo_time) / 1000
-        cd = self.player.torpedo_cooldown
-
-        cooldown_ratio = max(0, 1 - (elapsed / cd)) if elapsed < cd else 0
+    def torpedo_icon_state(self):
+        cooldown_h = self.cooldown_pixels(self.player.last_torpedo_time, self.player.torpedo_cooldown)
         disabled = self.player.power < self.player.torpedo_cost
-
-        self.draw_icon_with_cooldown(
-            self.torpedo_icon,
-            x, y,
-            cooldown_ratio,
-            disabled,
-            "SPACE"
-        )
+        return (self.torpedo_icon, cooldown_h, disabled, "SPACE", False)
     
-    def draw_sonar_icon(self, x, y):
-        current = pygame.time.get_ticks()
-
+    def sonar_icon_state(self):
         if self.player.level < self.player.sonar_level_required:
-            self.draw_icon_with_cooldown(
-                self.sonar_icon,
-                x, y,
-                0,
-                True,
-                "LOCK"
-            )
-            return
-
-        elapsed = (current - self.player.last_sonar_time) / 1000
-        cd = self.player.sonar_cooldown
-        cooldown_ratio = max(0, 1 - (elapsed / cd)) if elapsed < cd else 0
+            return (self.sonar_icon, 0, True, "LOCK", False)
 
+        cooldown_h = self.cooldown_pixels(self.player.last_sonar_time, self.player.sonar_cooldown)
         disabled = self.player.power < self.player.sonar_cost
+        return (self.sonar_icon, cooldown_h, disabled, "F", self.player.sonar_active)
+
+    def portal_icon_state(self):
+        cooldown_h = self.cooldown_pixels(self.player.last_portal_time, PORTAL_COOLDOWN)
+        disabled = self.player.current_portal is None
+        return (self.portal_icon, cooldown_h, disabled, "E / Q", False)
+
+    def draw_icon_cell(self, index, icon, cooldown_h, disabled, label, active):
+        """Re-composite one icon's region of the retained icon bar"""
+        x = self.icon_margin + (self.icon_size + self.icon_padding) * index
+        y = self.icon_margin
+        cell = pygame.Rect(
+            x - self.icon_margin, 0,
+            self.icon_size + self.icon_padding, self.icon_bar.get_height()
+        )
+        self.icon_bar.fill((0, 0, 0, 0), cell)
 
-        if self.player.sonar_active:
+        if active:
             pygame.draw.rect(
-                self.screen,
+                self.icon_bar,
                 (50, 200, 255),
                 (x - 2, y - 2, self.icon_size + 4, self.icon_size + 4),
                 3
             )
 
-        self.draw_icon_with_cooldown(
-            self.sonar_icon,
-            x, y,
-            cooldown_ratio,
-            disabled,
-            "F"
-        )
+        self.draw_icon_with_cooldown(self.icon_bar, icon, x, y, cooldown_h, disabled, label)
 
-    def draw_portal_icon(self, x, y):
-        current = pygame.time.get_ticks()
-        elapsed = (current - self.player.last_portal_time) / 1000
-        cooldown_ratio = max(0, 1 - (elapsed / PORTAL_COOLDOWN)) if elapsed < PORTAL_COOLDOWN else 0
+    def draw_icons(self):
+        states = (self.torpedo_icon_state(), self.sonar_icon_state(), self.portal_icon_state())
+        for i, state in enumerate(states):
+            if state != self.icon_keys[i]:
+                self.draw_icon_cell(i, *state)
+                self.icon_keys[i] = state
 
-        disabled = self.player.current_portal is None
-
-        self.draw_icon_with_cooldown(
-            self.portal_icon,
-            x, y,
-            cooldown_ratio,
-            disabled,
-            "E / Q"
-        )
+        self.screen.blit(self.icon_bar, self.icon_bar_pos)
 
     # ===== POST-DEATH/RESPAWN SCREEN =====
     def draw_respawn_overlay(self):
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.respawn_overlay, (0, 0))
 
-        died = self.large_font.render("YOU DIED", True, (255, 50, 50))
+        died = text_cache.render(self.large_font, "YOU DIED", True, (255, 50, 50))
         self.screen.blit(
             died,
             died.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         )
 
-        elapsed = (pygame.time.get_ticks() - self.player.respawn_timer) / 1000
+        elapsed = (self.player.clock.get_ticks() - self.player.respawn_timer) / 1000
         remaining = max(0, RESPAWN_DELAY - elapsed)
 
-        timer = self.medium_font.render(
+        timer = text_cache.render(
+            self.medium_font,
             f"Respawning in {remaining:.1f}s...", True, (255, 255, 255)
         )
         self.screen.blit(
@@ -287,10 +330,11 @@ class HUD:
         if not self.player.is_invincible or self.player.is_dead:
             return
 
-        elapsed = (pygame.time.get_ticks() - self.player.invincibility_timer) / 1000
+        elapsed = (self.player.clock.get_ticks() - self.player.invincibility_timer) / 1000
         remaining = max(0, RESPAWN_PROTECTION_TIME - elapsed)
 
-        text = self.font.render(
+        text = text_cache.render(
+            self.font,
             f"INVULNERABLE: {remaining:.1f}s", True, (255, 255, 0)
         )
         rect = text.get_rect(center=(self.screen.get_width() // 2, 30))
@@ -304,16 +348,8 @@ class HUD:
         if self.player.is_dead:
             self.draw_respawn_overlay()
             return
-        
-        x = self.icon_start_x
-        y = self.icon_y
 
-        self.draw_health()
-        self.draw_xp()
-        self.draw_power()
+        self.draw_stats()
         self.draw_portal_info()
         self.draw_invincibility()
-
-        self.draw_torpedo_icon(x, y)
-        self.draw_sonar_icon(x + self.icon_size + self.icon_padding, y)
-        self.draw_portal_icon(x + (self.icon_size + self.icon_padding) * 2, y)
+        self.draw_icons()
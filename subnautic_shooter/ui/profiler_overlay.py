@@ -0,0 +1,104 @@
+# ui/profiler_overlay.py
+import pygame
+from game.config import *
+from ui.text_cache import text_cache
+
+
+# one color per system, assigned in the order systems first report
+PALETTE = [
+    (230, 80, 80), (240, 160, 60), (230, 220, 80), (120, 210, 90), (60, 190, 170),
+    (70, 150, 240), (140, 110, 240), (220, 100, 210), (200, 200, 200), (150, 120, 90),
+    (255, 130, 130), (130, 255, 200), (180, 180, 255), (255, 200, 150), (120, 120, 120),
+]
+
+
+class ProfilerOverlay:
+    """Scrolling stacked graph of per-system frame time plus a p50/p95 table (F3).
+
+    pool_stats, when given, returns the object pools' stats() dicts; they
+    are listed under the timings.
+    """
+
+    def __init__(self, profiler, screen, pool_stats=None):
+        self.profiler = profiler
+        self.screen = screen
+        self.pool_stats = pool_stats
+        self.font = pygame.font.SysFont("consolas", 13)
+
+        # graph: one column per frame, scrolled left as frames arrive
+        self.graph_width = profiler.window
+        self.graph_height = 120
+        self.graph = pygame.Surface((self.graph_width, self.graph_height), pygame.SRCALPHA)
+        self.graph.fill((0, 0, 0, 170))
+        self.scale = self.graph_height / PROFILER_GRAPH_MS  # px per ms
+        self.colors = {}
+
+        # the table only changes twice a second; its numbers would thrash the text cache
+        self.table = None
+        self.table_frame = -FPS
+
+        self.x = SCREEN_WIDTH - self.graph_width - 20
+        self.y = 20
+
+    def color(self, name):
+        if name not in self.colors:
+            self.colors[name] = PALETTE[len(self.colors) % len(PALETTE)]
+        return self.colors[name]
+
+    def add_column(self):
+        """Draw the newest frame as one stacked column at the right edge"""
+        self.graph.scroll(-1, 0)
+        x = self.graph_width - 1
+        self.graph.fill((0, 0, 0, 170), (x, 0, 1, self.graph_height))
+
+        bottom = self.graph_height
+        for name, ms in sorted(self.profiler.last_frame.items()):
+            height = ms * self.scale
+            if height < 1:
+                continue
+            top = max(0, bottom - height)
+            pygame.draw.line(self.graph, self.color(name), (x, bottom - 1), (x, top))
+            bottom = top
+            if bottom <= 0:
+                break
+
+        # budget line: a full frame at FPS
+        budget_y = self.graph_height - int(1000 / FPS * self.scale)
+        if 0 <= budget_y < self.graph_height:
+            self.graph.set_at((x, budget_y), (255, 255, 255, 255))
+
+    def build_table(self):
+        stats = self.profiler.stats()
+        rows = [("system", "p50", "p95")]
+        for name, s in sorted(stats.items(), key=lambda item: -item[1]['p95']):
+            rows.append((name, f"{s['p50']:.2f}", f"{s['p95']:.2f}"))
+        if self.pool_stats:
+            rows.append(("pool", "made", "hit"))
+            for pool in self.pool_stats():
+                rows.append((f"{pool['name']} ({pool['free']} free)", str(pool['created']), f"{pool['hit_rate']:.0%}"))
+
+        line_height = self.font.get_linesize()
+        table = pygame.Surface((self.graph_width, line_height * len(rows) + 8), pygame.SRCALPHA)
+        table.fill((0, 0, 0, 170))
+        for i, (name, p50, p95) in enumerate(rows):
+            y = 4 + i * line_height
+            color = self.colors.get(name, (255, 255, 255))
+            table.blit(self.font.render(name, True, color), (6, y))
+            table.blit(self.font.render(p50, True, (255, 255, 255)), (self.graph_width - 100, y))
+            table.blit(self.font.render(p95, True, (255, 255, 255)), (self.graph_width - 50, y))
+        return table
+
+    def draw(self):
+        if not self.profiler.frame_times:
+            return
+        self.add_column()
+        if self.profiler.frame_count - self.table_frame >= FPS // 2:
+            self.table = self.build_table()
+            self.table_frame = self.profiler.frame_count
+
+        self.screen.blit(self.graph, (self.x, self.y))
+        self.screen.blit(self.table, (self.x, self.y + self.graph_height + 4))
+
+        status = "F4 trace: recording" if self.profiler.tracing else "F4 trace"
+        label = text_cache.render(self.font, status, True, (255, 255, 255))
+        self.screen.blit(label, (self.x, self.y + self.graph_height + self.table.get_height() + 8))
@@ -0,0 +1,39 @@
+# ui/text_cache.py
+from collections import OrderedDict
+
+from game.config import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces shared by every UI module"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()  # (font, text, antialias, color) -> Surface
+
+        # stats
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Same as font.render(), but only renders a given label once"""
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.misses += 1
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# shared cache used by the HUD and the menus
+text_cache = TextCache()
@@ -11,31 +11,52 @@ class WorldUI:
         self.camera = camera
         self.screen = screen
 
-        # fog setup
-        self.fog_surface = pygame.Surface(
-            screen.get_size(),
-            flags=pygame.SRCALPHA
-        )
+        # fog setup (surfaces are built lazily by build_fog)
+        self.fog_radius = FOG_RADIUS
+        self.visibility_radius = VISIBILITY_RADIUS
+        self.fog_alpha = FOG_ALPHA
+        self.fog_key = None
+        self.fog_surface = None
+        self.fog_mask = None
+        self.fog_hole = None  # screen rect the mask was last cut into
+
+        # sonar overlay, reused between frames
+        self.sonar_overlay = None
+        self.sonar_tint = None
+        self.sonar_dirty = []  # rects the last frame's rings were drawn into
 
     # ===== SONAR WAVES =====
     def draw_sonar_waves(self):
         if not self.player or not self.player.sonar_active:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = self.player.clock.get_ticks()
         elapsed = (current_time - self.player.sonar_start_time) / 1000.0
 
         if elapsed >= self.player.sonar_duration:
             return
 
-        player_pos = pygame.math.Vector2(self.player.rect.center) - self.camera.offset
+        player_pos = self.camera.draw_center(self.player) - self.camera.draw_offset
         screen_width, screen_height = self.screen.get_size()
 
         pulse_alpha = int(100 * (1 - (elapsed / self.player.sonar_duration)))
         pulse_alpha = max(0, min(100, pulse_alpha))
 
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((255, 255, 100, pulse_alpha))
+        overlay = self.sonar_overlay
+        if overlay is None or overlay.get_size() != (screen_width, screen_height):
+            overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+            self.sonar_overlay = overlay
+            self.sonar_tint = None
+
+        # repaint the tint everywhere only when it changed, otherwise just where rings were
+        tint = (255, 255, 100, pulse_alpha)
+        if tint != self.sonar_tint:
+            overlay.fill(tint)
+            self.sonar_tint = tint
+        else:
+            for rect in self.sonar_dirty:
+                overlay.fill(tint, rect)
+        self.sonar_dirty.clear()
 
         for i in range(3):
             wave_time = elapsed - (i * 0.5)
@@ -50,18 +71,41 @@ class WorldUI:
             wave_alpha = max(0, min(150, wave_alpha))
 
             if wave_alpha > 0:
-                pygame.draw.circle(
+                self.sonar_dirty.append(pygame.draw.circle(
                     overlay,
                     (255, 255, 200, wave_alpha),
                     (int(player_pos.x), int(player_pos.y)),
                     radius,
                     5
-                )
+                ))
 
         self.screen.blit(overlay, (0, 0))
 
 
     # ===== FOG EFFECTS =====
+    def build_fog(self):
+        """Pre-render the radial fog gradient once per fog config / screen size"""
+        radius = self.fog_radius
+        fog_color = (0, 0, 0, self.fog_alpha)
+
+        self.fog_surface = pygame.Surface(self.screen.get_size(), flags=pygame.SRCALPHA)
+        self.fog_surface.fill(fog_color)
+        self.fog_hole = None
+
+        # mask alpha is min()-blended into the fog, so outside the circle it stays at full fog
+        self.fog_mask = pygame.Surface((radius * 2, radius * 2), flags=pygame.SRCALPHA)
+        self.fog_mask.fill(fog_color)
+        center = (radius, radius)
+
+        for r in range(radius, self.visibility_radius, -6):
+            alpha = int(
+                self.fog_alpha * (r - self.visibility_radius)
+                / (radius - self.visibility_radius)
+            )
+            pygame.draw.circle(self.fog_mask, (0, 0, 0, alpha), center, r)
+
+        pygame.draw.circle(self.fog_mask, (0, 0, 0, 0), center, self.visibility_radius)
+
     def draw_fog(self):
         if not self.player:
             return
@@ -69,18 +113,26 @@ class WorldUI:
         if self.player.sonar_active:
             return
 
-        self.fog_surface.fill((0, 0, 0, FOG_ALPHA))
-        offset = self.camera.offset if self.camera else pygame.Vector2()
-        pos = self.player.rect.center - offset
-
-        for r in range(FOG_RADIUS, VISIBILITY_RADIUS, -6):
-            alpha = int(
-                FOG_ALPHA * (r - VISIBILITY_RADIUS)
-                / (FOG_RADIUS - VISIBILITY_RADIUS)
-            )
-            pygame.draw.circle(self.fog_surface, (0, 0, 0, alpha), pos, r)
-
-        pygame.draw.circle(self.fog_surface, (0, 0, 0, 0), pos, VISIBILITY_RADIUS)
+        key = (self.fog_radius, self.visibility_radius, self.fog_alpha, self.screen.get_size())
+        if key != self.fog_key:
+            self.build_fog()
+            self.fog_key = key
+
+        # undo last frame's hole, then cut the gradient in at the player's screen position
+        if self.fog_hole:
+            self.fog_surface.fill((0, 0, 0, self.fog_alpha), self.fog_hole)
+
+        if self.camera:
+            pos = self.camera.draw_center(self.player) - self.camera.draw_offset
+        else:
+            pos = pygame.Vector2(self.player.rect.center)
+        topleft = (int(pos.x) - self.fog_radius, int(pos.y) - self.fog_radius)
+
+        self.fog_hole = self.fog_surface.blit(
+            self.fog_mask,
+            topleft,
+            special_flags=pygame.BLEND_RGBA_MIN
+        )
         self.screen.blit(self.fog_surface, (0, 0))
 
     # ===== MONSTER HEALTH BARS =====
@@ -92,8 +144,9 @@ class WorldUI:
             if getattr(monster, "alpha", 255) <= 40:
                 continue
 
-            screen_x = monster.rect.centerx - self.camera.offset.x
-            screen_y = monster.rect.top - self.camera.offset.y - 10
+            x, y = self.camera.draw_position(monster)
+            screen_x = x + monster.rect.width // 2 - self.camera.draw_offset.x
+            screen_y = y - self.camera.draw_offset.y - 10
 
             bar_width = 40
             bar_height = 4